@@ -2,17 +2,28 @@ import warnings
 warnings.filterwarnings("ignore", message="Tried to instantiate class '__path__._path'")
 
 import streamlit as st
-from chatbot import EnhancedArticleSearcher
+from config import SEARCH_SERVICE_CONFIG
+from search_client import SearchClient
 import json
 
+# Résultats affichés par page (les suivantes sont servies depuis le cache du service)
+PAGE_SIZE = 5
+# Messages et requêtes conservés par session (les plus anciens sont oubliés)
+MAX_HISTORY_MESSAGES = 40
+MAX_HISTORY_QUERIES = 50
+
+# Fragment : un clic sur "Afficher plus" ne redessine que le message concerné
+fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None) or (lambda func: func)
+
 # Fonctions principales
 def display_article_results(search_result):
     """Affiche les résultats d'articles de manière claire et moderne"""
     results = search_result.get("results", [])
     search_info = search_result.get("search_info", {})
+    total = search_result.get("total", len(results))
     
     # Affichage du header de résultats
-    st.subheader(f"🔍 {len(results)} résultats pour : {search_info.get('keywords', 'votre recherche')}")
+    st.subheader(f"🔍 {total} résultats pour : {search_info.get('keywords', 'votre recherche')}")
     
     if not results:
         col1, col2 = st.columns([1, 4])
@@ -28,7 +39,7 @@ def display_article_results(search_result):
             """)
         return
 
-    for i, result in enumerate(results[:5], 1):
+    for i, result in enumerate(results, 1):
         article = result["article"]
         with st.expander(f"{i}. {article.get('title', 'Titre inconnu')}", expanded=False):
             # Section Auteurs
@@ -63,6 +74,147 @@ def display_article_results(search_result):
                 if article.get('url'):
                     cols[1].markdown(f"[Article]({article.get('url')})")
 
+def compact_response(response):
+    """
+    Version d'une réponse gardée dans l'historique de session : requête, filtres et
+    identifiants classés (avec leur pertinence), sans les articles eux-mêmes.
+    """
+    compact = {key: value for key, value in response.items() if key not in ("results", "articles")}
+    compact["ranked"] = [(r["article"].get("arxiv_id"), r.get("relevance", 0))
+                         for r in response.get("results", [])]
+    if "articles" in response:
+        compact["article_ids"] = [article.get("arxiv_id") for article in response["articles"]]
+    return compact
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def fetch_articles(article_ids):
+    """Articles d'une page de résultats, lus dans les métadonnées du service (cache partagé)."""
+    return chatbot.get_articles(list(article_ids))
+
+def resolve_results(compact):
+    """Reconstruit la liste de résultats d'un message compact pour l'affichage."""
+    ranked = compact.get("ranked", [])
+    articles = fetch_articles(tuple(article_id for article_id, _ in ranked)) if ranked else []
+    # Un article absent d'une nouvelle construction de l'index n'est plus affiché
+    results = [{"article": article, "relevance": relevance}
+               for article, (_, relevance) in zip(articles, ranked) if article is not None]
+    return dict(compact, results=results)
+
+def append_message(role, content):
+    """Ajoute un message au chat en gardant les MAX_HISTORY_MESSAGES derniers : la mémoire
+    d'une session ne grandit pas avec le nombre de requêtes. Les messages sont désignés
+    par leur position depuis le début de la session (message_offset = messages retirés)."""
+    messages = st.session_state.messages
+    messages.append({"role": role, "content": content})
+    trimmed = len(messages) - MAX_HISTORY_MESSAGES
+    if trimmed > 0:
+        del messages[:trimmed]
+        st.session_state.message_offset += trimmed
+
+def remember_query(query):
+    """Ajoute une requête à l'historique de la barre latérale (MAX_HISTORY_QUERIES dernières)."""
+    st.session_state.history.append(query)
+    del st.session_state.history[:-MAX_HISTORY_QUERIES]
+
+def session_message(position):
+    """Message à la position `position` de la session, ou None s'il a été retiré de l'historique."""
+    index = position - st.session_state.message_offset
+    if 0 <= index < len(st.session_state.messages):
+        return st.session_state.messages[index]
+    return None
+
+def load_more_results(position):
+    """Ajoute la page suivante aux résultats du message `position`."""
+    msg = session_message(position)
+    if msg is None:
+        return
+    response = msg["content"]
+    page = chatbot.search_page(response["query"], offset=response["next_offset"], limit=PAGE_SIZE,
+                               **response.get("filters", {}))
+    response["ranked"].extend(compact_response(page)["ranked"])
+    response["next_offset"] = page["next_offset"]
+
+def render_message(position):
+    """Affiche un message du chat (rien s'il a été retiré de l'historique)."""
+    msg = session_message(position)
+    if msg is None:
+        return
+    if msg["role"] == "user":
+        st.markdown(f'<div class="user-message">{msg["content"]}</div>', unsafe_allow_html=True)
+    elif isinstance(msg["content"], dict) and "ranked" in msg["content"]:
+        display_article_results(resolve_results(msg["content"]))
+        if msg["content"].get("next_offset") is not None:
+            st.button("⬇️ Afficher plus de résultats", key=f"more_{position}",
+                      on_click=load_more_results, args=(position,))
+    else:
+        st.markdown(f'<div class="bot-message">{msg["content"]}</div>', unsafe_allow_html=True)
+
+@fragment
+def display_message(position):
+    """Message de l'historique ; seul ce message est redessiné pour charger plus de résultats."""
+    render_message(position)
+
+SUGGESTION_ICONS = {"author": "👤", "category": "🏷️", "title": "📝"}
+
+def suggestion_query(completion):
+    """Requête proposée pour une suggestion choisie."""
+    if completion["type"] == "author":
+        return f"Articles de {completion['text']}"
+    return completion["text"]
+
+@fragment
+def suggestion_box():
+    """Suggestions pendant la saisie (auteurs, catégories, expressions fréquentes des titres)."""
+    prefix = st.text_input("✨ Suggestions", key="autocomplete_prefix",
+                           placeholder="Début d'un nom d'auteur, d'une catégorie ou d'un sujet")
+    if not prefix or chatbot is None:
+        return
+    try:
+        completions = chatbot.autocomplete(prefix, limit=6)
+    except Exception:
+        return
+    cols = st.columns(3)
+    for i, completion in enumerate(completions):
+        label = f"{SUGGESTION_ICONS.get(completion['type'], '')} {completion['text']} ({completion['count']})"
+        if cols[i % 3].button(label, key=f"complete_{i}", use_container_width=True):
+            st.session_state.selected_query = suggestion_query(completion)
+            st.rerun()
+
+def chat_history():
+    """Messages présents au dernier chargement complet de la page (hors de chat_composer :
+    l'envoi d'une question ne les redessine pas)."""
+    offset = st.session_state.message_offset
+    st.session_state.history_rendered = offset + len(st.session_state.messages)
+    for position in range(offset, st.session_state.history_rendered):
+        display_message(position)
+
+@fragment
+def chat_composer():
+    """Formulaire de recherche et messages envoyés depuis le dernier chargement complet.
+
+    L'envoi du formulaire ne relance que ce fragment : seuls les nouveaux messages
+    sont dessinés, sous l'historique affiché par chat_history. Ils sont dessinés
+    par render_message et non par le fragment display_message : pas de fragments
+    imbriqués.
+    """
+    new_messages = st.container()
+    with st.form("query_form", clear_on_submit=True):
+        query = st.text_input(
+            "Posez votre question sur les articles ou auteurs", 
+            value=st.session_state.selected_query or "",
+            placeholder="Ex: Articles de Hanqin Cai sur la matrix completion"
+        )
+        col1, col2, col3 = st.columns([2,1,1])
+        with col2:
+            submitted = st.form_submit_button("🔍 Rechercher")
+    
+    if submitted and query:
+        process_query(query)
+    with new_messages:
+        end = st.session_state.message_offset + len(st.session_state.messages)
+        for position in range(max(st.session_state.history_rendered, st.session_state.message_offset), end):
+            render_message(position)
+
 def process_query(query):
     """Traite une requête standard avec meilleure gestion des cas sans résultats"""
     # Nettoyage de la requête
@@ -70,8 +222,8 @@ def process_query(query):
                             if len(word) > 2 and any(c.isalpha() for c in word)])
     
     st.session_state.selected_query = None
-    st.session_state.messages.append({"role": "user", "content": query})
-    st.session_state.history.append(query)
+    append_message("user", query)
+    remember_query(query)
     
     with st.spinner("🔍 Analyse de votre requête en cours..."):
         try:
@@ -85,7 +237,9 @@ def process_query(query):
                     }
                 }
             else:
-                result = chatbot.search(cleaned_query, top_k=5)
+                result = chatbot.search_page(cleaned_query, limit=PAGE_SIZE)
+                result["query"] = cleaned_query
+                result["filters"] = {}
                 response = result if result.get("results") else {
                     "results": [],
                     "search_info": {
@@ -95,41 +249,38 @@ def process_query(query):
                     }
                 }
             
-            st.session_state.messages.append({"role": "assistant", "content": response})
-            st.rerun()
+            append_message("assistant", compact_response(response))
         except Exception as e:
             error_msg = f"❌ Erreur technique: {str(e)}"
-            st.session_state.messages.append({"role": "assistant", "content": error_msg})
-            st.rerun()
+            append_message("assistant", error_msg)
 
 def process_advanced_query(query):
     """Traite une requête avancée avec plus de détails"""
     st.session_state.selected_query = None
-    st.session_state.messages.append({"role": "user", "content": f"[Recherche avancée] {query}"})
-    st.session_state.history.append(query)
+    append_message("user", f"[Recherche avancée] {query}")
+    remember_query(query)
     
     with st.spinner("🔍 Recherche avancée en cours..."):
         try:
-            search_info = chatbot.detect_search_type(query)
+            # L'analyse de la requête est faite par le service, dans search_info
+            response = chatbot.search(query, top_k=5)
+            search_info = response['search_info']
             
             if search_info['type'] == 'author' and search_info['authors']:
                 author = search_info['authors'][0]
+                author_info = chatbot.author(author, limit=5)
                 response = {
                     "type": "author_stats",
                     "author": author,
-                    "articles": chatbot.get_articles_by_author(author)[:5],
-                    "stats": chatbot.get_author_stats(author),
+                    "articles": author_info['articles'],
+                    "stats": author_info['stats'],
                     "search_info": search_info
                 }
-            else:
-                response = chatbot.search(query, top_k=5)
             
-            st.session_state.messages.append({"role": "assistant", "content": response})
-            st.rerun()
+            append_message("assistant", compact_response(response))
         except Exception as e:
             error_msg = f"❌ Erreur lors de la recherche avancée: {str(e)}"
-            st.session_state.messages.append({"role": "assistant", "content": error_msg})
-            st.rerun()
+            append_message("assistant", error_msg)
 
 # Configuration de l'application
 st.set_page_config(
@@ -259,13 +410,16 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# Initialisation du chatbot
+# Initialisation du client du service de recherche (python search_service.py),
+# qui charge l'index et le modèle une seule fois pour tous les workers
 @st.cache_resource
 def load_chatbot():
     try:
-        return EnhancedArticleSearcher("arxiv_index.faiss", "arxiv_metadata.json")
+        client = SearchClient(SEARCH_SERVICE_CONFIG['url'], SEARCH_SERVICE_CONFIG['timeout'])
+        client.health()
+        return client
     except Exception as e:
-        st.error(f"Erreur de chargement : {e}")
+        st.error(f"Service de recherche indisponible : {e}")
         return None
 
 chatbot = load_chatbot()
@@ -277,6 +431,8 @@ if "history" not in st.session_state:
     st.session_state.history = []
 if "selected_query" not in st.session_state:
     st.session_state.selected_query = None
+if "message_offset" not in st.session_state:
+    st.session_state.message_offset = 0
 
 # Interface utilisateur
 with st.sidebar:
@@ -328,34 +484,16 @@ col1, col2, col3 = st.columns([1, 6, 1])
 with col2:
     st.markdown('<div class="chat-container">', unsafe_allow_html=True)
     
-    for msg in st.session_state.messages:
-        if msg["role"] == "user":
-            st.markdown(f'<div class="user-message">{msg["content"]}</div>', unsafe_allow_html=True)
-        else:
-            if isinstance(msg["content"], dict) and "results" in msg["content"]:
-                display_article_results(msg["content"])
-            else:
-                st.markdown(f'<div class="bot-message">{msg["content"]}</div>', unsafe_allow_html=True)
+    chat_history()
+    chat_composer()
     
     st.markdown('</div>', unsafe_allow_html=True)
 
-    # Formulaire de recherche
-    with st.form("query_form", clear_on_submit=True):
-        query = st.text_input(
-            "Posez votre question sur les articles ou auteurs", 
-            value=st.session_state.selected_query or "",
-            placeholder="Ex: Articles de Hanqin Cai sur la matrix completion"
-        )
-        col1, col2, col3 = st.columns([2,1,1])
-        with col2:
-            submitted = st.form_submit_button("🔍 Rechercher")
-        
-
-    if submitted and query:
-        process_query(query)
+    # Suggestions : un clic pré-remplit le formulaire (seule cette zone est redessinée à la saisie)
+    suggestion_box()
     
 
 # Point d'entrée principal
 if __name__ == "__main__":
     if chatbot is None:
-        st.error("Le chatbot n'a pas pu être chargé. Vérifiez les fichiers d'index.")
\ No newline at end of file
+        st.error("Le chatbot n'a pas pu être chargé. Lancez le service : python search_service.py")
\ No newline at end of file
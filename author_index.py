@@ -0,0 +1,161 @@
+import numpy as np
+from difflib import SequenceMatcher
+from collections import defaultdict
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from derived_maps import RaggedRows, SortedStringMap, pack_strings, unpack_strings
+
+
+def name_trigrams(name: str) -> set:
+    """Trigrammes de caractères d'un nom normalisé, bordés d'espaces."""
+    padded = f"  {name} "
+    return {padded[i:i+3] for i in range(len(padded) - 2)}
+
+
+class FuzzyAuthorIndex:
+    """
+    Index flou sur les noms d'auteurs normalisés.
+
+    Chaque trigramme de caractères pointe vers la liste des noms qui le contiennent.
+    Une requête additionne ces listes (np.bincount) pour obtenir le nombre de
+    trigrammes communs avec chaque nom, en déduit un indice de Jaccard, et ne
+    calcule le ratio SequenceMatcher que sur les meilleurs candidats.
+    Les listes de trigrammes ne sont construites qu'à la première requête floue,
+    sauf si elles sont fournies déjà calculées (from_arrays, tables en memory-map).
+    """
+
+    def __init__(self, names: Iterable[str], name_ids: Optional[Mapping[str, int]] = None,
+                 postings: Optional[Mapping[str, np.ndarray]] = None, sizes: Optional[np.ndarray] = None,
+                 last_names: Optional[Mapping[str, Sequence[int]]] = None):
+        if name_ids is None:
+            names = list(dict.fromkeys(n for n in names if n))
+            name_ids = {name: i for i, name in enumerate(names)}
+        self.names = names
+        self.name_ids = name_ids
+        self._postings = postings
+        self._sizes = sizes
+        self._last_names = last_names
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray], prefix: str = 'author') -> 'FuzzyAuthorIndex':
+        """
+        Index servi directement par les tableaux de pack_fuzzy_index (éventuellement
+        en memory-map) : noms, trigrammes et noms de famille sont cherchés par
+        dichotomie, sans dictionnaire ni liste Python de la taille du vocabulaire.
+        """
+        names = unpack_strings(arrays, f'{prefix}_names')
+        return cls(
+            names,
+            name_ids=SortedStringMap(names, arrays[f'{prefix}_name_order']),
+            postings=SortedStringMap(unpack_strings(arrays, f'{prefix}_trigrams'), None, RaggedRows(
+                arrays[f'{prefix}_trigram_offsets'], arrays[f'{prefix}_trigram_ids'])),
+            sizes=arrays[f'{prefix}_trigram_sizes'],
+            last_names=SortedStringMap(unpack_strings(arrays, f'{prefix}_last_names'), None, RaggedRows(
+                arrays[f'{prefix}_last_name_offsets'], arrays[f'{prefix}_last_name_ids'])),
+        )
+
+    def _build(self):
+        postings = defaultdict(list)
+        sizes = np.zeros(len(self.names), dtype=np.int32)
+        last_names = defaultdict(list)
+
+        for i, name in enumerate(self.names):
+            grams = name_trigrams(name)
+            sizes[i] = len(grams)
+            for gram in grams:
+                postings[gram].append(i)
+            last_names[name.split()[-1]].append(i)
+
+        self._postings = {gram: np.array(ids, dtype=np.int32) for gram, ids in postings.items()}
+        self._sizes = sizes
+        self._last_names = last_names
+
+    @property
+    def postings(self) -> Dict[str, np.ndarray]:
+        if self._postings is None:
+            self._build()
+        return self._postings
+
+    @property
+    def sizes(self) -> np.ndarray:
+        if self._sizes is None:
+            self._build()
+        return self._sizes
+
+    @property
+    def last_names(self) -> Dict[str, List[int]]:
+        if self._last_names is None:
+            self._build()
+        return self._last_names
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def candidates(self, query: str, limit: int = 50, min_jaccard: float = 0.2) -> List[Tuple[str, float]]:
+        """Retourne jusqu'à `limit` noms triés par indice de Jaccard sur les trigrammes."""
+        grams = name_trigrams(query)
+        postings = self.postings
+        lists = [ids for ids in (postings.get(g) for g in grams) if ids is not None]
+        if not lists:
+            return []
+
+        overlap = np.bincount(np.concatenate(lists), minlength=len(self.names))
+        ids = np.flatnonzero(overlap)
+        jaccard = overlap[ids] / (len(grams) + self.sizes[ids] - overlap[ids])
+        keep = jaccard >= min_jaccard
+        ids, jaccard = ids[keep], jaccard[keep]
+        if len(ids) > limit:
+            top = np.argpartition(-jaccard, limit)[:limit]
+            ids, jaccard = ids[top], jaccard[top]
+        order = np.argsort(-jaccard)
+        return [(self.names[i], float(jaccard[i_pos])) for i_pos, i in zip(order, ids[order])]
+
+    def similar(self, query: str, k: int = 5, min_score: float = 0.6,
+                candidate_limit: int = 50) -> List[Tuple[str, float]]:
+        """
+        Top-k des noms similaires au nom normalisé `query`.
+        Le score est le ratio SequenceMatcher, calculé uniquement sur les candidats
+        retenus par le préfiltre trigrammes.
+        """
+        scored = []
+        for name, _ in self.candidates(query, limit=candidate_limit):
+            score = SequenceMatcher(None, query, name).ratio()
+            if score >= min_score:
+                scored.append((name, score))
+        scored.sort(key=lambda x: x[1], reverse=True)
+        return scored[:k]
+
+    def same_last_name(self, query: str) -> List[str]:
+        """Noms partageant le nom de famille (dernier mot) de `query`."""
+        if not query:
+            return []
+        return [self.names[int(i)] for i in self.last_names.get(query.split()[-1], [])]
+
+
+def pack_fuzzy_index(names: List[str], prefix: str = 'author') -> Dict[str, np.ndarray]:
+    """
+    Tableaux de FuzzyAuthorIndex.from_arrays pour des noms normalisés uniques :
+    noms (pack_strings) et leur ordre trié, trigrammes triés avec leurs listes de
+    noms (CSR) et le nombre de trigrammes de chaque nom, noms de famille triés
+    avec leurs listes de noms (CSR).
+    """
+    index = FuzzyAuthorIndex(names)
+    if len(index) != len(names):
+        raise ValueError("Les noms doivent être uniques et non vides")
+    grams = sorted(index.postings)
+    last_names = sorted(index.last_names)
+    return {
+        **pack_strings(f'{prefix}_names', names),
+        f'{prefix}_name_order': np.array(sorted(range(len(names)), key=names.__getitem__), dtype=np.int64),
+        **pack_strings(f'{prefix}_trigrams', grams),
+        f'{prefix}_trigram_offsets': np.concatenate(
+            [[0], np.cumsum([len(index.postings[g]) for g in grams])]).astype(np.int64),
+        f'{prefix}_trigram_ids': np.concatenate(
+            [index.postings[g] for g in grams] or [np.zeros(0, dtype=np.int32)]).astype(np.int32),
+        f'{prefix}_trigram_sizes': index.sizes,
+        **pack_strings(f'{prefix}_last_names', last_names),
+        f'{prefix}_last_name_offsets': np.concatenate(
+            [[0], np.cumsum([len(index.last_names[n]) for n in last_names])]).astype(np.int64),
+        f'{prefix}_last_name_ids': np.array(
+            [i for n in last_names for i in index.last_names[n]], dtype=np.int32),
+    }
@@ -0,0 +1,96 @@
+import re
+from bisect import bisect_left
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from query_parser import fold
+
+WORD_PATTERN = re.compile(r"[a-z0-9]+(?:[-.][a-z0-9]+)*")
+
+# Mots qui ne commencent ni ne terminent un n-gramme de titre suggéré
+TITLE_STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'by', 'for', 'from', 'in', 'is', 'of', 'on',
+    'or', 'the', 'to', 'via', 'with', 'without', 'its', 'their', 'towards', 'toward',
+    'using', 'based', 'new', 'into', 'over', 'under', 'between', 'through',
+}
+
+# Bonus de classement quand le préfixe correspond au début de la suggestion
+# (et non à un mot interne, ex: "lecun" pour "yann lecun")
+LEADING_MATCH_BONUS = 1 << 30
+
+
+def frequent_title_ngrams(titles: Iterable[str], max_n: int = 3, min_count: int = 2,
+                          limit: int = 20000) -> List[Tuple[str, int]]:
+    """N-grammes (1 à max_n mots) les plus fréquents des titres, bornés par des mots pleins."""
+    counts = Counter()
+    for title in titles:
+        words = WORD_PATTERN.findall(fold(title or ''))
+        seen = set()
+        for n in range(1, max_n + 1):
+            for i in range(len(words) - n + 1):
+                gram = words[i:i + n]
+                if gram[0] in TITLE_STOPWORDS or gram[-1] in TITLE_STOPWORDS or len(gram[0]) < 3:
+                    continue
+                seen.add(' '.join(gram))
+        # Un n-gramme compte une fois par titre
+        counts.update(seen)
+    return [(gram, count) for gram, count in counts.most_common(limit) if count >= min_count]
+
+
+class PrefixIndex:
+    """
+    Complétion par préfixe sur un tableau trié (bisect).
+
+    Chaque suggestion est indexée par sa forme normalisée et par chacun de ses
+    suffixes commençant à un mot ("yann lecun" et "lecun"). Une requête est une
+    plage [préfixe, préfixe + U+FFFF) du tableau trié, trouvée par deux bisect ;
+    les candidats de la plage sont classés par poids (nombre d'articles), les
+    correspondances en début de suggestion d'abord.
+    """
+
+    def __init__(self, entries: Sequence[Tuple[str, str, str, int]]):
+        """entries : (texte affiché, forme normalisée, type, poids)."""
+        self.texts = [text for text, _, _, _ in entries]
+        self.kinds = np.array([kind for _, _, kind, _ in entries], dtype=object)
+        self.weights = np.array([weight for _, _, _, weight in entries], dtype=np.int64)
+
+        keys = []
+        for entry_id, (_, key, _, _) in enumerate(entries):
+            for start in [0] + [m.end() for m in re.finditer(' ', key)]:
+                keys.append((key[start:], entry_id, start == 0))
+        keys.sort()
+        self.keys = [key for key, _, _ in keys]
+        self.entry_ids = np.array([entry_id for _, entry_id, _ in keys], dtype=np.int64)
+        self.leading = np.array([leading for _, _, leading in keys], dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def complete(self, prefix: str, limit: int = 10, kinds: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """Suggestions pour un préfixe (normalisé ici), les plus fréquentes d'abord."""
+        prefix = ' '.join(fold(prefix).split())
+        if not prefix or limit <= 0:
+            return []
+        lo = bisect_left(self.keys, prefix)
+        hi = bisect_left(self.keys, prefix + '\uffff', lo)
+        if lo == hi:
+            return []
+
+        ids = self.entry_ids[lo:hi]
+        scores = self.weights[ids] + self.leading[lo:hi] * LEADING_MATCH_BONUS
+        if kinds is not None:
+            keep = np.isin(self.kinds[ids], list(kinds))
+            ids, scores = ids[keep], scores[keep]
+        # Une suggestion trouvée par plusieurs de ses mots ne garde que son meilleur score
+        order = np.lexsort((-scores, ids))
+        ids, scores = ids[order], scores[order]
+        first = np.concatenate([[True], ids[1:] != ids[:-1]]) if len(ids) else np.zeros(0, dtype=bool)
+        ids, scores = ids[first], scores[first]
+
+        k = min(limit, len(ids))
+        top = np.argpartition(-scores, k - 1)[:k] if 0 < k < len(ids) else np.arange(k)
+        top = top[np.lexsort((ids[top], -scores[top]))]
+        return [{'text': self.texts[ids[i]], 'type': self.kinds[ids[i]], 'count': int(self.weights[ids[i]])}
+                for i in top]
@@ -0,0 +1,154 @@
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, InvalidStateError
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+
+def _freeze(value):
+    """Version hashable d'une option (listes et dicts)."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+class MicroBatchScheduler:
+    """
+    Regroupe les recherches concurrentes en micro-lots devant un EnhancedArticleSearcher.
+
+    Les appelants (threads, sessions Streamlit, service HTTP) déposent leur requête
+    et reçoivent un Future. Un thread unique collecte les requêtes arrivées pendant
+    max_wait secondes après la première, ou jusqu'à max_batch_size, puis exécute
+    un search_many par groupe d'options identiques : une vectorisation et une
+    recherche FAISS pour tout le lot. Les latences (dépôt -> résultat) des
+    dernières requêtes sont gardées pour les percentiles.
+    """
+
+    def __init__(self, searcher, max_batch_size: int = 32, max_wait: float = 0.005,
+                 latency_window: int = 10000):
+        self.searcher = searcher
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._queue = queue.Queue()
+        self._latencies = deque(maxlen=latency_window)
+        self._lock = threading.Lock()
+        self.batches = 0
+        self.queries = 0
+        self.busy_time = 0.0
+        self.started_at = time.perf_counter()
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, name='micro-batch-scheduler', daemon=True)
+        self._worker.start()
+
+    def submit(self, query: str, **options) -> Future:
+        """Dépose une requête ; le Future reçoit le résultat de search_many pour elle."""
+        if self._closed:
+            raise RuntimeError("Planificateur arrêté")
+        future = Future()
+        self._queue.put((query, options, future, time.perf_counter()))
+        return future
+
+    def search(self, query: str, timeout: Optional[float] = None, **options) -> Dict[str, Any]:
+        """Équivalent bloquant de searcher.search, exécuté dans un micro-lot."""
+        return self.submit(query, **options).result(timeout)
+
+    def search_many(self, queries: List[str], timeout: Optional[float] = None, **options) -> List[Dict[str, Any]]:
+        futures = [self.submit(query, **options) for query in queries]
+        return [future.result(timeout) for future in futures]
+
+    def _collect(self) -> List[tuple]:
+        """Attend une requête puis complète le lot jusqu'à max_batch_size ou max_wait."""
+        batch = [self._queue.get()]
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            closing = any(item is None for item in batch)
+            batch = [item for item in batch if item is not None]
+            try:
+                self._execute(batch)
+            except Exception as e:
+                # Une erreur inattendue ne fait échouer que les requêtes de ce lot, pas le thread
+                self._fail(batch, e)
+            if closing:
+                return
+
+    @staticmethod
+    def _fail(items: List[tuple], error: Exception):
+        for _, _, future, _ in items:
+            try:
+                future.set_exception(error)
+            except InvalidStateError:
+                # Future déjà résolu ou annulé par l'appelant
+                pass
+
+    def _execute(self, batch: List[tuple]):
+        groups = {}
+        for item in batch:
+            # Les requêtes annulées par l'appelant (timeout...) ne sont pas exécutées ;
+            # les autres passent à l'état 'running' et ne peuvent plus être annulées
+            if item[2].set_running_or_notify_cancel():
+                groups.setdefault(_freeze(item[1]), []).append(item)
+
+        for items in groups.values():
+            start = time.perf_counter()
+            try:
+                results = self.searcher.search_many([query for query, _, _, _ in items], **items[0][1])
+            except Exception as e:
+                self._fail(items, e)
+                continue
+            done = time.perf_counter()
+            with self._lock:
+                self.batches += 1
+                self.queries += len(items)
+                self.busy_time += done - start
+                self._latencies.extend(done - submitted for _, _, _, submitted in items)
+            for (_, _, future, _), result in zip(items, results):
+                future.set_result(result)
+
+    def close(self):
+        """Traite les requêtes en attente puis arrête le thread."""
+        if not self._closed:
+            self._closed = True
+            self._queue.put(None)
+            self._worker.join()
+
+    def reset_stats(self):
+        with self._lock:
+            self.batches = 0
+            self.queries = 0
+            self.busy_time = 0.0
+            self._latencies.clear()
+            self.started_at = time.perf_counter()
+
+    def stats(self) -> Dict[str, Any]:
+        """Débit, taille moyenne des lots et percentiles de latence (ms)."""
+        with self._lock:
+            latencies = np.array(self._latencies) * 1000
+            elapsed = time.perf_counter() - self.started_at
+            stats = {
+                'batches': self.batches,
+                'queries': self.queries,
+                'mean_batch_size': self.queries / self.batches if self.batches else 0.0,
+                'throughput': self.queries / elapsed if elapsed > 0 else 0.0,
+                'utilization': self.busy_time / elapsed if elapsed > 0 else 0.0,
+                'max_batch_size': self.max_batch_size,
+                'max_wait_ms': self.max_wait * 1000,
+            }
+        for name, q in (('p50_ms', 50), ('p95_ms', 95), ('p99_ms', 99)):
+            stats[name] = float(np.percentile(latencies, q)) if len(latencies) else 0.0
+        return stats
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark de la recherche d'auteurs similaires sur le vrai jeu d'auteurs.
+
+Compare le parcours SequenceMatcher de tous les auteurs (ancienne méthode de
+_suggest_similar_authors) à l'index flou par trigrammes (author_index.py), sur
+des noms bruités (fautes de frappe) tirés des métadonnées.
+
+Exemple :
+    python benchmark_author_matching.py --index arxiv_index.faiss --queries 50
+"""
+
+import argparse
+import json
+import random
+import time
+import unicodedata
+from difflib import SequenceMatcher
+
+from author_index import FuzzyAuthorIndex
+from semantic_indexer import load_manifest, manifest_files
+
+
+def normalize_text(text):
+    text = unicodedata.normalize('NFKD', text)
+    text = ''.join(c for c in text if not unicodedata.combining(c))
+    return text.lower().strip()
+
+
+def add_typo(name, rng):
+    """Supprime, double ou remplace une lettre au hasard."""
+    pos = rng.randrange(len(name))
+    op = rng.choice(['delete', 'double', 'replace'])
+    if op == 'delete':
+        return name[:pos] + name[pos + 1:]
+    if op == 'double':
+        return name[:pos] + name[pos] + name[pos:]
+    return name[:pos] + rng.choice('abcdefghijklmnopqrstuvwxyz') + name[pos + 1:]
+
+
+def linear_scan(query, names, k=5, min_score=0.6):
+    scored = [(name, SequenceMatcher(None, query, name).ratio()) for name in names]
+    scored = [x for x in scored if x[1] >= min_score]
+    scored.sort(key=lambda x: x[1], reverse=True)
+    return scored[:k]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark des suggestions d'auteurs")
+    parser.add_argument('--index', default='arxiv_index.faiss', help="Index dont le manifeste désigne les métadonnées")
+    parser.add_argument('--metadata', default='arxiv_metadata.json', help="Métadonnées d'un index sans manifeste")
+    parser.add_argument('--queries', type=int, default=50)
+    parser.add_argument('--k', type=int, default=5)
+    args = parser.parse_args()
+
+    metadata_path = manifest_files(args.index, args.metadata, load_manifest(args.index))['metadata']
+    with open(metadata_path, 'r', encoding='utf-8') as f:
+        metadata = json.load(f)
+    names = sorted({normalize_text(a['name']) for article in metadata
+                    for a in article.get('authors', []) if a.get('name', '').strip()})
+    print(f"{len(names)} auteurs uniques")
+
+    start = time.perf_counter()
+    index = FuzzyAuthorIndex(names)
+    print(f"Construction de l'index flou: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    rng = random.Random(0)
+    truths = rng.sample(names, min(args.queries, len(names)))
+    queries = [add_typo(name, rng) for name in truths]
+
+    timings = {'scan': 0.0, 'index': 0.0}
+    found = {'scan': 0, 'index': 0}
+    agreement = 0
+    for truth, query in zip(truths, queries):
+        start = time.perf_counter()
+        expected = linear_scan(query, names, args.k)
+        timings['scan'] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        got = index.similar(query, k=args.k)
+        timings['index'] += time.perf_counter() - start
+
+        found['scan'] += truth in [n for n, _ in expected]
+        found['index'] += truth in [n for n, _ in got]
+        agreement += bool(expected) and bool(got) and expected[0][0] == got[0][0]
+
+    n = len(queries)
+    print(f"\n{'méthode':<8} {'ms/requête':>11} {f'vrai nom dans top-{args.k}':>22}")
+    for method in ('scan', 'index'):
+        print(f"{method:<8} {timings[method] * 1000 / n:>11.2f} {found[method] / n:>22.2%}")
+    print(f"\nAccélération: x{timings['scan'] / max(timings['index'], 1e-9):.0f}, "
+          f"même top-1 que le parcours complet: {agreement / n:.2%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark du regroupement des recherches en micro-lots (batch_scheduler.py).
+
+Des threads clients envoient des requêtes en parallèle, soit directement au
+moteur (une vectorisation et une recherche FAISS par requête, appels
+sérialisés), soit via MicroBatchScheduler pour chaque combinaison taille de
+lot / fenêtre d'attente. Les caches sont désactivés pour mesurer le vrai coût.
+
+Exemple :
+    python benchmark_batching.py --clients 32 --requests 2000
+    python benchmark_batching.py --batch-sizes 8 32 64 --waits-ms 1 5 10
+"""
+
+import argparse
+import threading
+import time
+
+import numpy as np
+
+from batch_scheduler import MicroBatchScheduler
+from benchmark_query_parsing import SAMPLE_QUERIES
+from chatbot import EnhancedArticleSearcher
+
+
+def run_clients(search, queries, clients):
+    """Exécute les requêtes depuis `clients` threads ; retourne (durée, latences en ms)."""
+    latencies = []
+    lock = threading.Lock()
+    chunks = [queries[i::clients] for i in range(clients)]
+
+    def worker(chunk):
+        local = []
+        for query in chunk:
+            start = time.perf_counter()
+            search(query)
+            local.append((time.perf_counter() - start) * 1000)
+        with lock:
+            latencies.extend(local)
+
+    threads = [threading.Thread(target=worker, args=(chunk,)) for chunk in chunks]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start, np.array(latencies)
+
+
+def report(label, elapsed, latencies):
+    print(f"{label:<22} {len(latencies) / elapsed:>10.0f} {np.percentile(latencies, 50):>9.1f} "
+          f"{np.percentile(latencies, 99):>9.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark des micro-lots de recherche")
+    parser.add_argument('--index', default='arxiv_index.faiss')
+    parser.add_argument('--metadata', default='arxiv_metadata.json')
+    parser.add_argument('--clients', type=int, default=32, help="Threads clients concurrents")
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--top-k', type=int, default=10)
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[8, 32, 64])
+    parser.add_argument('--waits-ms', type=float, nargs='+', default=[1.0, 5.0])
+    args = parser.parse_args()
+
+    searcher = EnhancedArticleSearcher(args.index, args.metadata, cache_size=0, lazy=False)
+    # Requêtes toutes distinctes pour ne pas profiter d'un cache
+    queries = [f"{SAMPLE_QUERIES[i % len(SAMPLE_QUERIES)]} {i}" for i in range(args.requests)]
+
+    print(f"\n{args.clients} clients, {args.requests} requêtes, top_k={args.top_k}")
+    print(f"{'mode':<22} {'req/s':>10} {'p50 ms':>9} {'p99 ms':>9}")
+
+    lock = threading.Lock()
+
+    def direct(query):
+        with lock:
+            return searcher.search(query, top_k=args.top_k)
+
+    report('direct (lot de 1)', *run_clients(direct, queries, args.clients))
+
+    for batch_size in args.batch_sizes:
+        for wait_ms in args.waits_ms:
+            scheduler = MicroBatchScheduler(searcher, batch_size, wait_ms / 1000)
+            elapsed, latencies = run_clients(lambda q: scheduler.search(q, top_k=args.top_k),
+                                             queries, args.clients)
+            stats = scheduler.stats()
+            scheduler.close()
+            report(f"lot {batch_size}, {wait_ms:g} ms (~{stats['mean_batch_size']:.0f})", elapsed, latencies)
+
+
+if __name__ == "__main__":
+    main()
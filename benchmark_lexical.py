@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark de latence de l'index lexical BM25 (BM25Index.search).
+
+Mesure un index existant (--index arxiv_index.<build_id>.bm25.npz) ou, par défaut,
+un index synthétique d'un million de documents : vocabulaire à fréquences de Zipf,
+postings générés directement en tableaux (sans tokenisation du corpus).
+Chaque requête est mesurée sans filtre puis avec un masque (filtre année/catégorie).
+
+Exemple :
+    python benchmark_lexical.py
+    python benchmark_lexical.py --docs 200000 --repeat 50
+    python benchmark_lexical.py --index arxiv_index.<build_id>.bm25.npz
+"""
+
+import argparse
+import statistics
+import time
+
+import numpy as np
+
+from bm25_index import BM25Index
+
+
+def synthetic_index(num_docs, vocabulary_size, terms_per_doc, seed=0):
+    """Index BM25 synthétique : le terme de rang r apparaît dans ~num_docs / r^1.1 documents."""
+    rng = np.random.default_rng(seed)
+    ranks = np.arange(1, vocabulary_size + 1)
+    dfs = num_docs / ranks ** 1.1
+    dfs = np.maximum(1, (dfs * num_docs * terms_per_doc / dfs.sum())).astype(np.int64)
+    dfs = np.minimum(dfs, num_docs)
+
+    doc_ids, offsets = [], [0]
+    for df in dfs:
+        docs = np.unique(rng.integers(0, num_docs, df, dtype=np.int32))
+        doc_ids.append(docs)
+        offsets.append(offsets[-1] + len(docs))
+    doc_ids = np.concatenate(doc_ids)
+    tfs = rng.geometric(0.6, len(doc_ids)).astype(np.uint16)
+    doc_lengths = np.bincount(doc_ids, weights=tfs, minlength=num_docs).astype(np.int32)
+    return BM25Index(terms=[f"t{i}" for i in range(vocabulary_size)], offsets=np.array(offsets, dtype=np.int64),
+                     doc_ids=doc_ids, tfs=tfs, doc_lengths=doc_lengths)
+
+
+def sample_queries(index, count, seed=1):
+    """Requêtes de 2 à 4 termes : un terme fréquent (top 1%) et des termes plus rares."""
+    rng = np.random.default_rng(seed)
+    frequent = max(1, len(index.terms) // 100)
+    queries = []
+    for _ in range(count):
+        terms = [index.terms[rng.integers(0, frequent)]]
+        terms += [index.terms[i] for i in rng.integers(frequent, len(index.terms), rng.integers(1, 4))]
+        queries.append(' '.join(terms))
+    return queries
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def measure(index, queries, repeat, top_k, mask=None):
+    for query in queries:
+        index.search(query, top_k, mask)
+    timings = []
+    for _ in range(repeat):
+        for query in queries:
+            start = time.perf_counter()
+            index.search(query, top_k, mask)
+            timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de latence de l'index lexical BM25")
+    parser.add_argument('--index', default=None, help="Index BM25 (.bm25.npz) ; sinon index synthétique")
+    parser.add_argument('--docs', type=int, default=1_000_000, help="Documents de l'index synthétique")
+    parser.add_argument('--vocabulary', type=int, default=100_000, help="Termes de l'index synthétique")
+    parser.add_argument('--terms-per-doc', type=int, default=40, help="Termes distincts moyens par document")
+    parser.add_argument('--queries', type=int, default=50, help="Nombre de requêtes")
+    parser.add_argument('--repeat', type=int, default=20, help="Nombre de passes sur les requêtes")
+    parser.add_argument('--top-k', type=int, default=100, help="Taille du pool lexical (top_k)")
+    parser.add_argument('--mask-ratio', type=float, default=0.2, help="Part des documents gardée par le masque")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.index:
+        index = BM25Index.load(args.index)
+    else:
+        index = synthetic_index(args.docs, args.vocabulary, args.terms_per_doc)
+    print(f"Index: {len(index):,} documents, {len(index.terms):,} termes, {len(index.doc_ids):,} postings "
+          f"({time.perf_counter() - start:.1f} s)")
+
+    queries = sample_queries(index, args.queries)
+    mask = np.random.default_rng(2).random(len(index)) < args.mask_ratio
+    for label, row_mask in (("sans filtre", None), (f"masque {args.mask_ratio:.0%}", mask)):
+        timings = measure(index, queries, args.repeat, args.top_k, row_mask)
+        print(f"{label}: {len(queries)} requêtes x {args.repeat} passes")
+        print(f"   moyenne: {statistics.mean(timings):.2f} ms")
+        print(f"   p50:     {percentile(timings, 0.50):.2f} ms")
+        print(f"   p95:     {percentile(timings, 0.95):.2f} ms")
+        print(f"   p99:     {percentile(timings, 0.99):.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
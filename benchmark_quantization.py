@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark des types de stockage de l'index FAISS (flat / fp16 / sq8).
+
+Mesure, pour un même jeu de vecteurs : la taille mémoire de l'index, le temps de
+construction, la latence de recherche et le rappel@k par rapport à l'index
+float32 exact.
+
+Exemple :
+    python benchmark_quantization.py --json-path data/extraction_results.json --queries 200
+"""
+
+import argparse
+import time
+
+import faiss
+import numpy as np
+
+from semantic_indexer import SemanticIndexer, INDEX_TYPES, new_index, add_to_index, iter_articles
+
+
+def recall_at_k(reference, candidate):
+    """Fraction des k voisins exacts retrouvés par l'index approché."""
+    hits = sum(len(set(ref) & set(cand)) for ref, cand in zip(reference, candidate))
+    return hits / reference.size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark mémoire / temps / rappel des index quantifiés")
+    parser.add_argument('--json-path', required=True, help="Fichier d'extraction (.json ou .jsonl)")
+    parser.add_argument('--limit', type=int, default=None, help="Nombre maximal d'articles")
+    parser.add_argument('--queries', type=int, default=100, help="Nombre de requêtes échantillonnées")
+    parser.add_argument('--top-k', type=int, default=10)
+    args = parser.parse_args()
+
+    abstracts = []
+    titles = []
+    for article in iter_articles(args.json_path):
+        abstracts.append(article['abstract'])
+        titles.append(article.get('title') or article['abstract'][:100])
+        if args.limit and len(abstracts) >= args.limit:
+            break
+
+    indexer = SemanticIndexer()
+    print(f"Vectorisation de {len(abstracts)} résumés...")
+    embeddings = np.asarray(indexer.model.encode(abstracts, show_progress_bar=True), dtype='float32')
+    rng = np.random.default_rng(0)
+    sample = rng.choice(len(titles), size=min(args.queries, len(titles)), replace=False)
+    queries = np.asarray(indexer.model.encode([titles[i] for i in sample]), dtype='float32')
+
+    dim = embeddings.shape[1]
+    reference = None
+    print(f"\n{'type':<6} {'taille (Mo)':>12} {'octets/article':>15} {'build (s)':>10} "
+          f"{'recherche (ms)':>15} {f'rappel@{args.top_k}':>10}")
+    for index_type in INDEX_TYPES:
+        start = time.perf_counter()
+        index = new_index(dim, index_type)
+        add_to_index(index, embeddings)
+        build_time = time.perf_counter() - start
+
+        size = faiss.serialize_index(index).nbytes
+
+        start = time.perf_counter()
+        _, indices = index.search(queries, args.top_k)
+        search_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+        if reference is None:
+            reference = indices
+        recall = recall_at_k(reference, indices)
+        print(f"{index_type:<6} {size / 1e6:>12.2f} {size / len(embeddings):>15.0f} {build_time:>10.3f} "
+              f"{search_ms:>15.3f} {recall:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark de latence de l'analyse des requêtes (QueryParser).
+
+Utilise un corpus de requêtes réalistes (exemples de l'interface, requêtes par
+auteur, par sujet, avec filtres année) ou un fichier d'une requête par ligne.
+
+Exemple :
+    python benchmark_query_parsing.py --repeat 2000
+    python benchmark_query_parsing.py --queries-file logs/queries.txt
+"""
+
+import argparse
+import statistics
+import time
+
+from query_parser import QueryParser
+
+SAMPLE_QUERIES = [
+    "Articles de Yann LeCun sur le deep learning",
+    "Recherches récentes sur les transformers",
+    "Publications de Geoffrey Hinton en 2020-2023",
+    "Papers sur la computer vision avec correspondance auteur",
+    "Articles de Hanqin Cai sur la matrix completion",
+    "machine learning",
+    "neural networks",
+    "deep learning par LeCun",
+    "transformers 2018-2020",
+    "transformers par Vaswani 2017",
+    "computer vision articles de LeCun 2010-2020",
+    "publications par J. Smith",
+    "papers by Bengio et al. on attention",
+    "gan 2018 - 2020",
+    "travaux d'Andrew Ng sur l'apprentissage profond",
+    "written by Fei-Fei Li",
+    "l'intelligence artificielle",
+    "reinforcement learning for robotics",
+    "graph neural networks for molecules 2021",
+    "self-supervised learning de Yann LeCun et Ishan Misra",
+    "BERT ResNet-50 fine-tuning",
+    "works of Yoshua Bengio",
+    "études de Marie Curie",
+    "diffusion models image generation 2022-2024",
+]
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de latence de l'analyse des requêtes")
+    parser.add_argument('--queries-file', default=None, help="Fichier d'une requête par ligne")
+    parser.add_argument('--repeat', type=int, default=1000, help="Nombre de passes sur le corpus")
+    args = parser.parse_args()
+
+    queries = SAMPLE_QUERIES
+    if args.queries_file:
+        with open(args.queries_file, 'r', encoding='utf-8') as f:
+            queries = [line.strip() for line in f if line.strip()]
+
+    query_parser = QueryParser()
+    for query in queries:
+        query_parser.parse(query)
+
+    timings = []
+    for _ in range(args.repeat):
+        for query in queries:
+            start = time.perf_counter()
+            query_parser.parse(query)
+            timings.append((time.perf_counter() - start) * 1e6)
+
+    print(f"{len(queries)} requêtes x {args.repeat} passes")
+    print(f"   moyenne: {statistics.mean(timings):.1f} µs")
+    print(f"   p50:     {percentile(timings, 0.50):.1f} µs")
+    print(f"   p95:     {percentile(timings, 0.95):.1f} µs")
+    print(f"   p99:     {percentile(timings, 0.99):.1f} µs")
+    print(f"   débit:   {len(timings) / (sum(timings) / 1e6):,.0f} requêtes/s")
+
+
+if __name__ == "__main__":
+    main()
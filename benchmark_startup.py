@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark du démarrage à froid du moteur de recherche.
+
+Mesure l'import de chatbot.py, la construction d'EnhancedArticleSearcher
+(temps avant le premier affichage de l'interface) et la première recherche,
+qui déclenche le chargement différé de l'index et du modèle. Chaque mesure
+est faite dans un nouveau processus pour ne pas profiter des imports déjà faits.
+
+La mémoire résidente (Linux) est relevée après chaque étape, en séparant la
+mémoire privée du processus (RssAnon) des pages de fichiers partagées entre
+processus (RssFile, tables en memory-map avec --mmap). Avec --mmap, les noms,
+graphies, catégories et l'index flou des auteurs sont lus dans les tables
+dérivées ; restent en mémoire privée le modèle, les n-grammes de titres
+(bornés) et l'index de complétion, construit à la première complétion.
+
+Exemple :
+    python benchmark_startup.py --runs 3
+    python benchmark_startup.py --eager   # tout charger dans le constructeur
+    python benchmark_startup.py --mmap    # tables et métadonnées en memory-map
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+CHILD = """
+import json, time
+
+def rss():
+    try:
+        with open('/proc/self/status') as f:
+            fields = dict(line.split(':', 1) for line in f)
+        return {{key: int(fields[key].split()[0]) / 1024 for key in ('RssAnon', 'RssFile')}}
+    except (OSError, KeyError, ValueError):
+        return {{}}
+
+start = time.perf_counter()
+from chatbot import EnhancedArticleSearcher
+imported = time.perf_counter()
+memory = {{'import': rss()}}
+searcher = EnhancedArticleSearcher({index!r}, {metadata!r}, lazy={lazy}, mmap={mmap})
+ready = time.perf_counter()
+memory['init'] = rss()
+searcher.search({query!r}, top_k=5)
+searched = time.perf_counter()
+memory['first_search'] = rss()
+searcher.autocomplete({query!r}[:3])
+memory['autocomplete'] = rss()
+print(json.dumps({{'import': imported - start, 'init': ready - imported,
+                  'first_search': searched - ready, 'stages': searcher.startup_times, 'memory': memory}}))
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark du démarrage à froid")
+    parser.add_argument('--index', default='arxiv_index.faiss')
+    parser.add_argument('--metadata', default='arxiv_metadata.json')
+    parser.add_argument('--query', default='deep learning for computer vision')
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--eager', action='store_true', help="Désactive le chargement différé")
+    parser.add_argument('--mmap', action='store_true', help="Index, métadonnées et tables en memory-map")
+    args = parser.parse_args()
+
+    code = CHILD.format(index=args.index, metadata=args.metadata, lazy=not args.eager, mmap=args.mmap,
+                        query=args.query)
+    runs = []
+    for _ in range(args.runs):
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+        runs.append(json.loads(output.strip().splitlines()[-1]))
+
+    print(f"{args.runs} démarrages ({'eager' if args.eager else 'lazy'}), médianes :")
+    for key in ('import', 'init', 'first_search'):
+        print(f"   {key:<14} {statistics.median(r[key] for r in runs) * 1000:>9.0f} ms")
+    print(f"   {'premier rendu':<14} {statistics.median(r['import'] + r['init'] for r in runs) * 1000:>9.0f} ms")
+    print("\nÉtapes de chargement :")
+    for stage in runs[-1]['stages']:
+        print(f"   {stage:<14} {statistics.median(r['stages'].get(stage, 0.0) for r in runs) * 1000:>9.0f} ms")
+    if runs[-1]['memory']['init']:
+        print("\nMémoire résidente après chaque étape (privée / fichiers partagés) :")
+        for step in ('import', 'init', 'first_search', 'autocomplete'):
+            private = statistics.median(r['memory'][step]['RssAnon'] for r in runs)
+            shared = statistics.median(r['memory'][step]['RssFile'] for r in runs)
+            print(f"   {step:<14} {private:>7.0f} Mo / {shared:>7.0f} Mo")
+
+
+if __name__ == "__main__":
+    main()
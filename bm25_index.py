@@ -0,0 +1,158 @@
+import math
+import re
+import unicodedata
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Garde les termes composés ("resnet-50", "gpt-3.5") en plus de leurs parties
+TERM_PATTERN = re.compile(r"[a-z0-9]+(?:[-.][a-z0-9]+)*")
+
+
+def tokenize(text: str) -> List[str]:
+    """Termes d'un texte : minuscules sans accents, composés conservés et découpés."""
+    if not text:
+        return []
+    text = unicodedata.normalize('NFKD', text)
+    text = ''.join(c for c in text if not unicodedata.combining(c)).lower()
+    terms = []
+    for term in TERM_PATTERN.findall(text):
+        terms.append(term)
+        if '-' in term or '.' in term:
+            terms.extend(part for part in re.split(r"[-.]", term) if part)
+    return terms
+
+
+def document_text(article: Dict) -> str:
+    return f"{article.get('title') or ''} {article.get('abstract') or ''}"
+
+
+def reciprocal_rank_fusion(rankings: Sequence[Sequence[int]], k: int = 60) -> List[Tuple[int, float]]:
+    """Fusionne des classements (listes de positions) : score = somme des 1 / (k + rang)."""
+    scores = {}
+    for ranking in rankings:
+        for rank, position in enumerate(ranking, 1):
+            scores[int(position)] = scores.get(int(position), 0.0) + 1.0 / (k + rank)
+    return sorted(scores.items(), key=lambda x: x[1], reverse=True)
+
+
+class BM25Builder:
+    """Construit l'index BM25 de façon incrémentale (compatible avec l'indexation par blocs)."""
+
+    def __init__(self):
+        self.vocabulary = {}
+        self.doc_lengths = []
+        self._term_ids = []
+        self._doc_ids = []
+        self._tfs = []
+
+    def add_documents(self, articles: Iterable[Dict]):
+        for article in articles:
+            doc_id = len(self.doc_lengths)
+            terms = tokenize(document_text(article))
+            self.doc_lengths.append(len(terms))
+            for term, tf in Counter(terms).items():
+                term_id = self.vocabulary.setdefault(term, len(self.vocabulary))
+                self._term_ids.append(term_id)
+                self._doc_ids.append(doc_id)
+                self._tfs.append(min(tf, 65535))
+
+    def build(self, k1: float = 1.5, b: float = 0.75) -> 'BM25Index':
+        """Trie les triplets (terme, document, tf) en listes de postings contiguës."""
+        term_ids = np.array(self._term_ids, dtype=np.int32)
+        order = np.argsort(term_ids, kind='stable')
+        counts = np.bincount(term_ids, minlength=len(self.vocabulary))
+        offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+        terms = sorted(self.vocabulary, key=self.vocabulary.get)
+        return BM25Index(
+            terms=terms,
+            offsets=offsets,
+            doc_ids=np.array(self._doc_ids, dtype=np.int32)[order],
+            tfs=np.array(self._tfs, dtype=np.uint16)[order],
+            doc_lengths=np.array(self.doc_lengths, dtype=np.int32),
+            k1=k1, b=b,
+        )
+
+
+class BM25Index:
+    """
+    Index lexical BM25 stocké en tableaux de postings.
+
+    Les documents du terme t sont doc_ids[offsets[t]:offsets[t+1]] (triés par
+    document), avec leurs fréquences dans tfs. Une requête additionne les
+    contributions BM25 de ses termes avec np.bincount, puis garde le top-k
+    avec argpartition.
+    """
+
+    def __init__(self, terms: List[str], offsets: np.ndarray, doc_ids: np.ndarray, tfs: np.ndarray,
+                 doc_lengths: np.ndarray, k1: float = 1.5, b: float = 0.75):
+        self.terms = terms
+        self.term_ids = {term: i for i, term in enumerate(terms)}
+        self.offsets = offsets
+        self.doc_ids = doc_ids
+        self.tfs = tfs
+        self.doc_lengths = doc_lengths
+        self.k1 = k1
+        self.b = b
+        self.num_docs = len(doc_lengths)
+        self.avg_doc_length = float(doc_lengths.mean()) if self.num_docs else 0.0
+        # Facteur de normalisation par document, calculé une fois
+        self._length_norm = (k1 * (1 - b + b * doc_lengths / max(self.avg_doc_length, 1e-9))).astype(np.float32)
+
+    def __len__(self) -> int:
+        return self.num_docs
+
+    def search(self, query: str, top_k: int = 10,
+               mask: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Retourne (positions, scores) des top_k documents, restreints au masque s'il est fourni."""
+        term_ids = [self.term_ids[t] for t in dict.fromkeys(tokenize(query)) if t in self.term_ids]
+        if not term_ids or not self.num_docs:
+            return np.array([], dtype=np.int64), np.array([], dtype=np.float32)
+
+        docs = []
+        weights = []
+        for term_id in term_ids:
+            start, end = self.offsets[term_id], self.offsets[term_id + 1]
+            term_docs = self.doc_ids[start:end]
+            tf = self.tfs[start:end].astype(np.float32)
+            df = end - start
+            idf = math.log(1 + (self.num_docs - df + 0.5) / (df + 0.5))
+            docs.append(term_docs)
+            weights.append(idf * tf * (self.k1 + 1) / (tf + self._length_norm[term_docs]))
+
+        docs = np.concatenate(docs)
+        scores = np.bincount(docs, weights=np.concatenate(weights), minlength=self.num_docs)
+        # Documents ayant au moins un terme, sans trier les postings concaténés
+        # (la comparaison en booléens est bien plus rapide que flatnonzero sur des flottants)
+        matched = scores > 0
+        candidates = np.flatnonzero(matched if mask is None else matched & mask)
+        candidate_scores = scores[candidates]
+
+        k = min(top_k, len(candidates))
+        if k == 0:
+            return np.array([], dtype=np.int64), np.array([], dtype=np.float32)
+        top = np.argpartition(-candidate_scores, k - 1)[:k] if k < len(candidates) else np.arange(k)
+        top = top[np.argsort(-candidate_scores[top], kind='stable')]
+        return candidates[top].astype(np.int64), candidate_scores[top].astype(np.float32)
+
+    def save(self, path: str):
+        """Sauvegarde les tableaux dans un .npz ; le vocabulaire est stocké en UTF-8."""
+        with open(path, 'wb') as f:
+            np.savez(
+                f,
+                vocabulary=np.frombuffer('\n'.join(self.terms).encode('utf-8'), dtype=np.uint8),
+                offsets=self.offsets, doc_ids=self.doc_ids, tfs=self.tfs, doc_lengths=self.doc_lengths,
+                params=np.array([self.k1, self.b], dtype=np.float64),
+            )
+
+    @classmethod
+    def load(cls, path: str) -> 'BM25Index':
+        with np.load(path) as data:
+            vocabulary = data['vocabulary'].tobytes().decode('utf-8')
+            k1, b = data['params']
+            return cls(
+                terms=vocabulary.split('\n') if vocabulary else [],
+                offsets=data['offsets'], doc_ids=data['doc_ids'], tfs=data['tfs'],
+                doc_lengths=data['doc_lengths'], k1=float(k1), b=float(b),
+            )
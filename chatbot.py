@@ -1,44 +1,310 @@
+import copy
 import faiss
-import json
+import functools
+import os
+import threading
+import time
 import numpy as np
-from sentence_transformers import SentenceTransformer
 import re
+from contextlib import contextmanager
 from typing import List, Tuple, Dict, Any, Optional
-from difflib import SequenceMatcher
 import unicodedata
-from collections import defaultdict
+from collections import Counter, defaultdict
+
+from author_index import FuzzyAuthorIndex, pack_fuzzy_index
+from autocomplete import PrefixIndex, frequent_title_ngrams
+from bm25_index import BM25Index, reciprocal_rank_fusion
+from derived_maps import (ArticlePositions, IndirectValues, MappedArticles, RaggedRows, SortedStringMap,
+                          derived_maps_path, load_derived_maps, pack_articles, pack_strings, save_derived_maps,
+                          unpack_strings)
+from query_parser import QueryParser
+from reranker import CrossEncoderReranker
+from rw_lock import ReadWriteLock
+from search_cache import LRUCache
+from search_metrics import SearchMetrics
+from semantic_indexer import (BuildUnavailableError, load_manifest, manifest_files, open_build_file, read_build,
+                              read_faiss_index, validate_manifest)
+
+# Nombre de catégories / co-auteurs / auteurs conservés dans les statistiques précalculées
+STATS_TOP_K = 5
+
+# Candidats classés une fois (puis servis par pages depuis le cache de résultats)
+PAGE_POOL_SIZE = 50
+
+
+def paginate(response: Dict[str, Any], offset: int, limit: int) -> Dict[str, Any]:
+    """Page [offset, offset + limit) d'une réponse ; next_offset vaut None sur la dernière page."""
+    if offset < 0 or limit <= 0:
+        raise ValueError("offset doit être positif ou nul et limit strictement positif")
+    results = response['results']
+    end = offset + limit
+    page = {key: value for key, value in response.items() if key != 'results'}
+    page.update(results=results[offset:end], offset=offset, limit=limit, total=len(results),
+                next_offset=end if end < len(results) else None)
+    return page
+
+
+def _request(method):
+    """
+    Exécute une méthode publique comme une requête (voir EnhancedArticleSearcher._request_slot).
+
+    Si la construction validée au démarrage a disparu avant son chargement différé
+    (plusieurs publications entre-temps), la requête la plus externe passe à la
+    construction publiée par check_for_update, hors du verrou de lecture, puis
+    recommence une fois.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            with self._request_slot():
+                return method(self, *args, **kwargs)
+        except BuildUnavailableError as e:
+            if getattr(self._request_depth, 'value', 0):
+                raise
+            self.check_for_update()
+            if not self.manifest or self.manifest['build_id'] == e.build_id:
+                raise
+        with self._request_slot():
+            return method(self, *args, **kwargs)
+    return wrapper
+
 
 class EnhancedArticleSearcher:
-    def __init__(self, index_path: str, metadata_path: str, model_name: str = "all-MiniLM-L6-v2"):
-        """Initialise le moteur de recherche amélioré."""
+    """
+    Moteur de recherche d'articles (index FAISS, BM25, tables auteurs/catégories).
+
+    Modèle de concurrence : l'état chargé (index, métadonnées, tables dérivées,
+    modèles) n'est jamais modifié par une requête, seulement par load_resources
+    sous le verrou d'écriture ; l'état d'une requête reste dans ses variables
+    locales, et les caches partagés (LRUCache) ont leur propre verrou. Les
+    méthodes publiques de recherche s'exécutent en lecture, au plus
+    max_concurrent_requests à la fois. faiss_threads / torch_threads bornent les
+    threads internes de FAISS et de torch pour éviter la sur-souscription quand
+    plusieurs sessions cherchent en même temps.
+    """
+
+    # État propre à une construction de l'index, remplacé d'un bloc au rechargement à chaud
+    _GENERATION_ATTRS = (
+        'manifest', 'startup_times', '_index', '_field_indexes', '_lexical_index', '_metadata',
+        '_article_positions', '_model', '_reranker', 'all_authors_cache', 'author_display_names',
+        'author_normalized_names', 'author_fuzzy_index', 'author_article_offsets', 'author_article_positions',
+        'category_names',
+        'category_positions', 'article_years', 'author_article_counts', 'author_first_years',
+        'author_last_years', 'author_category_offsets', 'author_category_ids', 'author_category_counts',
+        'author_coauthor_ids', 'author_coauthor_counts', 'prolific_authors', 'popular_categories',
+        'title_ngrams', 'title_ngram_counts', '_autocomplete_index', '_article_arrays',
+    )
+
+    def __init__(self, index_path: str, metadata_path: str, model_name: str = "all-MiniLM-L6-v2",
+                 cache_size: int = 1024, cache_ttl: Optional[float] = 3600,
+                 reranker_model: Optional[str] = None, rerank_top_n: int = 20,
+                 rerank_budget: float = 0.2, lazy: bool = True,
+                 max_concurrent_requests: Optional[int] = None,
+                 faiss_threads: Optional[int] = None, torch_threads: Optional[int] = None,
+                 reload_interval: Optional[float] = None, mmap: bool = False,
+                 metrics: Optional[SearchMetrics] = None):
+        """
+        Initialise le moteur de recherche amélioré.
+        cache_size et cache_ttl (secondes) bornent les caches de vecteurs de requêtes
+        et de résultats ; cache_size=0 les désactive.
+        reranker_model active le re-classement des rerank_top_n premiers candidats par
+        un cross-encoder, sauté si le lot dépasse rerank_budget secondes (estimation).
+        Avec lazy=True, l'index FAISS, les métadonnées et les modèles ne sont chargés
+        qu'à leur première utilisation (voir load_resources).
+        max_concurrent_requests (par défaut le nombre de CPU) borne les requêtes
+        simultanées ; faiss_threads et torch_threads fixent les threads internes.
+        reload_interval (secondes) active la surveillance des nouvelles constructions
+        (voir start_watching).
+        Avec mmap=True, l'index FAISS et les métadonnées sont projetés en mémoire en
+        lecture seule (IO_FLAG_MMAP, tables dérivées) : plusieurs processus sur la même
+        machine partagent leurs pages, chacun ne garde en propre que le modèle.
+        metrics (SearchMetrics) reçoit les durées par étape et les compteurs des
+        recherches ; par défaut activé, sans profilage.
+        """
         self.index_path = index_path
         self.metadata_path = metadata_path
-        self.index = None
-        self.metadata = None
-        self.model = None
+        self.model_name = model_name
+        self.lazy = lazy
+        self.mmap = mmap
+        self._index = None
+        self._field_indexes = {}
+        self._lexical_index = None
+        self._metadata = None
+        self._article_positions = None
+        self._model = None
+        self._reranker = None
+        self.manifest = None
+        self.startup_times = {}
         self.all_authors_cache = None
-        self.author_articles_map = None
-        self.category_map = None
+        self.author_display_names = None
+        self.author_normalized_names = None
+        self.author_fuzzy_index = None
+        self.author_article_offsets = None
+        self.author_article_positions = None
+        self._author_match_cache = LRUCache(4096, None)
+        self.category_names = None
+        self.category_positions = None
+        self.article_years = None
+        self.author_article_counts = None
+        self.author_first_years = None
+        self.author_last_years = None
+        self.author_category_offsets = None
+        self.author_category_ids = None
+        self.author_category_counts = None
+        self.author_coauthor_ids = None
+        self.author_coauthor_counts = None
+        self.prolific_authors = None
+        self.popular_categories = None
+        self.title_ngrams = None
+        self.title_ngram_counts = None
+        self._autocomplete_index = None
+        self._article_arrays = None
+        self.query_parser = QueryParser()
+        self.embedding_cache = LRUCache(cache_size, cache_ttl)
+        self.result_cache = LRUCache(cache_size, cache_ttl)
+        self.reranker_model = reranker_model
+        self.rerank_top_n = rerank_top_n
+        self.rerank_budget = rerank_budget
+        self.torch_threads = torch_threads
+        self.metrics = metrics if metrics is not None else SearchMetrics()
+        self._state_lock = ReadWriteLock()
+        self._load_lock = threading.RLock()
+        self._request_slots = threading.BoundedSemaphore(max_concurrent_requests or os.cpu_count() or 4)
+        self._request_depth = threading.local()
+        self._reload_lock = threading.Lock()
+        self._watcher = None
+        self._watch_stop = None
+        self.generation = 0
+        if faiss_threads:
+            faiss.omp_set_num_threads(faiss_threads)
         
         print("🔄 Initialisation du moteur de recherche amélioré...")
         self.load_resources(model_name)
+        if reload_interval:
+            self.start_watching(reload_interval)
+
+    # Ressources lourdes, chargées à la première utilisation
+    @property
+    def index(self):
+        self._ensure_index()
+        return self._index
+
+    @property
+    def field_indexes(self) -> Dict[str, Any]:
+        self._ensure_index()
+        return self._field_indexes
+
+    @property
+    def lexical_index(self) -> Optional[BM25Index]:
+        self._ensure_index()
+        return self._lexical_index
+
+    @property
+    def metadata(self) -> List[Dict]:
+        self._ensure_index()
+        return self._metadata
+
+    @property
+    def article_positions(self) -> Dict[str, int]:
+        self._ensure_index()
+        return self._article_positions
+
+    @property
+    def model(self):
+        if self._model is None:
+            with self._load_lock:
+                if self._model is None:
+                    self._load_model()
+        return self._model
+
+    @property
+    def reranker(self) -> Optional[CrossEncoderReranker]:
+        if self._reranker is None and self.reranker_model:
+            with self._load_lock:
+                if self._reranker is None:
+                    with self._timed('reranker'):
+                        print(f"🎯 Chargement du re-classeur {self.reranker_model}...")
+                        self._reranker = CrossEncoderReranker(
+                            self.reranker_model, self.rerank_top_n, self.rerank_budget)
+        return self._reranker
+
+    @property
+    def autocomplete_index(self) -> PrefixIndex:
+        if self._autocomplete_index is None:
+            with self._load_lock:
+                if self._autocomplete_index is None:
+                    self._autocomplete_index = self._build_autocomplete_index()
+        return self._autocomplete_index
+
+    @contextmanager
+    def _request_slot(self):
+        """
+        Occupe une place de requête (sémaphore borné) et lit l'état sous le verrou
+        de lecture. Les appels imbriqués (search -> search_many) ne reprennent pas de place.
+        """
+        depth = getattr(self._request_depth, 'value', 0)
+        if depth:
+            self._request_depth.value = depth + 1
+            try:
+                yield
+            finally:
+                self._request_depth.value = depth
+            return
         
-    def load_resources(self, model_name: str):
-        """Charge toutes les ressources nécessaires."""
+        with self._request_slots, self._state_lock.read():
+            self._request_depth.value = 1
+            try:
+                yield
+            finally:
+                self._request_depth.value = 0
+
+    @contextmanager
+    def _timed(self, stage: str):
+        """Cumule la durée d'une étape de chargement dans startup_times."""
+        start = time.perf_counter()
         try:
-            print("📊 Chargement de l'index FAISS...")
-            self.index = faiss.read_index(self.index_path)
+            yield
+        finally:
+            self.startup_times[stage] = self.startup_times.get(stage, 0.0) + time.perf_counter() - start
 
-            print("📋 Chargement des métadonnées...")
-            with open(self.metadata_path, "r", encoding="utf-8") as f:
-                self.metadata = json.load(f)
+    def load_resources(self, model_name: str):
+        """
+        Prépare le moteur : validation du manifeste (quelques stat) et tables dérivées
+        (auteurs, catégories, années, statistiques). Les tables sont relues en
+        memory-map depuis arxiv_index.derived/ quand elles correspondent à la
+        construction courante, sinon calculées depuis les métadonnées puis sauvegardées.
+        L'index, les métadonnées et le modèle sont chargés à la première recherche,
+        ou tout de suite si lazy=False. Les requêtes en cours se terminent avant
+        le rechargement, et les nouvelles attendent sa fin.
+        """
+        with self._state_lock.write(), self._load_lock:
+            self._load_resources(model_name)
 
-            print("🤖 Chargement du modèle de vectorisation...")
-            self.model = SentenceTransformer(model_name)
+    def _load_resources(self, model_name: str):
+        try:
+            if self._model is not None and model_name != self.model_name:
+                self._model = None
+            self.model_name = model_name
+            self.startup_times = {}
+            self._index = None
+            self._metadata = None
+            self._article_arrays = None
+            
+            with self._timed('manifest'):
+                self.manifest = validate_manifest(self.index_path, self.metadata_path, model_name)
+            if self.manifest is None:
+                print("⚠️  Aucun manifeste trouvé: cohérence index/métadonnées non vérifiée")
+            
+            with self._timed('derived_maps'):
+                self._load_derived_maps()
+            # Les résultats en cache désignent des positions de l'ancien index
+            self.clear_caches()
             
-            print(f"✅ Base de données chargée: {len(self.metadata)} articles")
-            self._build_author_mapping()
-            self._build_category_mapping()
+            if not self.lazy:
+                self._ensure_index()
+                self.model
+                self.reranker
+            self.startup_report()
             
         except FileNotFoundError as e:
             print(f"❌ Erreur: Fichier non trouvé - {e}")
@@ -47,31 +313,363 @@ class EnhancedArticleSearcher:
             print(f"❌ Erreur lors du chargement: {e}")
             raise
 
-    def _build_author_mapping(self):
-        """Construit un mapping auteur -> articles pour des recherches rapides."""
-        self.author_articles_map = defaultdict(list)
-        self.all_authors_cache = set()
+    def _ensure_index(self):
+        if self._index is None:
+            with self._load_lock:
+                if self._index is None:
+                    self._load_index()
+
+    def _load_index(self):
+        """
+        Charge l'index FAISS, les index de champ, l'index BM25 et les métadonnées de la
+        construction validée par load_resources (self.manifest), même si une autre a été
+        publiée depuis : passer à celle-ci est le rôle de check_for_update. Si ses
+        fichiers ont été supprimés entre-temps, lève BuildUnavailableError (voir _request).
+        """
+        with self._timed('index'):
+            print("📊 Chargement de l'index FAISS et des métadonnées...")
+            mapped = self._mapped_metadata() if self.mmap else None
+            index, metadata = read_build(self.index_path, self.metadata_path, self.manifest,
+                                         mmap=self.mmap, articles=mapped and mapped[0])
+            # Index de champ et BM25 de la même construction, tels que nommés par le manifeste
+            files = manifest_files(self.index_path, self.metadata_path, self.manifest)
+            field_indexes = {'abstract': index}
+            for field, path in files['index_files'].items():
+                if field != 'abstract':
+                    field_indexes[field] = open_build_file(self.manifest, read_faiss_index, path, self.mmap)
+            if len(field_indexes) > 1:
+                print(f"🧬 Index par champ disponibles: {', '.join(field_indexes)}")
+            
+            # Index lexical BM25 (recherche hybride) s'il fait partie de la construction
+            lexical_index = None
+            if files['lexical_index']:
+                lexical_index = open_build_file(self.manifest, BM25Index.load, files['lexical_index'])
+                if len(lexical_index) != len(metadata):
+                    raise ValueError("Index BM25 incohérent avec les métadonnées")
+                print(f"🔤 Index lexical BM25 chargé: {len(lexical_index.terms)} termes")
+            
+            self._field_indexes = field_indexes
+            self._lexical_index = lexical_index
+            self._metadata = metadata
+            if mapped:
+                self._article_positions = mapped[1]
+            else:
+                self._article_positions = {a.get('arxiv_id'): idx for idx, a in enumerate(metadata)}
+            self._index = index
+            print(f"✅ Base de données chargée: {len(metadata)} articles")
+
+    def _mapped_metadata(self) -> Optional[Tuple[MappedArticles, ArticlePositions]]:
+        """
+        Métadonnées en memory-map depuis les tables dérivées de la construction servie
+        (None sans manifeste ni tables : le JSON est relu).
+        """
+        arrays = self._article_arrays
+        if arrays is None or not self.manifest:
+            return None
+        return (MappedArticles(arrays['article_blob'], arrays['article_offsets']),
+                ArticlePositions(arrays['article_ids'], arrays['article_id_order']))
+
+    def _load_model(self):
+        with self._timed('model'):
+            print("🤖 Chargement du modèle de vectorisation...")
+            # Import différé : sentence_transformers charge torch (plusieurs secondes)
+            from sentence_transformers import SentenceTransformer
+            if self.torch_threads:
+                import torch
+                torch.set_num_threads(self.torch_threads)
+            model = SentenceTransformer(self.model_name)
+            if self.manifest and self.manifest['dimension'] != model.get_sentence_embedding_dimension():
+                raise ValueError(f"Dimension du modèle incompatible avec l'index ({self.manifest['dimension']})")
+            self._model = model
+
+    def check_for_update(self) -> bool:
+        """
+        Recharge à chaud si une nouvelle construction a été publiée (build_id du manifeste).
+
+        La construction est chargée entièrement dans une copie du moteur pendant que
+        les requêtes continuent sur l'ancienne ; l'échange ne prend le verrou
+        d'écriture que le temps de réaffecter les attributs, une fois les requêtes en
+        cours terminées. L'ancienne construction est libérée dès que plus rien ne la
+        référence. Retourne True si la construction servie a changé.
+        """
+        with self._reload_lock:
+            try:
+                manifest = load_manifest(self.index_path)
+            except (OSError, ValueError):
+                return False
+            if manifest is None or (self.manifest and manifest['build_id'] == self.manifest['build_id']):
+                return False
+            
+            print(f"🔁 Nouvelle construction {manifest['build_id'][:8]}: chargement en arrière-plan...")
+            staging = copy.copy(self)
+            staging._state_lock = ReadWriteLock()
+            staging._load_lock = threading.RLock()
+            staging._author_match_cache = LRUCache(4096, None)
+            staging.embedding_cache = LRUCache(0, None)
+            staging.result_cache = LRUCache(0, None)
+            staging.lazy = False
+            try:
+                staging._load_resources(self.model_name)
+            except Exception as e:
+                print(f"⚠️  Rechargement à chaud abandonné, ancienne construction conservée: {e}")
+                return False
+            
+            with self._state_lock.write():
+                for attr in self._GENERATION_ATTRS:
+                    setattr(self, attr, getattr(staging, attr))
+                self.clear_caches()
+                self.generation += 1
+            print(f"✅ Construction {self.manifest['build_id'][:8] if self.manifest else '?'} en service")
+            return True
+
+    def start_watching(self, interval: float = 30.0):
+        """Vérifie toutes les `interval` secondes, dans un thread de fond, si une construction a été publiée."""
+        if self._watcher is not None:
+            return
+        self._watch_stop = threading.Event()
+        
+        def watch():
+            while not self._watch_stop.wait(interval):
+                self.check_for_update()
+        
+        self._watcher = threading.Thread(target=watch, name='index-watcher', daemon=True)
+        self._watcher.start()
+
+    def stop_watching(self):
+        if self._watcher is not None:
+            self._watch_stop.set()
+            self._watcher.join()
+            self._watcher = None
+
+    def startup_report(self) -> Dict[str, float]:
+        """Affiche et retourne la durée (secondes) de chaque étape de chargement effectuée."""
+        stages = ', '.join(f"{stage} {seconds * 1000:.0f} ms" for stage, seconds in self.startup_times.items())
+        print(f"⏱️  Chargement: {stages}")
+        return dict(self.startup_times)
+
+    def _load_derived_maps(self):
+        """Relit les tables dérivées de la construction courante, ou les calcule et les sauvegarde."""
+        path = derived_maps_path(self.index_path)
+        loaded = load_derived_maps(path, self.manifest['build_id']) if self.manifest else None
+        if loaded is not None:
+            print(f"⚡ Tables dérivées relues depuis {path}")
+            self._apply_derived_maps(*loaded)
+        else:
+            self._ensure_index()
+            arrays, strings = self._build_derived_maps()
+            if self.manifest:
+                try:
+                    save_derived_maps(path, self.manifest['build_id'], arrays, strings)
+                except OSError as e:
+                    print(f"⚠️  Tables dérivées non sauvegardées: {e}")
+                else:
+                    # Relues depuis le disque : pages partagées plutôt que tableaux en mémoire privée
+                    arrays, strings = load_derived_maps(path, self.manifest['build_id']) or (arrays, strings)
+            self._apply_derived_maps(arrays, strings)
         
-        for idx, article in enumerate(self.metadata):
+        if self.mmap and self._metadata is not None:
+            # Métadonnées JSON déjà chargées (calcul des tables) : la vue memory-map les remplace
+            mapped = self._mapped_metadata()
+            if mapped:
+                self._metadata, self._article_positions = mapped
+
+    def _build_derived_maps(self) -> Tuple[Dict[str, np.ndarray], Dict[str, List[str]]]:
+        """
+        Calcule depuis les métadonnées toutes les tables dérivées, sous forme de tableaux
+        NumPy indexés par identifiant d'auteur / de catégorie et de listes de chaînes :
+        articles de chaque auteur et de chaque catégorie (CSR), année de chaque article,
+        et statistiques par auteur (années extrêmes, nombre d'articles par catégorie
+        triés par fréquence, STATS_TOP_K principaux co-auteurs), et n-grammes
+        fréquents des titres pour l'autocomplétion, et articles sérialisés (pack_articles)
+        pour les relire en memory-map.
+        """
+        metadata = self._metadata
+        spelling_names = {}
+        author_articles = defaultdict(list)
+        category_articles = defaultdict(list)
+        for idx, article in enumerate(metadata):
             for author in article.get("authors", []):
                 name = author.get("name", "").strip()
                 if name:
-                    normalized_name = self.normalize_text(name)
-                    self.author_articles_map[normalized_name].append(idx)
-                    self.all_authors_cache.add(name)
+                    normalized_name = spelling_names.get(name)
+                    if normalized_name is None:
+                        normalized_name = spelling_names[name] = self.normalize_text(name)
+                    author_articles[normalized_name].append(idx)
+            for category in article.get("categories", []):
+                category_articles[category].append(idx)
+        
+        # Identifiants d'auteur : noms normalisés dans l'ordre des graphies triées ;
+        # le nom affiché est la première graphie dans cet ordre
+        spellings = sorted(spelling_names)
+        display_names = {}
+        for spelling in spellings:
+            display_names.setdefault(spelling_names[spelling], spelling)
+        names = [name for name in display_names if name]
+        name_ids = {name: i for i, name in enumerate(names)}
+        
+        # Articles de l'auteur i = author_article_positions[offsets[i]:offsets[i+1]]
+        author_offsets = np.concatenate([[0], np.cumsum([len(author_articles[n]) for n in names])]).astype(np.int64)
+        author_positions = np.fromiter((idx for name in names for idx in author_articles[name]),
+                                       dtype=np.int32, count=int(author_offsets[-1]))
+        category_names = sorted(category_articles)
+        category_ids = {cat: i for i, cat in enumerate(category_names)}
+        category_offsets = np.concatenate(
+            [[0], np.cumsum([len(category_articles[c]) for c in category_names])]).astype(np.int64)
+        category_positions = np.fromiter((idx for cat in category_names for idx in category_articles[cat]),
+                                         dtype=np.int64, count=int(category_offsets[-1]))
+        # 0 = année inconnue
+        years = np.array(
+            [int(y) if y.isdigit() else 0 for y in ((a.get('published_date') or '')[:4] for a in metadata)],
+            dtype=np.int16
+        )
+        
+        # Années min/max par auteur en une passe (reduceat sur la colonne des années)
+        counts = np.diff(author_offsets)
+        first = np.zeros(len(names), dtype=np.int16)
+        last = np.zeros(len(names), dtype=np.int16)
+        if len(author_positions):
+            starts = author_offsets[:-1][counts > 0]
+            author_years = years[author_positions]
+            known = np.where(author_years > 0, author_years, np.iinfo(np.int16).max)
+            first[counts > 0] = np.minimum.reduceat(known, starts)
+            last[counts > 0] = np.maximum.reduceat(author_years, starts)
+        first[first == np.iinfo(np.int16).max] = 0
         
-        self.all_authors_cache = sorted(self.all_authors_cache)
-        print(f"📚 {len(self.all_authors_cache)} auteurs uniques indexés")
+        # Catégories (par fréquence) et principaux co-auteurs de chaque auteur
+        article_categories = [[category_ids[c] for c in a.get('categories', [])] for a in metadata]
+        article_authors = [[] for _ in metadata]
+        for author_id in range(len(names)):
+            for idx in author_positions[author_offsets[author_id]:author_offsets[author_id + 1]]:
+                article_authors[idx].append(author_id)
+        
+        stats_offsets = [0]
+        stats_category_ids = []
+        stats_category_counts = []
+        coauthor_ids = np.full((len(names), STATS_TOP_K), -1, dtype=np.int32)
+        coauthor_counts = np.zeros((len(names), STATS_TOP_K), dtype=np.int32)
+        for author_id in range(len(names)):
+            articles = author_positions[author_offsets[author_id]:author_offsets[author_id + 1]]
+            categories = Counter(c for idx in articles for c in article_categories[idx])
+            for category, count in categories.most_common():
+                stats_category_ids.append(category)
+                stats_category_counts.append(count)
+            stats_offsets.append(len(stats_category_ids))
+            coauthors = Counter(a for idx in articles for a in article_authors[idx] if a != author_id)
+            for rank, (coauthor, count) in enumerate(coauthors.most_common(STATS_TOP_K)):
+                coauthor_ids[author_id, rank] = coauthor
+                coauthor_counts[author_id, rank] = count
+        
+        title_ngrams = frequent_title_ngrams(a.get('title') for a in metadata)
+        
+        arrays = {
+            **pack_articles(metadata),
+            **pack_fuzzy_index(names),
+            **pack_strings('author_display', [display_names[name] for name in names]),
+            **pack_strings('author_spellings', spellings),
+            **pack_strings('category_names', category_names),
+            'author_spelling_ids': np.array([name_ids.get(spelling_names[s], -1) for s in spellings], dtype=np.int32),
+            'author_article_offsets': author_offsets,
+            'author_article_positions': author_positions,
+            'category_offsets': category_offsets,
+            'category_article_positions': category_positions,
+            'article_years': years,
+            'author_first_years': first,
+            'author_last_years': last,
+            'author_category_offsets': np.array(stats_offsets, dtype=np.int64),
+            'author_category_ids': np.array(stats_category_ids, dtype=np.int32),
+            'author_category_counts': np.array(stats_category_counts, dtype=np.int32),
+            'author_coauthor_ids': coauthor_ids,
+            'author_coauthor_counts': coauthor_counts,
+            'title_ngram_counts': np.array([count for _, count in title_ngrams], dtype=np.int32),
+        }
+        strings = {
+            'title_ngrams': [gram for gram, _ in title_ngrams],
+        }
+        return arrays, strings
 
-    def _build_category_mapping(self):
-        """Construit un mapping catégorie -> articles."""
-        self.category_map = defaultdict(list)
+    def _apply_derived_maps(self, arrays: Dict[str, np.ndarray], strings: Dict[str, List[str]]):
+        """
+        Installe les tables dérivées (calculées ou relues) et les index qui en découlent.
+        Noms, graphies, catégories et index flou sont servis par les tableaux eux-mêmes
+        (MappedStrings, SortedStringMap) : en memory-map, leurs pages sont partagées
+        entre processus au lieu de dictionnaires Python de la taille du vocabulaire.
+        """
+        # Index flou (trigrammes) pour les suggestions et correspondances approchées
+        self.author_fuzzy_index = FuzzyAuthorIndex.from_arrays(arrays)
+        self._author_match_cache.clear()
+        names = self.author_fuzzy_index.names
+        spellings = unpack_strings(arrays, 'author_spellings')
+        self.all_authors_cache = spellings
+        # Nom normalisé -> nom affiché ; graphie -> nom normalisé (graphies triées)
+        self.author_display_names = SortedStringMap(
+            names, arrays['author_name_order'], unpack_strings(arrays, 'author_display'))
+        self.author_normalized_names = SortedStringMap(
+            spellings, None, IndirectValues(names, arrays['author_spelling_ids']))
         
-        for idx, article in enumerate(self.metadata):
-            for category in article.get("categories", []):
-                self.category_map[category].append(idx)
+        # Colonnes NumPy indexées par identifiant d'auteur (position dans author_fuzzy_index.names)
+        self.author_article_offsets = arrays['author_article_offsets']
+        self.author_article_positions = arrays['author_article_positions']
+        self.author_article_counts = np.diff(self.author_article_offsets).astype(np.int32)
+        self.author_first_years = arrays['author_first_years']
+        self.author_last_years = arrays['author_last_years']
+        self.author_category_offsets = arrays['author_category_offsets']
+        self.author_category_ids = arrays['author_category_ids']
+        self.author_category_counts = arrays['author_category_counts']
+        self.author_coauthor_ids = arrays['author_coauthor_ids']
+        self.author_coauthor_counts = arrays['author_coauthor_counts']
         
-        print(f"🏷️  {len(self.category_map)} catégories uniques indexées")
+        # Colonnes utilisées pour pré-filtrer la recherche vectorielle
+        self.category_names = unpack_strings(arrays, 'category_names')
+        offsets = arrays['category_offsets']
+        self.category_positions = SortedStringMap(
+            self.category_names, None, RaggedRows(offsets, arrays['category_article_positions']))
+        self.article_years = arrays['article_years']
+        self.title_ngrams = strings['title_ngrams']
+        self.title_ngram_counts = arrays['title_ngram_counts']
+        self._autocomplete_index = None
+        self._article_arrays = {name: arrays[name] for name in
+                                ('article_blob', 'article_offsets', 'article_ids', 'article_id_order')}
+        
+        # Classements globaux pour les statistiques
+        counts = self.author_article_counts
+        self.prolific_authors = [(names[i], int(counts[i])) for i in np.argsort(-counts, kind='stable')[:STATS_TOP_K]]
+        category_counts = np.diff(offsets)
+        self.popular_categories = [(self.category_names[i], int(category_counts[i]))
+                                   for i in np.argsort(-category_counts, kind='stable')[:STATS_TOP_K]]
+        
+        print(f"📚 {len(spellings)} auteurs uniques indexés")
+        print(f"🏷️  {len(self.category_names)} catégories uniques indexées")
+
+    def _author_articles(self, normalized_name: str) -> np.ndarray:
+        """Positions des articles d'un auteur (nom normalisé), dans l'ordre des métadonnées."""
+        author_id = self.author_fuzzy_index.name_ids.get(normalized_name)
+        if author_id is None:
+            return self.author_article_positions[:0]
+        return self.author_article_positions[
+            self.author_article_offsets[author_id]:self.author_article_offsets[author_id + 1]]
+
+    def _build_autocomplete_index(self) -> PrefixIndex:
+        """Index de complétion : auteurs, catégories et n-grammes de titres, pondérés par nombre d'articles."""
+        with self._timed('autocomplete'):
+            names = self.author_fuzzy_index.names
+            display_names = self.author_display_names.values
+            category_counts = np.diff(self.category_positions.values.offsets).tolist()
+            entries = [(display, name, 'author', int(count))
+                       for display, name, count in zip(display_names, names, self.author_article_counts.tolist())]
+            entries += [(cat, cat.lower(), 'category', count)
+                        for cat, count in zip(self.category_names, category_counts)]
+            entries += [(gram, gram, 'title', int(count))
+                        for gram, count in zip(self.title_ngrams, self.title_ngram_counts.tolist())]
+            return PrefixIndex(entries)
+
+    @_request
+    def autocomplete(self, prefix: str, limit: int = 8, kinds: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Suggestions pendant la saisie : noms d'auteurs, catégories et expressions
+        fréquentes des titres commençant par `prefix` (ou dont un mot commence par lui),
+        les plus fréquentes d'abord. kinds restreint les types ('author', 'category', 'title').
+        """
+        return self.autocomplete_index.complete(prefix, limit, kinds)
 
     def normalize_text(self, text: str) -> str:
         """Normalise le texte pour améliorer les correspondances."""
@@ -81,180 +679,116 @@ class EnhancedArticleSearcher:
         text = ''.join(c for c in text if not unicodedata.combining(c))
         return text.lower().strip()
 
+    @_request
     def detect_search_type(self, query: str) -> Dict[str, Any]:
         """
         Détecte automatiquement le type de recherche basé sur la requête.
-        Version améliorée avec plus de patterns et meilleure précision.
-        """
-        query_lower = query.lower()
-        search_info = {
-            'type': 'general',
-            'authors': [],
-            'keywords': query.strip(),
-            'confidence': 0.0,
-            'year_filter': None
-        }
-        
-        # Détection d'année (ex: "2020", "2015-2020")
-        year_match = re.search(r'(19|20)\d{2}(?:\s*-\s*(19|20)\d{2})?', query)
-        if year_match:
-            search_info['year_filter'] = year_match.group()
-            search_info['keywords'] = re.sub(r'(19|20)\d{2}(?:\s*-\s*(19|20)\d{2})?', '', search_info['keywords']).strip()
-        
-        # Mots-clés indiquant une recherche par auteur
-        author_indicators = [
-            'par', 'de', 'd\'', 'by', 'author', 'auteur', 'écrit par', 'written by',
-            'articles de', 'papers by', 'travaux de', 'publications de',
-            'recherche de', 'études de', 'works of', 'œuvres de'
-        ]
-        
-        # Vérifie si c'est une recherche par auteur
-        has_author_indicator = any(indicator in query_lower for indicator in author_indicators)
-        
-        if has_author_indicator:
-            authors = self._extract_author_names(query)
-            if authors:
-                search_info['type'] = 'mixed' if len(query.split()) > len(' '.join(authors).split()) + 2 else 'author'
-                search_info['authors'] = authors
-                search_info['confidence'] = 0.9
-                
-                # Nettoie les mots-clés
-                cleaned_query = query
-                for indicator in author_indicators:
-                    cleaned_query = re.sub(rf'\b{re.escape(indicator)}\b', '', cleaned_query, flags=re.IGNORECASE)
-                for author in authors:
-                    cleaned_query = re.sub(rf'\b{re.escape(author)}\b', '', cleaned_query, flags=re.IGNORECASE)
-                
-                search_info['keywords'] = re.sub(r'\s+', ' ', cleaned_query).strip()
-        else:
-            # Vérifie si la requête contient des noms probables d'auteurs
-            potential_authors = self._find_potential_authors_in_query(query)
-            if potential_authors:
-                search_info['type'] = 'mixed'
-                search_info['authors'] = potential_authors
-                search_info['confidence'] = 0.7
-                search_info['keywords'] = ' '.join([w for w in query.split() 
-                                                  if not any(a.lower() in w.lower() for a in potential_authors)]).strip()
-        
-        return search_info
-
-    def _extract_author_names(self, query: str) -> List[str]:
-        """Extrait les noms d'auteurs de la requête avec patterns améliorés."""
-        authors = []
-        excluded_words = {
-            'les', 'des', 'de', 'le', 'la', 'du', 'articles', 'article', 'sur', 
-            'par', 'avec', 'dans', 'pour', 'que', 'qui', 'sont', 'est', 'une', 'un',
-            'recherche', 'etude', 'paper', 'papers', 'study', 'research', 'work',
-            'results', 'analysis', 'method', 'approach', 'technique', 'model', 'et', 'and'
-        }
-        
-        # Patterns améliorés pour extraction
-        patterns = [
-            r'(?:par|de|d\'|by|author|auteur|écrit par|written by|works of|œuvres de)\s+([A-ZÀ-Ü][a-zà-üß-ÿ]+(?:\s+[A-ZÀ-Ü][a-zà-üß-ÿ]+)*)',
-            r'(?:articles de|papers by|travaux de|publications de|works of)\s+([A-ZÀ-Ü][a-zà-üß-ÿ]+(?:\s+[A-ZÀ-Ü][a-zà-üß-ÿ]+)*)',
-            r'\b([A-ZÀ-Ü]\.\s*[A-ZÀ-Ü][a-zà-üß-ÿ]+)\b',  # J. Doe
-            r'\b([A-ZÀ-Ü][a-zà-üß-ÿ]+\s+et\s+al\.?)\b',  # Smith et al.
-            r'\b([A-ZÀ-Ü][a-zà-üß-ÿ]+\s+(?:[A-ZÀ-Ü][a-zà-üß-ÿ.]+(?:\s+[A-ZÀ-Ü][a-zà-üß-ÿ.]+)*)\b'  # Noms complets
-        ]
-        
-        for pattern in patterns:
-            matches = re.finditer(pattern, query, re.IGNORECASE)
-            for match in matches:
-                author_name = match.group(1).strip()
-                if self._is_valid_author_name(author_name, excluded_words):
-                    if author_name not in authors:
-                        authors.append(author_name)
-        
-        return authors
+        L'analyse est faite en une passe par QueryParser (patterns précompilés et
+        trie des indicateurs d'auteur) ; les noms candidats sont validés par le
+        dictionnaire des auteurs, qui est aussi cherché dans toute la requête
+        si aucun nom connu n'y a été trouvé.
+        """
+        return self.query_parser.parse(query, author_lookup=self._find_potential_authors_in_query,
+                                       known_author=self._known_author)
+
+    def _known_author(self, name: str) -> Optional[str]:
+        """Nom affiché d'un auteur connu (correspondance exacte du nom normalisé), ou None."""
+        return self.author_display_names.get(self.normalize_text(name))
 
     def _find_potential_authors_in_query(self, query: str) -> List[str]:
-        """Trouve des auteurs potentiels en utilisant le mapping d'auteurs."""
+        """
+        Trouve des auteurs potentiels en utilisant le mapping d'auteurs.
+        La requête est normalisée une seule fois ; chaque n-gramme (1 à 3 mots) est
+        cherché par dichotomie dans les noms normalisés triés.
+        """
         potential_authors = []
-        query_words = query.split()
+        query_words = self.normalize_text(query).split()
         
-        # Vérifie les noms complets (2-3 mots)
         for i in range(len(query_words)):
-            for j in range(i+1, min(i+4, len(query_words)+1)):
-                potential_name = ' '.join(query_words[i:j])
-                normalized_name = self.normalize_text(potential_name)
-                
-                # Vérifie directement dans le mapping
-                if normalized_name in self.author_articles_map:
-                    # Trouve la version originale avec la casse correcte
-                    for author in self.all_authors_cache:
-                        if self.normalize_text(author) == normalized_name:
-                            potential_authors.append(author)
-                            break
+            for length in range(1, min(3, len(query_words) - i) + 1):
+                normalized_name = ' '.join(query_words[i:i+length])
+                author = self.author_display_names.get(normalized_name)
+                if author:
+                    potential_authors.append(author)
         
-        return list(set(potential_authors))
+        return list(dict.fromkeys(potential_authors))
 
-    def _is_valid_author_name(self, name: str, excluded_words: set) -> bool:
-        """Valide si une chaîne est probablement un nom d'auteur."""
-        if not name or len(name) < 2:
-            return False
-        
-        words = name.lower().split()
-        
-        # Vérifie les mots exclus
-        if any(word in excluded_words for word in words):
-            return False
-        
-        # Au moins un mot doit avoir plus de 1 caractère
-        if not any(len(word) > 1 for word in words):
-            return False
+    def _matching_author_ids(self, query_norm: str) -> Tuple[np.ndarray, frozenset]:
+        """
+        Identifiants des auteurs correspondant à un nom de requête normalisé (mis en cache) :
+        - un nom contient l'autre (recherche dans la chaîne de tous les noms, et
+          n-grammes de la requête présents dans le dictionnaire)
+        - similarité élevée (>= 0.8, via l'index flou)
+        - même nom de famille pour deux noms composés
+        """
+        cached = self._author_match_cache.get(query_norm)
+        if cached is not None:
+            return cached
         
-        # Ne doit pas contenir que des chiffres ou caractères spéciaux
-        if all(not c.isalpha() for c in name):
-            return False
+        index = self.author_fuzzy_index
+        ids = set()
+        if query_norm:
+            # Un terme contient l'autre (inclut la correspondance exacte)
+            ids.update(index.names.find_containing(query_norm))
+            words = query_norm.split()
+            for i in range(len(words)):
+                for j in range(i + 1, len(words) + 1):
+                    name_id = index.name_ids.get(' '.join(words[i:j]))
+                    if name_id is not None:
+                        ids.add(name_id)
+            
+            # Similarité élevée
+            ids.update(index.name_ids[name] for name, _ in index.similar(query_norm, k=len(index), min_score=0.8))
+            
+            # Correspondance du dernier nom (nom de famille)
+            if len(words) > 1:
+                ids.update(int(i) for i in index.last_names.get(words[-1], []) if ' ' in index.names[i])
         
-        return True
+        result = (np.array(sorted(ids), dtype=np.int64), frozenset(ids))
+        self._author_match_cache.put(query_norm, result)
+        return result
 
+    def _matching_article_positions(self, query_authors: List[str]) -> Tuple[np.ndarray, frozenset]:
+        """Positions (triées) des articles d'au moins un auteur correspondant, et ces identifiants d'auteurs."""
+        author_ids = set()
+        slices = []
+        for query_author in query_authors:
+            ids, id_set = self._matching_author_ids(self.normalize_text(query_author))
+            author_ids |= id_set
+            starts = self.author_article_offsets[ids]
+            ends = self.author_article_offsets[ids + 1]
+            slices.extend(self.author_article_positions[s:e] for s, e in zip(starts, ends))
+        positions = np.unique(np.concatenate(slices)) if slices else np.array([], dtype=np.int32)
+        return positions, frozenset(author_ids)
+
+    def _matched_author_names(self, article: Dict, author_ids: frozenset) -> List[str]:
+        """Noms des auteurs de l'article appartenant à l'ensemble d'identifiants."""
+        matched = []
+        for article_author in article.get("authors", []):
+            author_name = article_author.get("name", "")
+            if not author_name:
+                continue
+            author_norm = self.author_normalized_names.get(author_name) or self.normalize_text(author_name)
+            if self.author_fuzzy_index.name_ids.get(author_norm) in author_ids:
+                matched.append(author_name)
+        return list(dict.fromkeys(matched))
+
+    @_request
     def find_matching_authors(self, query_authors: List[str], article_authors: List[Dict]) -> Tuple[bool, List[str]]:
         """Trouve les correspondances entre auteurs avec seuil de similarité ajustable."""
         if not query_authors or not article_authors:
             return False, []
         
-        matched_authors = []
-        
-        for query_author in query_authors:
-            query_norm = self.normalize_text(query_author)
-            
-            for article_author in article_authors:
-                author_name = article_author.get("name", "")
-                if not author_name:
-                    continue
-                    
-                author_norm = self.normalize_text(author_name)
-                
-                # Correspondance exacte
-                if query_norm == author_norm:
-                    matched_authors.append(author_name)
-                    continue
-                
-                # Un terme contient l'autre
-                if query_norm in author_norm or author_norm in query_norm:
-                    matched_authors.append(author_name)
-                    continue
-                
-                # Similarité élevée
-                similarity = SequenceMatcher(None, query_norm, author_norm).ratio()
-                if similarity >= 0.8:
-                    matched_authors.append(author_name)
-                    continue
-                
-                # Correspondance du dernier nom (nom de famille)
-                query_parts = query_norm.split()
-                author_parts = author_norm.split()
-                if len(query_parts) > 1 and len(author_parts) > 1:
-                    if query_parts[-1] == author_parts[-1]:  # Même nom de famille
-                        matched_authors.append(author_name)
-        
-        return len(matched_authors) > 0, list(set(matched_authors))
+        author_ids = frozenset().union(
+            *(self._matching_author_ids(self.normalize_text(q))[1] for q in query_authors))
+        matched_authors = self._matched_author_names({'authors': article_authors}, author_ids)
+        return len(matched_authors) > 0, matched_authors
 
+    @_request
     def search_by_author(self, author_name: str, top_k: int = 10) -> List[Dict]:
         """Recherche directe par nom d'auteur en utilisant le mapping pré-calculé."""
         normalized_name = self.normalize_text(author_name)
-        article_indices = self.author_articles_map.get(normalized_name, [])
+        article_indices = self._author_articles(normalized_name)
         
         results = []
         for idx in article_indices[:top_k]:
@@ -268,110 +802,429 @@ class EnhancedArticleSearcher:
         
         return results
 
-    def search(self, query: str, top_k: int = 10, search_pool_multiplier: int = 3) -> Dict[str, Any]:
+    def _vector_search(self, query_embeddings: np.ndarray, search_pool: int,
+                       field_weights: Optional[Dict[str, float]] = None,
+                       params: Optional[faiss.SearchParameters] = None) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Fonction de recherche principale améliorée avec gestion des années et recherche directe par auteur.
+        Recherche les plus proches voisins d'un lot de requêtes, éventuellement sur plusieurs champs.
+        Avec field_weights (ex: {'title': 0.3, 'abstract': 0.7}), chaque index de champ
+        est interrogé et les distances sont combinées par moyenne pondérée. Un article
+        absent du pool d'un champ reçoit la pire distance de ce pool.
         """
-        if not query.strip():
-            return {'results': [], 'search_info': {'type': 'empty'}}
+        if not field_weights:
+            return self.index.search(query_embeddings, search_pool, params=params)
         
-        # Analyse la requête
-        search_info = self.detect_search_type(query)
+        weights = {field: w for field, w in field_weights.items() if w > 0}
+        missing = set(weights) - set(self.field_indexes)
+        if missing:
+            raise ValueError(f"Index de champ non disponible: {', '.join(sorted(missing))}")
         
-        # Recherche directe par auteur si type 'author' avec haute confiance
-        if search_info['type'] == 'author' and search_info['confidence'] >= 0.8:
-            author_results = []
-            for author in search_info['authors']:
-                author_results.extend(self.search_by_author(author, top_k))
-            
-            # Trie par date (plus récent d'abord)
-            author_results.sort(key=lambda x: x['article'].get('published_date', ''), reverse=True)
+        field_results = {field: self.field_indexes[field].search(query_embeddings, search_pool, params=params)
+                         for field in weights}
+        total_weight = sum(weights.values())
+        
+        # Lignes complétées par (-1, inf) quand l'union des champs est plus petite que le pool
+        distances = np.full((len(query_embeddings), search_pool), np.inf, dtype="float32")
+        indices = np.full((len(query_embeddings), search_pool), -1, dtype="int64")
+        for row in range(len(query_embeddings)):
+            field_hits = {}
+            for field, (field_distances, field_indices) in field_results.items():
+                hits = {int(i): float(d) for d, i in zip(field_distances[row], field_indices[row]) if i >= 0}
+                field_hits[field] = (hits, max(hits.values()) if hits else 0.0)
             
-            return {
-                'results': author_results[:top_k],
-                'search_info': search_info,
-                'total_matches': len(author_results)
+            candidates = set().union(*(hits for hits, _ in field_hits.values()))
+            scores = {
+                idx: sum(w * field_hits[f][0].get(idx, field_hits[f][1]) for f, w in weights.items()) / total_weight
+                for idx in candidates
             }
+            best = sorted(scores.items(), key=lambda x: x[1])[:search_pool]
+            distances[row, :len(best)] = [d for _, d in best]
+            indices[row, :len(best)] = [i for i, _ in best]
+        return distances, indices
+
+    def _filter_mask(self, year_filter: Optional[str], categories: Optional[List[str]]) -> Optional[np.ndarray]:
+        """Masque booléen des articles respectant les filtres année et catégories (None sans filtre)."""
+        if not year_filter and not categories:
+            return None
         
-        # Vectorisation de la requête
-        search_query = search_info['keywords'] if search_info['keywords'] else query
-        query_embedding = self.model.encode([search_query])
-        query_embedding = np.array(query_embedding).astype("float32")
+        mask = np.ones(len(self.metadata), dtype=bool)
+        if year_filter:
+            start, end = self._year_range(year_filter)
+            mask &= (self.article_years >= start) & (self.article_years <= end)
+        if categories:
+            category_mask = np.zeros(len(self.metadata), dtype=bool)
+            for category in categories:
+                category_mask[self.category_positions.get(category, [])] = True
+            mask &= category_mask
+        return mask
+
+    def _filtered_vector_search(self, query_embeddings: np.ndarray, search_pool: int,
+                                field_weights: Optional[Dict[str, float]],
+                                mask: Optional[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Recherche vectorielle restreinte aux articles du masque.
+        FAISS ne parcourt que les articles sélectionnés (IDSelectorBitmap), si bien que les
+        filtres étroits renvoient quand même un pool complet. Si l'index ne supporte pas
+        les sélecteurs, le pool est élargi progressivement puis filtré.
+        """
+        if mask is None:
+            return self._vector_search(query_embeddings, search_pool, field_weights)
         
-        # Recherche dans l'index
-        search_pool = top_k * search_pool_multiplier
-        distances, indices = self.index.search(query_embedding, search_pool)
+        selected = int(mask.sum())
+        if selected == 0:
+            return (np.full((len(query_embeddings), search_pool), np.inf, dtype="float32"),
+                    np.full((len(query_embeddings), search_pool), -1, dtype="int64"))
         
-        # Traitement des résultats
-        results = []
-        author_matched = []
-        other_relevant = []
+        bitmap = np.packbits(mask, bitorder='little')
+        try:
+            selector = faiss.IDSelectorBitmap(len(mask), faiss.swig_ptr(bitmap))
+            return self._vector_search(query_embeddings, search_pool, field_weights,
+                                       faiss.SearchParameters(sel=selector))
+        except (AttributeError, RuntimeError, TypeError):
+            pass
         
-        for dist, idx in zip(distances[0], indices[0]):
-            if 0 <= idx < len(self.metadata):
-                article = self.metadata[idx]
-                relevance_score = max(0, (1 - dist) * 100)
-                
-                # Filtrage par année si spécifié
-                if search_info['year_filter']:
-                    article_year = article.get('published_date', '')[:4]
-                    if not self._matches_year_filter(article_year, search_info['year_filter']):
-                        continue
-                
-                article_info = {
-                    'article': article,
-                    'relevance': relevance_score,
-                    'matched_authors': []
-                }
-                
-                # Filtre par auteur si nécessaire
-                if search_info['authors']:
-                    has_match, matched = self.find_matching_authors(
-                        search_info['authors'], 
-                        article.get('authors', [])
-                    )
-                    
-                    if has_match:
-                        article_info['matched_authors'] = matched
-                        article_info['relevance'] = min(100, relevance_score * 1.2)  # Boost pour correspondance auteur
-                        author_matched.append(article_info)
+        # Repli : pool élargi par paliers jusqu'à obtenir assez d'articles autorisés
+        wanted = min(search_pool, selected)
+        pool = search_pool
+        while True:
+            distances, indices = self._vector_search(query_embeddings, pool, field_weights)
+            allowed = (indices >= 0) & mask[np.clip(indices, 0, None)]
+            if allowed.sum(axis=1).min() >= wanted or pool >= self.index.ntotal:
+                break
+            pool = min(pool * 4, self.index.ntotal)
+        
+        filtered_distances = np.full((len(query_embeddings), search_pool), np.inf, dtype="float32")
+        filtered_indices = np.full((len(query_embeddings), search_pool), -1, dtype="int64")
+        for row in range(len(query_embeddings)):
+            keep = np.flatnonzero(allowed[row])[:search_pool]
+            filtered_distances[row, :len(keep)] = distances[row, keep]
+            filtered_indices[row, :len(keep)] = indices[row, keep]
+        return filtered_distances, filtered_indices
+
+    def _fuse_lexical(self, query_embedding: np.ndarray, distances: np.ndarray, indices: np.ndarray,
+                      lexical_positions: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Fusionne le pool vectoriel et le classement BM25 d'une requête par Reciprocal Rank Fusion.
+        Retourne (distances, positions, scores RRF) dans l'ordre fusionné. La distance des
+        articles trouvés uniquement par BM25 est recalculée depuis leur vecteur dans l'index
+        (ou, si l'index ne permet pas la reconstruction, fixée à la pire distance du pool).
+        """
+        valid = indices >= 0
+        vector_positions = indices[valid]
+        fused = reciprocal_rank_fusion([vector_positions, lexical_positions])
+        positions = np.array([pos for pos, _ in fused], dtype=np.int64)
+        scores = np.array([score for _, score in fused], dtype=np.float32)
+        
+        known = dict(zip(vector_positions.tolist(), distances[valid].tolist()))
+        missing = [pos for pos in positions.tolist() if pos not in known]
+        if missing:
+            try:
+                vectors = self.index.reconstruct_batch(np.array(missing, dtype=np.int64))
+                missing_distances = ((vectors - query_embedding) ** 2).sum(axis=1)
+            except RuntimeError:
+                worst = max(known.values()) if known else 1.0
+                missing_distances = [worst] * len(missing)
+            known.update(zip(missing, (float(d) for d in missing_distances)))
+        
+        fused_distances = np.array([known[pos] for pos in positions.tolist()], dtype=np.float32)
+        return fused_distances, positions, scores
+
+    def search(self, query: str, top_k: int = 10, search_pool_multiplier: int = 3,
+               field_weights: Optional[Dict[str, float]] = None,
+               categories: Optional[List[str]] = None,
+               hybrid: Optional[bool] = None, rerank: Optional[bool] = None) -> Dict[str, Any]:
+        """
+        Fonction de recherche principale améliorée avec gestion des années et recherche directe par auteur.
+        field_weights permet de pondérer les index par champ ('title', 'abstract', 'fused').
+        categories restreint la recherche vectorielle aux articles de ces catégories.
+        hybrid fusionne les résultats vectoriels et BM25 (par défaut si l'index BM25 est chargé).
+        rerank re-classe les premiers candidats par cross-encoder (par défaut si un re-classeur est chargé).
+        """
+        return self.search_many([query], top_k, search_pool_multiplier, field_weights, categories,
+                                hybrid, rerank)[0]
+
+    def search_page(self, query: str, offset: int = 0, limit: int = 10,
+                    max_results: int = PAGE_POOL_SIZE, **options) -> Dict[str, Any]:
+        """
+        Recherche paginée : les max_results meilleurs candidats sont classés une fois
+        et gardés dans le cache de résultats, chaque page n'en est qu'une tranche.
+        next_offset sert de curseur pour la page suivante (None en fin de liste).
+        Les autres options sont celles de search.
+        """
+        return paginate(self.search(query, top_k=max_results, **options), offset, limit)
+
+    @_request
+    def search_many(self, queries: List[str], top_k: int = 10, search_pool_multiplier: int = 3,
+                    field_weights: Optional[Dict[str, float]] = None,
+                    categories: Optional[List[str]] = None,
+                    hybrid: Optional[bool] = None, rerank: Optional[bool] = None) -> List[Dict[str, Any]]:
+        """
+        Recherche un lot de requêtes : analyse de chaque requête, une seule vectorisation
+        batchée et une seule recherche FAISS pour tout le lot, puis filtres année/auteur
+        appliqués requête par requête. Retourne un résultat par requête, dans l'ordre.
+        Les requêtes déjà vues (après normalisation) sont servies depuis le cache.
+        En mode hybride, le pool de chaque requête est fusionné (RRF) avec les meilleurs
+        articles BM25 respectant les mêmes filtres. Avec le re-classement, les premiers
+        candidats de toutes les requêtes sont notés en un seul lot par le cross-encoder.
+        Chaque étape est chronométrée dans self.metrics.
+        """
+        self.metrics.count('queries', len(queries))
+        with self.metrics.profiled('search_many'), self.metrics.stage('search'):
+            return self._search_many(queries, top_k, search_pool_multiplier, field_weights, categories,
+                                     hybrid, rerank)
+
+    def _search_many(self, queries: List[str], top_k: int, search_pool_multiplier: int,
+                     field_weights: Optional[Dict[str, float]], categories: Optional[List[str]],
+                     hybrid: Optional[bool], rerank: Optional[bool]) -> List[Dict[str, Any]]:
+        if hybrid is None:
+            hybrid = self.lexical_index is not None
+        elif hybrid and self.lexical_index is None:
+            raise ValueError("Recherche hybride indisponible: index BM25 non chargé (main_create_index.py --lexical)")
+        if rerank is None:
+            rerank = self.reranker is not None
+        elif rerank and self.reranker is None:
+            raise ValueError("Re-classement indisponible: aucun modèle cross-encoder chargé (reranker_model)")
+        
+        responses = [None] * len(queries)
+        pending = []
+        cache_keys = {}
+        
+        for position, query in enumerate(queries):
+            if not query.strip():
+                responses[position] = {'results': [], 'search_info': {'type': 'empty'}}
+                continue
+            
+            # L'analyse dépend de la casse (noms propres) : la clé garde la requête telle quelle
+            cache_keys[position] = (' '.join(query.split()), top_k, search_pool_multiplier,
+                                    tuple(sorted(field_weights.items())) if field_weights else None,
+                                    tuple(sorted(categories)) if categories else None, hybrid, rerank)
+            cached = self.result_cache.get(cache_keys[position])
+            if cached is not None:
+                self.metrics.count('result_cache_hits')
+                responses[position] = self._expand_response(cached)
+                del cache_keys[position]
+                continue
+            
+            # Analyse la requête
+            with self.metrics.stage('parse'):
+                search_info = self.detect_search_type(query)
+            
+            # Recherche directe par auteur si type 'author' avec haute confiance
+            if search_info['type'] == 'author' and search_info['confidence'] >= 0.8:
+                self.metrics.count('author_direct')
+                with self.metrics.stage('author_direct'):
+                    responses[position] = self._search_authors_directly(search_info, top_k)
+                continue
+            
+            search_query = search_info['keywords'] if search_info['keywords'] else query
+            pending.append((position, search_info, search_query))
+        
+        if pending:
+            # Vectorisation pour tout le lot, puis une recherche FAISS par filtre année distinct
+            with self.metrics.stage('encode'):
+                query_embeddings = self._encode_queries([search_query for _, _, search_query in pending])
+            search_pool = top_k * search_pool_multiplier
+            # Le re-classeur a besoin de ses top_n candidats, tronqués à top_k ensuite
+            rank_k = max(top_k, self.reranker.top_n) if rerank else top_k
+            
+            rows_by_filter = defaultdict(list)
+            for row, (_, search_info, _) in enumerate(pending):
+                rows_by_filter[search_info['year_filter']].append(row)
+            
+            for year_filter, rows in rows_by_filter.items():
+                mask = self._filter_mask(year_filter, categories)
+                with self.metrics.stage('faiss'):
+                    distances, indices = self._filtered_vector_search(
+                        query_embeddings[rows], search_pool, field_weights, mask)
+                for i, row in enumerate(rows):
+                    position, search_info, search_query = pending[row]
+                    if hybrid:
+                        with self.metrics.stage('lexical'):
+                            lexical_positions, _ = self.lexical_index.search(search_query, search_pool, mask)
+                            row_distances, row_indices, order = self._fuse_lexical(
+                                query_embeddings[row], distances[i], indices[i], lexical_positions)
+                        responses[position] = self._rank_candidates(
+                            search_info, row_distances, row_indices, rank_k, order)
                     else:
-                        other_relevant.append(article_info)
-                else:
-                    results.append(article_info)
+                        responses[position] = self._rank_candidates(search_info, distances[i], indices[i], rank_k)
+            
+            if rerank:
+                with self.metrics.stage('rerank'):
+                    self._rerank_responses([responses[position] for position, _, _ in pending],
+                                           [queries[position] for position, _, _ in pending], top_k)
+                self.metrics.count('rerank_skipped',
+                                   sum(responses[position].get('reranked') is False for position, _, _ in pending))
+        
+        for position, key in cache_keys.items():
+            # Une réponse dont le re-classement a été sauté (budget) n'est pas mise en cache
+            if responses[position].get('reranked') is False:
+                continue
+            self.result_cache.put(key, self._compact_response(responses[position]))
         
-        # Combine et trie les résultats
+        return responses
+
+    def _rerank_responses(self, responses: List[Dict[str, Any]], queries: List[str], top_k: int):
+        """
+        Re-classe sur place les premiers résultats de chaque réponse avec le cross-encoder,
+        qui reçoit la requête telle que saisie (casse et accents comptent pour lui).
+        La pertinence affichée devient le score du cross-encoder (sur 100) ; les articles
+        des auteurs recherchés restent en tête. Si le budget de latence est dépassé, le
+        classement vectoriel est conservé et la réponse marquée 'reranked': False.
+        """
+        scores = self.reranker.score_many(
+            [' '.join(q.split()) for q in queries],
+            [[r['article'] for r in response['results']] for response in responses])
+        
+        for response, row_scores in zip(responses, scores):
+            results = response['results']
+            response['reranked'] = row_scores is not None
+            if row_scores is not None:
+                head = results[:len(row_scores)]
+                for result, score in zip(head, row_scores):
+                    result['relevance'] = self.reranker.to_relevance(float(score))
+                order = sorted(range(len(head)), key=lambda i: (not head[i]['matched_authors'], -row_scores[i]))
+                results = [head[i] for i in order] + results[len(head):]
+            response['results'] = results[:top_k]
+
+    def _normalize_query(self, query: str) -> str:
+        """Clé du cache des vecteurs : requête normalisée (casse, accents), espaces multiples réduits."""
+        return ' '.join(self.normalize_text(query).split())
+
+    def _encode_queries(self, queries: List[str]) -> np.ndarray:
+        """Vectorise un lot de requêtes en ne calculant que celles absentes du cache."""
+        keys = [self._normalize_query(q) for q in queries]
+        embeddings = [self.embedding_cache.get(key) for key in keys]
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        
+        if missing:
+            encoded = np.array(self.model.encode([queries[i] for i in missing])).astype("float32")
+            for i, embedding in zip(missing, encoded):
+                embeddings[i] = embedding
+                self.embedding_cache.put(keys[i], embedding)
+        
+        return np.vstack(embeddings).astype("float32")
+
+    def _compact_response(self, response: Dict[str, Any]) -> Dict[str, Any]:
+        """Version compacte d'une réponse pour le cache : positions des articles au lieu des articles."""
+        compact = {key: value for key, value in response.items() if key != 'results'}
+        compact['results'] = tuple(
+            (self.article_positions[r['article'].get('arxiv_id')], r['relevance'], tuple(r['matched_authors']))
+            for r in response['results']
+        )
+        return compact
+
+    def _expand_response(self, compact: Dict[str, Any]) -> Dict[str, Any]:
+        """Reconstruit une réponse complète depuis sa version en cache."""
+        response = {key: value for key, value in compact.items() if key != 'results'}
+        response['search_info'] = dict(compact['search_info'], authors=list(compact['search_info']['authors']))
+        response['results'] = [
+            {'article': self.metadata[idx], 'relevance': relevance, 'matched_authors': list(matched)}
+            for idx, relevance, matched in compact['results']
+        ]
+        return response
+
+    def clear_caches(self):
+        """Vide les caches de vecteurs et de résultats (appelé à chaque rechargement)."""
+        self.embedding_cache.clear()
+        self.result_cache.clear()
+        self._author_match_cache.clear()
+        if self._reranker is not None:
+            self._reranker.score_cache.clear()
+
+    def cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Compteurs hits/misses des caches."""
+        return {'embeddings': self.embedding_cache.stats(), 'results': self.result_cache.stats()}
+
+    def _search_authors_directly(self, search_info: Dict[str, Any], top_k: int) -> Dict[str, Any]:
+        """Résultats d'une requête de type 'author' à partir du mapping auteur -> articles."""
+        author_results = []
+        for author in search_info['authors']:
+            author_results.extend(self.search_by_author(author, top_k))
+        
+        # Trie par date (plus récent d'abord)
+        author_results.sort(key=lambda x: x['article'].get('published_date', ''), reverse=True)
+        
+        return {
+            'results': author_results[:top_k],
+            'search_info': search_info,
+            'total_matches': len(author_results)
+        }
+
+    def _rank_candidates(self, search_info: Dict[str, Any], distances: np.ndarray,
+                         indices: np.ndarray, top_k: int,
+                         order_scores: Optional[np.ndarray] = None) -> Dict[str, Any]:
+        """
+        Filtre (année, auteur) et trie les voisins FAISS d'une requête.
+        Tout le pool est traité sur des tableaux NumPy : masque d'années sur la colonne
+        précalculée, appartenance aux articles des auteurs correspondants, puis un seul
+        argpartition pour le top-k. Seuls les top_k résultats sont convertis en dicts.
+        order_scores (ex: scores RRF de la recherche hybride) remplace la pertinence
+        comme critère de tri ; les correspondances d'auteur restent prioritaires.
+        """
+        with self.metrics.stage('filter'):
+            valid = (indices >= 0) & (indices < len(self.metadata))
+            positions = indices[valid]
+            relevance = np.maximum(0, (1 - distances[valid]) * 100)
+            order = relevance if order_scores is None else order_scores[valid]
+            
+            # Filtrage par année si spécifié
+            if search_info['year_filter']:
+                start, end = self._year_range(search_info['year_filter'])
+                years = self.article_years[positions]
+                keep = (years >= start) & (years <= end)
+                positions, relevance, order = positions[keep], relevance[keep], order[keep]
+        
+        # Correspondance d'auteurs : boost de pertinence et priorité dans le classement
+        has_match = np.zeros(len(positions), dtype=bool)
+        author_ids = frozenset()
         if search_info['authors']:
-            # Priorité aux correspondances d'auteurs
-            results = sorted(author_matched, key=lambda x: x['relevance'], reverse=True)[:top_k]
-            if len(results) < top_k:
-                remaining_slots = top_k - len(results)
-                results.extend(sorted(other_relevant, key=lambda x: x['relevance'], reverse=True)[:remaining_slots])
-        else:
-            results = sorted(results, key=lambda x: x['relevance'], reverse=True)[:top_k]
+            with self.metrics.stage('author_match'):
+                author_positions, author_ids = self._matching_article_positions(search_info['authors'])
+                has_match = np.isin(positions, author_positions)
+                relevance = np.where(has_match, np.minimum(100, relevance * 1.2), relevance)
+        
+        with self.metrics.stage('assemble'):
+            score = (relevance if order_scores is None else order) + has_match * 1000.0
+            k = min(top_k, len(score))
+            top = np.argpartition(-score, k - 1)[:k] if 0 < k < len(score) else np.arange(k)
+            top = top[np.lexsort((top, -score[top]))]
+            
+            results = []
+            for i in top:
+                article = self.metadata[positions[i]]
+                results.append({
+                    'article': article,
+                    'relevance': float(relevance[i]),
+                    'matched_authors': self._matched_author_names(article, author_ids) if has_match[i] else []
+                })
         
+        total_author_matches = int(has_match.sum())
         return {
             'results': results,
             'search_info': search_info,
-            'total_author_matches': len(author_matched) if search_info['authors'] else 0,
-            'total_other': len(other_relevant) if search_info['authors'] else 0
+            'total_author_matches': total_author_matches if search_info['authors'] else 0,
+            'total_other': len(positions) - total_author_matches if search_info['authors'] else 0
         }
 
-    def _matches_year_filter(self, article_year: str, year_filter: str) -> bool:
-        """Vérifie si l'année de l'article correspond au filtre."""
-        if not article_year or not article_year.isdigit():
-            return False
-        
+    def _year_range(self, year_filter: str) -> Tuple[int, int]:
+        """Convertit un filtre année ('2020' ou '2015-2020') en bornes incluses."""
         if '-' in year_filter:
             start, end = year_filter.split('-')
-            return start <= article_year <= end
-        else:
-            return article_year == year_filter
+            return int(start), int(end)
+        return int(year_filter), int(year_filter)
 
+    @_request
+    def get_articles(self, article_ids: List[str]) -> List[Optional[Dict]]:
+        """Articles correspondant aux identifiants arXiv, dans l'ordre (None si inconnu)."""
+        positions = self.article_positions
+        return [self.metadata[positions[article_id]] if article_id in positions else None
+                for article_id in article_ids]
+
+    @_request
     def get_articles_by_author(self, author_name: str, limit: int = 10) -> List[Dict]:
         """Retourne tous les articles d'un auteur spécifique."""
         normalized_name = self.normalize_text(author_name)
-        article_indices = self.author_articles_map.get(normalized_name, [])
+        article_indices = self._author_articles(normalized_name)
         
         articles = []
         for idx in article_indices[:limit]:
@@ -382,49 +1235,34 @@ class EnhancedArticleSearcher:
         
         return articles
 
+    @_request
     def get_author_stats(self, author_name: str) -> Dict[str, Any]:
-        """Retourne des statistiques pour un auteur spécifique."""
-        normalized_name = self.normalize_text(author_name)
-        article_indices = self.author_articles_map.get(normalized_name, [])
-        
-        if not article_indices:
+        """
+        Retourne des statistiques pour un auteur spécifique, lues dans les tableaux
+        précalculés au chargement (voir _build_derived_maps). 'coauthors' ne contient
+        que les STATS_TOP_K principaux co-auteurs.
+        """
+        author_id = self.author_fuzzy_index.name_ids.get(self.normalize_text(author_name))
+        if author_id is None or not self.author_article_counts[author_id]:
             return None
         
-        stats = {
+        start, end = self.author_category_offsets[author_id], self.author_category_offsets[author_id + 1]
+        categories = [(self.category_names[c], int(n)) for c, n in
+                      zip(self.author_category_ids[start:end], self.author_category_counts[start:end])]
+        coauthors = [(self.author_display_names.values[a], int(n))
+                     for a, n in zip(self.author_coauthor_ids[author_id], self.author_coauthor_counts[author_id]) if a >= 0]
+        first, last = int(self.author_first_years[author_id]), int(self.author_last_years[author_id])
+        
+        return {
             'author_name': author_name,
-            'total_articles': len(article_indices),
-            'first_publication': None,
-            'last_publication': None,
-            'categories': defaultdict(int),
-            'coauthors': defaultdict(int)
+            'total_articles': int(self.author_article_counts[author_id]),
+            'first_publication': str(first) if first else None,
+            'last_publication': str(last) if last else None,
+            'categories': dict(categories),
+            'coauthors': dict(coauthors),
+            'top_categories': categories[:STATS_TOP_K],
+            'top_coauthors': coauthors,
         }
-        
-        years = []
-        for idx in article_indices:
-            article = self.metadata[idx]
-            year = article.get('published_date', '')[:4]
-            if year:
-                years.append(year)
-            
-            # Catégories
-            for cat in article.get('categories', []):
-                stats['categories'][cat] += 1
-            
-            # Co-auteurs
-            for author in article.get('authors', []):
-                coauthor_name = author.get('name', '')
-                if coauthor_name and self.normalize_text(coauthor_name) != normalized_name:
-                    stats['coauthors'][coauthor_name] += 1
-        
-        if years:
-            stats['first_publication'] = min(years)
-            stats['last_publication'] = max(years)
-        
-        # Trie les catégories et coauteurs par fréquence
-        stats['top_categories'] = sorted(stats['categories'].items(), key=lambda x: x[1], reverse=True)[:5]
-        stats['top_coauthors'] = sorted(stats['coauthors'].items(), key=lambda x: x[1], reverse=True)[:5]
-        
-        return stats
 
     def display_results(self, search_result: Dict[str, Any]):
         """Affiche les résultats de manière formatée avec plus d'informations."""
@@ -507,38 +1345,34 @@ class EnhancedArticleSearcher:
         print(f"\n💡 Suggestions d'auteurs similaires:")
         
         for query_author in query_authors:
-            suggestions = []
-            query_norm = self.normalize_text(query_author)
-            
-            # Vérifie d'abord les correspondances partielles dans les noms indexés
-            for author in self.all_authors_cache:
-                author_norm = self.normalize_text(author)
-                
-                # Correspondance sur le nom de famille
-                query_last = query_norm.split()[-1] if ' ' in query_norm else query_norm
-                author_last = author_norm.split()[-1] if ' ' in author_norm else author_norm
-                
-                if query_last == author_last:
-                    suggestions.append((author, 1.0))
-                    continue
-                
-                # Similarité élevée
-                similarity = SequenceMatcher(None, query_norm, author_norm).ratio()
-                if similarity >= 0.6:
-                    suggestions.append((author, similarity))
-            
-            # Trie et affiche
-            suggestions.sort(key=lambda x: x[1], reverse=True)
+            suggestions = self.similar_authors(query_author)
             
             if suggestions:
                 print(f"   Pour '{query_author}':")
-                for author, sim in suggestions[:5]:
+                for author, sim in suggestions:
                     print(f"     - {author} ({sim*100:.0f}% similarité)")
                     # Affiche le nombre d'articles pour aider
-                    norm_name = self.normalize_text(author)
-                    count = len(self.author_articles_map.get(norm_name, []))
+                    norm_name = self.author_normalized_names[author]
+                    count = len(self._author_articles(norm_name))
                     print(f"       ({count} articles)")
 
+    @_request
+    def similar_authors(self, query_author: str, k: int = 5) -> List[Tuple[str, float]]:
+        """
+        Top-k des auteurs proches d'un nom : même nom de famille (score 1.0) puis
+        similarité >= 0.6, via l'index flou plutôt qu'un parcours de tous les auteurs.
+        """
+        query_norm = self.normalize_text(query_author)
+        if not query_norm:
+            return []
+        
+        scores = {name: 1.0 for name in self.author_fuzzy_index.same_last_name(query_norm)[:k]}
+        for name, similarity in self.author_fuzzy_index.similar(query_norm, k=k, min_score=0.6):
+            scores.setdefault(name, similarity)
+        
+        suggestions = sorted(scores.items(), key=lambda x: x[1], reverse=True)[:k]
+        return [(self.author_display_names[name], score) for name, score in suggestions]
+
     def interactive_search(self):
         """Mode de recherche interactive amélioré."""
         print("\n🚀 === Moteur de Recherche d'Articles Scientifiques Amélioré ===")
@@ -646,26 +1480,22 @@ class EnhancedArticleSearcher:
         print(f"\n📊 === Statistiques Complètes de la Base ===")
         print(f"   📚 Total articles: {len(self.metadata)}")
         print(f"   👥 Total auteurs uniques: {len(self.all_authors_cache)}")
-        print(f"   🏷️  Total catégories uniques: {len(self.category_map)}")
-        
-        # Auteurs les plus prolifiques
-        prolific_authors = sorted(
-            [(author, len(articles)) for author, articles in self.author_articles_map.items()],
-            key=lambda x: x[1], reverse=True
-        )[:5]
+        print(f"   🏷️  Total catégories uniques: {len(self.category_names)}")
+        self.startup_report()
+        for name, stats in self.cache_stats().items():
+            print(f"   🗃️  Cache {name}: {stats['hits']} hits / {stats['misses']} misses ({stats['size']}/{stats['maxsize']})")
+        if self._reranker is not None:
+            stats = self._reranker.stats()
+            print(f"   🎯 Re-classement: {stats['batches']} lots, {stats['skipped']} sautés (budget), "
+                  f"{stats['ms_per_pair']:.2f} ms/paire")
         
+        # Classements précalculés au chargement
         print("\n🏆 Auteurs les plus prolifiques:")
-        for author, count in prolific_authors:
+        for author, count in self.prolific_authors:
             print(f"   • {author}: {count} articles")
         
-        # Catégories les plus populaires
-        popular_categories = sorted(
-            [(cat, len(articles)) for cat, articles in self.category_map.items()],
-            key=lambda x: x[1], reverse=True
-        )[:5]
-        
         print("\n🔥 Catégories les plus populaires:")
-        for cat, count in popular_categories:
+        for cat, count in self.popular_categories:
             print(f"   • {cat}: {count} articles")
 
 
@@ -675,7 +1505,7 @@ def main():
     metadata_path = "arxiv_metadata.json"
     
     try:
-        searcher = EnhancedArticleSearcher(index_path, metadata_path)
+        searcher = EnhancedArticleSearcher(index_path, metadata_path, mmap=True)
         searcher.interactive_search()
         
     except Exception as e:
@@ -29,6 +29,20 @@ PROJECT_CONFIG = {
     'log_dir': os.getenv('LOG_DIR', 'logs/')
 }
 
+# Configuration du service de recherche (search_service.py)
+SEARCH_SERVICE_CONFIG = {
+    'url': os.getenv('SEARCH_SERVICE_URL', 'http://127.0.0.1:8765'),
+    'timeout': float(os.getenv('SEARCH_SERVICE_TIMEOUT', 30))
+}
+
+# Mesures du moteur de recherche (durées par étape, profils cProfile échantillonnés)
+METRICS_CONFIG = {
+    'enabled': os.getenv('SEARCH_METRICS', '1') not in ('0', 'false', 'no'),
+    'window': int(os.getenv('SEARCH_METRICS_WINDOW', 10000)),
+    'profile_sample_rate': float(os.getenv('SEARCH_PROFILE_RATE', 0)),
+    'profile_dir': os.getenv('SEARCH_PROFILE_DIR', 'logs/profiles')
+}
+
 # Catégories ArXiv disponibles
 ARXIV_CATEGORIES = {
     'cs.AI': 'Computer Science - Artificial Intelligence',
@@ -0,0 +1,284 @@
+import bisect
+import json
+import mmap
+import os
+import shutil
+from collections.abc import Mapping, Sequence
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+DERIVED_MAPS_VERSION = 4
+
+
+def derived_maps_path(index_path: str) -> str:
+    """Dossier des tables dérivées d'un index (arxiv_index.faiss -> arxiv_index.derived/)."""
+    return f"{os.path.splitext(index_path)[0]}.derived"
+
+
+def save_derived_maps(path: str, build_id: str, arrays: Dict[str, np.ndarray],
+                      strings: Dict[str, List[str]]):
+    """
+    Écrit les tables dérivées d'une construction : un .npy par tableau (relu en
+    memory-map) et les listes de chaînes dans strings.json. Le dossier est écrit
+    sous un nom temporaire puis renommé, meta.json (build_id) en dernier.
+    """
+    tmp = f"{path}.tmp-{os.getpid()}"
+    shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(tmp)
+    for name, array in arrays.items():
+        np.save(os.path.join(tmp, f"{name}.npy"), np.ascontiguousarray(array))
+    with open(os.path.join(tmp, 'strings.json'), 'w', encoding='utf-8') as f:
+        json.dump(strings, f, ensure_ascii=False)
+    with open(os.path.join(tmp, 'meta.json'), 'w', encoding='utf-8') as f:
+        json.dump({'build_id': build_id, 'version': DERIVED_MAPS_VERSION, 'arrays': sorted(arrays)}, f)
+
+    old = f"{path}.old-{os.getpid()}"
+    if os.path.exists(path):
+        os.replace(path, old)
+    os.replace(tmp, path)
+    shutil.rmtree(old, ignore_errors=True)
+
+
+def pack_articles(articles: Iterable[Dict]) -> Dict[str, np.ndarray]:
+    """
+    Tableaux des métadonnées pour MappedArticles / ArticlePositions : articles en
+    JSON UTF-8 bout à bout (article_blob, article_offsets) et identifiants arXiv
+    triés avec la position de chaque article (article_ids, article_id_order).
+    """
+    chunks = []
+    ids = []
+    for article in articles:
+        chunks.append(json.dumps(article, ensure_ascii=False).encode('utf-8'))
+        ids.append((article.get('arxiv_id') or '').encode('utf-8'))
+    offsets = np.zeros(len(chunks) + 1, dtype=np.int64)
+    np.cumsum([len(chunk) for chunk in chunks], out=offsets[1:])
+    ids = np.array(ids, dtype=bytes) if ids else np.zeros(0, dtype='S1')
+    order = np.argsort(ids, kind='stable')
+    return {
+        'article_blob': np.frombuffer(b''.join(chunks), dtype=np.uint8),
+        'article_offsets': offsets,
+        'article_ids': ids[order],
+        'article_id_order': order.astype(np.int64),
+    }
+
+
+def pack_strings(prefix: str, strings: Iterable[str]) -> Dict[str, np.ndarray]:
+    """
+    Liste de chaînes pour MappedStrings : chaînes UTF-8 terminées par '\\n', bout
+    à bout ({prefix}_blob), et position de début de chacune ({prefix}_offsets).
+    """
+    chunks = [s.encode('utf-8') + b'\n' for s in strings]
+    offsets = np.zeros(len(chunks) + 1, dtype=np.int64)
+    np.cumsum([len(chunk) for chunk in chunks], out=offsets[1:])
+    return {
+        f'{prefix}_blob': np.frombuffer(b''.join(chunks), dtype=np.uint8),
+        f'{prefix}_offsets': offsets,
+    }
+
+
+def unpack_strings(arrays: Dict[str, np.ndarray], prefix: str) -> 'MappedStrings':
+    """Vue MappedStrings sur les tableaux écrits par pack_strings(prefix, ...)."""
+    return MappedStrings(arrays[f'{prefix}_blob'], arrays[f'{prefix}_offsets'])
+
+
+class MappedStrings(Sequence):
+    """
+    Liste de chaînes en lecture seule sur les tableaux de pack_strings : seule la
+    chaîne demandée est décodée. find_containing cherche une sous-chaîne dans tout
+    le blob sans le copier (mmap du fichier .npy quand il est ouvert en memory-map).
+    """
+
+    def __init__(self, blob: np.ndarray, offsets: np.ndarray):
+        self.blob = blob
+        self.offsets = offsets
+        if isinstance(blob, np.memmap) and blob.filename and len(blob):
+            # Ouvert tout de suite : le dossier des tables peut être remplacé ensuite
+            with open(blob.filename, 'rb') as f:
+                self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._base = blob.offset
+        else:
+            self._buffer = None
+            self._base = 0
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def raw(self, i: int) -> bytes:
+        """Chaîne i encodée en UTF-8, sans décodage."""
+        return self.blob[self.offsets[i]:self.offsets[i + 1] - 1].tobytes()
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        i = int(i)
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return self.raw(i).decode('utf-8')
+
+    def find_containing(self, substring: str) -> List[int]:
+        """Indices des chaînes contenant `substring`, dans l'ordre de la liste."""
+        needle = substring.encode('utf-8')
+        if not needle or b'\n' in needle or not len(self):
+            return []
+        if self._buffer is None:
+            self._buffer = self.blob.tobytes()
+        end = self._base + int(self.offsets[-1])
+        found = []
+        start = self._buffer.find(needle, self._base, end)
+        while start != -1:
+            i = int(np.searchsorted(self.offsets, start - self._base, side='right')) - 1
+            found.append(i)
+            # Chaîne suivante : une seule occurrence par chaîne
+            start = self._buffer.find(needle, self._base + int(self.offsets[i + 1]), end)
+        return found
+
+
+class RaggedRows(Sequence):
+    """Lignes de longueurs variables (format CSR) : ligne i = values[offsets[i]:offsets[i+1]]."""
+
+    def __init__(self, offsets: np.ndarray, values: np.ndarray):
+        self.offsets = offsets
+        self.values = values
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i) -> np.ndarray:
+        return self.values[self.offsets[i]:self.offsets[i + 1]]
+
+
+class IndirectValues(Sequence):
+    """Valeur i = values[ids[i]], ou None si ids[i] est négatif."""
+
+    def __init__(self, values: Sequence, ids: np.ndarray):
+        self.values = values
+        self.ids = ids
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, i):
+        value_id = int(self.ids[i])
+        return self.values[value_id] if value_id >= 0 else None
+
+
+class SortedStringMap(Mapping):
+    """
+    Chaîne -> valeur, par recherche dichotomique (bisect) dans des clés MappedStrings :
+    keys[order[i]] est la i-ème clé dans l'ordre des octets UTF-8 (order=None si les
+    clés sont déjà triées). La valeur de la clé en position p est values[p], ou p
+    lui-même si values est None.
+    """
+
+    def __init__(self, keys: MappedStrings, order: Optional[np.ndarray] = None,
+                 values: Optional[Sequence] = None):
+        self.keys = keys
+        self.order = order
+        self.values = values
+
+    def _position(self, i: int) -> int:
+        return i if self.order is None else int(self.order[i])
+
+    def _find(self, key) -> int:
+        if not isinstance(key, str):
+            return -1
+        target = key.encode('utf-8')
+        i = bisect.bisect_left(range(len(self.keys)), target, key=lambda j: self.keys.raw(self._position(j)))
+        if i < len(self.keys):
+            position = self._position(i)
+            if self.keys.raw(position) == target:
+                return position
+        return -1
+
+    def __getitem__(self, key):
+        position = self._find(key)
+        if position < 0:
+            raise KeyError(key)
+        return position if self.values is None else self.values[position]
+
+    def __contains__(self, key) -> bool:
+        return self._find(key) >= 0
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __iter__(self):
+        return (self.keys[self._position(i)] for i in range(len(self.keys)))
+
+
+class MappedArticles(Sequence):
+    """
+    Métadonnées en lecture seule sur les tableaux de pack_articles, ouverts en
+    memory-map : les pages sont partagées entre processus par le cache du système,
+    et seul l'article demandé est décodé (un nouveau dict à chaque accès).
+    """
+
+    def __init__(self, blob: np.ndarray, offsets: np.ndarray):
+        self.blob = blob
+        self.offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        i = int(i)
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return json.loads(self.blob[self.offsets[i]:self.offsets[i + 1]].tobytes())
+
+
+class ArticlePositions(Mapping):
+    """Identifiant arXiv -> position de l'article, par recherche dichotomique dans les identifiants triés."""
+
+    def __init__(self, sorted_ids: np.ndarray, order: np.ndarray):
+        self.sorted_ids = sorted_ids
+        self.order = order
+
+    def _find(self, article_id) -> int:
+        if not isinstance(article_id, str):
+            return -1
+        key = article_id.encode('utf-8')
+        i = int(np.searchsorted(self.sorted_ids, key))
+        if i < len(self.sorted_ids) and self.sorted_ids[i] == key:
+            return int(self.order[i])
+        return -1
+
+    def __getitem__(self, article_id) -> int:
+        position = self._find(article_id)
+        if position < 0:
+            raise KeyError(article_id)
+        return position
+
+    def __contains__(self, article_id) -> bool:
+        return self._find(article_id) >= 0
+
+    def __len__(self) -> int:
+        return len(self.sorted_ids)
+
+    def __iter__(self):
+        return (article_id.decode('utf-8') for article_id in self.sorted_ids)
+
+
+def load_derived_maps(path: str, build_id: str) -> Optional[Tuple[Dict[str, np.ndarray], Dict[str, List[str]]]]:
+    """
+    Relit les tables dérivées si elles correspondent à build_id (sinon None).
+    Les tableaux sont ouverts en memory-map, en lecture seule.
+    """
+    try:
+        with open(os.path.join(path, 'meta.json'), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get('build_id') != build_id or meta.get('version') != DERIVED_MAPS_VERSION:
+            return None
+        arrays = {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode='r') for name in meta['arrays']}
+        with open(os.path.join(path, 'strings.json'), 'r', encoding='utf-8') as f:
+            strings = json.load(f)
+    except (OSError, ValueError, KeyError):
+        return None
+    return arrays, strings
@@ -1,8 +1,66 @@
 # main_create_index.py
 
-from semantic_indexer import SemanticIndexer
+import argparse
+
+from semantic_indexer import SemanticIndexer, build_shards, rebuild_shard
 
 if __name__ == "__main__":
-    json_path = "data/extraction_results_20250718_201624.json"  # adapte selon ton fichier
-    indexer = SemanticIndexer()
-    indexer.index_from_json(json_path)
+    parser = argparse.ArgumentParser(description="Création de l'index sémantique FAISS")
+    parser.add_argument('--json-path', default="data/extraction_results_20250718_201624.json",
+                        help="Fichier d'extraction (.json ou .jsonl)")  # adapte selon ton fichier
+    parser.add_argument('--streaming', action='store_true',
+                        help="Vectorisation par blocs avec mémoire bornée")
+    parser.add_argument('--chunk-size', type=int, default=2048,
+                        help="Nombre d'articles par bloc en mode streaming")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Nombre de processus CPU pour la vectorisation (défaut: tous les cœurs)")
+    parser.add_argument('--index-type', choices=['flat', 'fp16', 'sq8'], default='flat',
+                        help="Stockage des vecteurs: float32 brut, float16 ou int8 (scalar quantizer)")
+    parser.add_argument('--multi-field', action='store_true',
+                        help="Construit aussi un index des titres (arxiv_index.<build_id>_title.faiss)")
+    parser.add_argument('--fused-title-weight', type=float, default=None,
+                        help="Construit en plus un index fusionné titre/résumé avec ce poids de titre (0-1)")
+    parser.add_argument('--lexical', action='store_true',
+                        help="Construit aussi l'index lexical BM25 (arxiv_index.<build_id>.bm25.npz)")
+    parser.add_argument('--shard-by', choices=['primary_category', 'year', 'hash'],
+                        help="Construit un index par shard au lieu d'un index unique")
+    parser.add_argument('--num-shards', type=int, default=None,
+                        help="Nombre de shards pour --shard-by hash")
+    parser.add_argument('--shard-dir', default='shards', help="Dossier des shards")
+    parser.add_argument('--rebuild-shard', default=None,
+                        help="Reconstruit uniquement ce shard (ex: cs.LG)")
+    args = parser.parse_args()
+
+    if args.shard_by or args.rebuild_shard:
+        # Les shards n'ont qu'un index des résumés, construit en une fois par shard
+        unsupported = [flag for flag, value in (('--multi-field', args.multi_field),
+                                                ('--fused-title-weight', args.fused_title_weight is not None),
+                                                ('--lexical', args.lexical),
+                                                ('--streaming', args.streaming)) if value]
+        if unsupported:
+            parser.error(f"{', '.join(unsupported)} incompatible(s) avec --shard-by / --rebuild-shard")
+
+    if args.rebuild_shard:
+        rebuild_shard(args.json_path, args.rebuild_shard, shard_dir=args.shard_dir,
+                      max_workers=args.workers)
+        raise SystemExit(0)
+    if args.shard_by:
+        build_shards(args.json_path, shard_dir=args.shard_dir, by=args.shard_by,
+                     num_shards=args.num_shards, max_workers=args.workers,
+                     index_type=args.index_type)
+        raise SystemExit(0)
+
+
+    fused_weights = None
+    if args.fused_title_weight is not None:
+        fused_weights = {'title': args.fused_title_weight, 'abstract': 1 - args.fused_title_weight}
+    multi_field = args.multi_field or fused_weights is not None
+
+    indexer = SemanticIndexer(index_type=args.index_type)
+    if args.streaming:
+        indexer.index_from_json_streaming(args.json_path, chunk_size=args.chunk_size,
+                                          num_workers=args.workers, multi_field=multi_field,
+                                          fused_weights=fused_weights, lexical=args.lexical)
+    else:
+        indexer.index_from_json(args.json_path, multi_field=multi_field, fused_weights=fused_weights,
+                                lexical=args.lexical)
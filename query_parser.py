@@ -0,0 +1,192 @@
+import re
+import unicodedata
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Patterns compilés une seule fois au chargement du module
+YEAR_PATTERN = re.compile(r'\b((?:19|20)\d{2})(?:\s*-\s*((?:19|20)\d{2}))?\b')
+TOKEN_PATTERN = re.compile(r"[dD]['’](?=\w)|[^\s'’,;:!?()\"]+")
+INITIAL_PATTERN = re.compile(r"^(?:[^\W\d_]\.-?)+$")  # J. / J.-P.
+
+# Mots-clés indiquant une recherche par auteur
+AUTHOR_INDICATORS = [
+    'par', 'de', 'd\'', 'by', 'author', 'auteur', 'écrit par', 'written by',
+    'articles de', 'papers by', 'travaux de', 'publications de',
+    'recherche de', 'études de', 'works of', 'œuvres de'
+]
+
+EXCLUDED_WORDS = {
+    'les', 'des', 'de', 'le', 'la', 'du', 'articles', 'article', 'sur',
+    'par', 'avec', 'dans', 'pour', 'que', 'qui', 'sont', 'est', 'une', 'un',
+    'recherche', 'etude', 'paper', 'papers', 'study', 'research', 'work',
+    'results', 'analysis', 'method', 'approach', 'technique', 'model', 'et', 'and'
+}
+
+MAX_NAME_TOKENS = 4
+_END = object()
+
+
+def fold(text: str) -> str:
+    """Minuscules sans accents (même normalisation que EnhancedArticleSearcher.normalize_text)."""
+    text = unicodedata.normalize('NFKD', text)
+    return ''.join(c for c in text if not unicodedata.combining(c)).lower().strip()
+
+
+class QueryParser:
+    """
+    Analyse une requête en une seule passe sur ses tokens.
+
+    Les expressions indicatrices d'auteur ('par', 'papers by', ...) sont reconnues
+    par un trie de tokens (mots entiers uniquement, la plus longue expression
+    l'emporte). Les noms candidats sont les suites de mots à majuscule (ou
+    d'initiales comme 'J.'). Avec un dictionnaire d'auteurs (known_author), seuls
+    les noms qu'il connaît sont retenus d'emblée ; sinon, une suite est retenue si
+    elle suit un indicateur, précède 'et al' ou compte au moins deux mots.
+    Produit la même structure search_info que EnhancedArticleSearcher.detect_search_type.
+    """
+
+    def __init__(self, indicators: List[str] = AUTHOR_INDICATORS, excluded_words: set = EXCLUDED_WORDS):
+        self.excluded_words = {fold(w) for w in excluded_words}
+        self.indicator_trie = {}
+        for phrase in indicators:
+            node = self.indicator_trie
+            for token in phrase.split():
+                node = node.setdefault(self._key(token), {})
+            node[_END] = True
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return token.lower().replace('’', "'")
+
+    def _match_indicator(self, keys: List[str], start: int) -> int:
+        """Fin (exclue) de la plus longue expression indicatrice commençant en `start`, ou 0."""
+        node = self.indicator_trie
+        end = 0
+        for i in range(start, len(keys)):
+            node = node.get(keys[i])
+            if node is None:
+                break
+            if _END in node:
+                end = i + 1
+        return end
+
+    def _is_name_token(self, token: str) -> bool:
+        if INITIAL_PATTERN.match(token):
+            return True
+        return token[0].isupper() and token[0].isalpha() and fold(token) not in self.excluded_words
+
+    def _is_valid_name(self, tokens: List[str]) -> bool:
+        """Au moins un mot de plus d'une lettre hors initiales."""
+        return any(len(t) > 1 and not INITIAL_PATTERN.match(t) for t in tokens)
+
+    @staticmethod
+    def _known_names(run: List[str], known_author: Callable[[str], Optional[str]]) -> List[Tuple[int, int, str]]:
+        """Noms connus contenus dans une suite de mots, les plus longs d'abord : (début, fin, nom affiché)."""
+        found = []
+        i = 0
+        while i < len(run):
+            for j in range(len(run), i, -1):
+                name = known_author(' '.join(run[i:j]))
+                if name:
+                    found.append((i, j, name))
+                    i = j
+                    break
+            else:
+                i += 1
+        return found
+
+    def tokenize(self, query: str) -> Tuple[Optional[str], List[str]]:
+        """Retourne (filtre année, tokens de la requête sans l'année)."""
+        year_filter = None
+        year_match = YEAR_PATTERN.search(query)
+        if year_match:
+            start, end = year_match.groups()
+            year_filter = f"{start}-{end}" if end else start
+            query = query[:year_match.start()] + ' ' + query[year_match.end():]
+        return year_filter, TOKEN_PATTERN.findall(query)
+
+    def parse(self, query: str,
+              author_lookup: Optional[Callable[[str], List[str]]] = None,
+              known_author: Optional[Callable[[str], Optional[str]]] = None) -> Dict[str, Any]:
+        """
+        Construit search_info pour une requête.
+        known_author(nom) retourne le nom affiché d'un auteur connu (ou None) et valide
+        les suites de mots à majuscule. author_lookup (ex: n-grammes de la requête
+        cherchés dans le dictionnaire des auteurs) est consulté dès qu'aucun nom
+        connu n'a été trouvé ainsi, ce qui reconnaît aussi les noms en minuscules.
+        """
+        year_filter, tokens = self.tokenize(query)
+        keys = [self._key(t) for t in tokens]
+        search_info = {
+            'type': 'general',
+            'authors': [],
+            'keywords': ' '.join(tokens),
+            'confidence': 0.0,
+            'year_filter': year_filter
+        }
+
+        # Repère les expressions indicatrices d'auteur
+        indicator_positions = set()
+        name_after_indicator = set()
+        i = 0
+        while i < len(tokens):
+            end = self._match_indicator(keys, i)
+            if end:
+                indicator_positions.update(range(i, end))
+                name_after_indicator.add(end)
+                i = end
+            else:
+                i += 1
+
+        # Suites de mots pouvant former un nom : connues du dictionnaire, ou candidates
+        # par leur position (après un indicateur, avant 'et al')
+        authors, author_positions = [], set()
+        candidates, candidate_positions = [], set()
+        i = 0
+        while i < len(tokens):
+            if i in indicator_positions or not self._is_name_token(tokens[i]):
+                i += 1
+                continue
+            start = i
+            while (i < len(tokens) and i - start < MAX_NAME_TOKENS
+                   and i not in indicator_positions and self._is_name_token(tokens[i])):
+                i += 1
+            run = tokens[start:i]
+            et_al = keys[i:i + 2] in (['et', 'al'], ['et', 'al.'])
+            known = self._known_names(run, known_author) if known_author else []
+            for begin, end, name in known:
+                if name not in authors:
+                    authors.append(name)
+                author_positions.update(range(start + begin, start + end))
+            if known:
+                if et_al:
+                    author_positions.update((i, i + 1))
+                continue
+            # Sans dictionnaire, deux mots à majuscule suffisent en présence d'un indicateur
+            loose = known_author is None and indicator_positions and len(run) >= 2
+            if (start in name_after_indicator or et_al or loose) and self._is_valid_name(run):
+                name = ' '.join(run)
+                if name not in candidates:
+                    candidates.append(name)
+                candidate_positions.update(range(start, i + (2 if et_al else 0)))
+
+        if not authors and author_lookup:
+            authors = author_lookup(' '.join(tokens))
+            author_words = {word for author in authors for word in fold(author).split()}
+            author_positions = {pos for pos, t in enumerate(tokens) if fold(t) in author_words}
+        if not authors:
+            authors, author_positions = candidates, candidate_positions
+
+        if authors:
+            if indicator_positions:
+                search_info['type'] = 'mixed' if len(tokens) > len(' '.join(authors).split()) + 2 else 'author'
+                search_info['confidence'] = 0.9
+            else:
+                # Sans indicateur, le nom peut n'être qu'une partie du sujet
+                search_info['type'] = 'mixed'
+                search_info['confidence'] = 0.7
+            search_info['authors'] = authors
+            search_info['keywords'] = ' '.join(
+                t for pos, t in enumerate(tokens)
+                if pos not in indicator_positions and pos not in author_positions
+            )
+        return search_info
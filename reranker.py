@@ -0,0 +1,130 @@
+import math
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from search_cache import LRUCache
+
+DEFAULT_RERANK_MODEL = 'cross-encoder/ms-marco-MiniLM-L-6-v2'
+
+
+def rerank_text(article: Dict) -> str:
+    return f"{article.get('title') or ''}. {article.get('abstract') or ''}"
+
+
+class CrossEncoderReranker:
+    """
+    Second étage de classement : un cross-encoder note les paires (requête, article).
+
+    Seuls les top_n candidats de chaque requête sont notés, en un seul lot pour
+    toutes les requêtes. Les scores déjà calculés sont servis depuis un cache
+    (requête, arxiv_id). Le coût par paire est estimé (moyenne mobile des lots
+    précédents) : si les paires à calculer dépassent le budget de latence, l'étape
+    est sautée et le classement du premier étage est conservé. Après reprobe_every
+    lots sautés d'affilée, le suivant est tout de même calculé pour remesurer le
+    coût : une estimation trop haute (machine chargée un moment) ne reste pas figée.
+    L'estimation et les compteurs sont partagés entre sessions et protégés par un
+    verrou ; le cross-encoder lui-même est appelé hors verrou.
+    """
+
+    def __init__(self, model_name: str = DEFAULT_RERANK_MODEL, top_n: int = 20,
+                 latency_budget: float = 0.2, max_length: int = 256,
+                 cache_size: int = 4096, cache_ttl: Optional[float] = 3600, reprobe_every: int = 20):
+        self.model_name = model_name
+        self.top_n = top_n
+        self.latency_budget = latency_budget
+        self.reprobe_every = reprobe_every
+        # Import différé : sentence_transformers charge torch
+        from sentence_transformers import CrossEncoder
+        self.model = CrossEncoder(model_name, max_length=max_length)
+        self.score_cache = LRUCache(cache_size, cache_ttl)
+        self._lock = threading.Lock()
+        self.seconds_per_pair = None
+        self.batches = 0
+        self.skipped = 0
+        self._consecutive_skips = 0
+        self._calibrate()
+
+    def _calibrate(self):
+        """Mesure le coût d'un lot de top_n paires factices pour la première estimation.
+
+        Un premier lot non mesuré chauffe le modèle : le tout premier predict paie
+        l'initialisation (allocations, noyaux) et surestimerait le coût par paire.
+        """
+        pairs = [('calibration query', 'calibration document ' * 32)] * max(1, self.top_n)
+        self.model.predict(pairs, batch_size=len(pairs), show_progress_bar=False)
+        self._predict(pairs)
+
+    def _predict(self, pairs: List[Tuple[str, str]], reset: bool = False) -> np.ndarray:
+        start = time.perf_counter()
+        scores = np.asarray(self.model.predict(pairs, batch_size=max(len(pairs), 1),
+                                               show_progress_bar=False), dtype=np.float32)
+        per_pair = (time.perf_counter() - start) / len(pairs)
+        # Moyenne mobile exponentielle du coût par paire ; une nouvelle mesure
+        # après des lots sautés la remplace, l'ancienne estimation étant suspecte
+        with self._lock:
+            self.seconds_per_pair = per_pair if self.seconds_per_pair is None or reset else (
+                0.8 * self.seconds_per_pair + 0.2 * per_pair)
+        return scores
+
+    def estimate(self, num_pairs: int) -> float:
+        """Durée estimée (secondes) pour noter num_pairs paires."""
+        return num_pairs * (self.seconds_per_pair or 0.0)
+
+    def score_many(self, queries: Sequence[str], candidates: Sequence[Sequence[Dict]],
+                   budget: Optional[float] = None) -> List[Optional[np.ndarray]]:
+        """
+        Scores du cross-encoder pour les top_n premiers candidats (articles) de chaque requête.
+        Retourne None pour une requête si ses paires absentes du cache n'ont pas pu être
+        calculées dans le budget (budget=None : latency_budget de l'instance).
+        """
+        budget = self.latency_budget if budget is None else budget
+        scores = []
+        missing = []
+        for row, (query, articles) in enumerate(zip(queries, candidates)):
+            row_scores = np.empty(min(len(articles), self.top_n), dtype=np.float32)
+            for col, article in enumerate(articles[:self.top_n]):
+                cached = self.score_cache.get((query, article.get('arxiv_id')))
+                if cached is None:
+                    missing.append((row, col, query, article))
+                else:
+                    row_scores[col] = cached
+            scores.append(row_scores)
+
+        if missing:
+            with self._lock:
+                skip = self.estimate(len(missing)) > budget and self._consecutive_skips < self.reprobe_every
+                if skip:
+                    self._consecutive_skips += 1
+                    self.skipped += 1
+                else:
+                    reprobe = self._consecutive_skips > 0
+                    self._consecutive_skips = 0
+            if skip:
+                incomplete = {row for row, _, _, _ in missing}
+                return [None if row in incomplete else s for row, s in enumerate(scores)]
+            predicted = self._predict([(query, rerank_text(article)) for _, _, query, article in missing],
+                                      reset=reprobe)
+            with self._lock:
+                self.batches += 1
+            for (row, col, query, article), score in zip(missing, predicted):
+                scores[row][col] = score
+                self.score_cache.put((query, article.get('arxiv_id')), float(score))
+        return scores
+
+    @staticmethod
+    def to_relevance(score: float) -> float:
+        """Score brut (logit) du cross-encoder converti en pertinence sur 100."""
+        return 100.0 / (1.0 + math.exp(-score))
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            stats = {
+                'batches': self.batches,
+                'skipped': self.skipped,
+                'ms_per_pair': (self.seconds_per_pair or 0.0) * 1000,
+            }
+        stats['cache'] = self.score_cache.stats()
+        return stats
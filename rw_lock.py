@@ -0,0 +1,60 @@
+import threading
+from contextlib import contextmanager
+
+
+class ReadWriteLock:
+    """
+    Verrou lecteurs/rédacteur.
+
+    Plusieurs threads peuvent lire en même temps ; l'écriture est exclusive et
+    prioritaire sur les nouvelles lectures (un rechargement n'attend que la fin
+    des lectures en cours). Les lectures sont réentrantes dans un même thread,
+    y compris depuis le thread qui détient l'écriture.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = None
+        self._writers_waiting = 0
+        self._local = threading.local()
+
+    @property
+    def readers(self) -> int:
+        """Nombre de lectures en cours."""
+        return self._readers
+
+    @contextmanager
+    def read(self):
+        depth = getattr(self._local, 'depth', 0)
+        nested = depth > 0 or self._writer == threading.get_ident()
+        if not nested:
+            with self._cond:
+                while self._writer is not None or self._writers_waiting:
+                    self._cond.wait()
+                self._readers += 1
+        self._local.depth = depth + 1
+        try:
+            yield
+        finally:
+            self._local.depth = depth
+            if not nested:
+                with self._cond:
+                    self._readers -= 1
+                    if not self._readers:
+                        self._cond.notify_all()
+
+    @contextmanager
+    def write(self):
+        with self._cond:
+            self._writers_waiting += 1
+            while self._writer is not None or self._readers:
+                self._cond.wait()
+            self._writers_waiting -= 1
+            self._writer = threading.get_ident()
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer = None
+                self._cond.notify_all()
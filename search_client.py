@@ -0,0 +1,79 @@
+from typing import Any, Dict, List, Optional
+from urllib.parse import quote
+
+import requests
+
+
+class SearchServiceError(RuntimeError):
+    """Erreur renvoyée par le service de recherche (ou service injoignable)."""
+
+
+class SearchClient:
+    """
+    Client du service HTTP de recherche (search_service.py).
+
+    Expose les méthodes d'EnhancedArticleSearcher utilisées par l'interface
+    (search, search_many, get_articles_by_author, get_author_stats) pour que
+    plusieurs workers Streamlit partagent un seul index chargé. La session
+    requests garde les connexions ouvertes entre les appels.
+    """
+
+    def __init__(self, base_url: str = 'http://127.0.0.1:8765', timeout: float = 30.0):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.session = requests.Session()
+
+    def _request(self, method: str, path: str, payload: Optional[Dict[str, Any]] = None,
+                 params: Optional[Dict[str, Any]] = None) -> Any:
+        try:
+            response = self.session.request(method, f"{self.base_url}{path}", json=payload,
+                                            params=params, timeout=self.timeout)
+        except requests.RequestException as e:
+            raise SearchServiceError(f"Service de recherche injoignable ({self.base_url}): {e}") from e
+        data = response.json()
+        if response.status_code != 200:
+            raise SearchServiceError(data.get('error', f"HTTP {response.status_code}"))
+        return data
+
+    def health(self) -> Dict[str, Any]:
+        return self._request('GET', '/health')
+
+    def search(self, query: str, top_k: int = 10, **options) -> Dict[str, Any]:
+        return self._request('POST', '/search', dict(options, query=query, top_k=top_k))
+
+    def search_page(self, query: str, offset: int = 0, limit: int = 10, max_results: int = 50,
+                    **options) -> Dict[str, Any]:
+        """Page [offset, offset + limit) des max_results meilleurs résultats ; next_offset pour la suite."""
+        return self._request('POST', '/search', dict(options, query=query, top_k=max_results,
+                                                     offset=offset, limit=limit))
+
+    def search_many(self, queries: List[str], top_k: int = 10, **options) -> List[Dict[str, Any]]:
+        return self._request('POST', '/search_many', dict(options, queries=queries, top_k=top_k))['results']
+
+    def get_articles(self, article_ids: List[str]) -> List[Optional[Dict]]:
+        """Articles par identifiant arXiv, dans l'ordre (None si inconnu)."""
+        return self._request('POST', '/articles', {'ids': list(article_ids)})['articles']
+
+    def autocomplete(self, prefix: str, limit: int = 8, kinds: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Suggestions (auteurs, catégories, expressions de titres) pour un début de saisie."""
+        params = {'q': prefix, 'limit': limit}
+        if kinds:
+            params['types'] = ','.join(kinds)
+        return self._request('GET', '/autocomplete', params=params)['completions']
+
+    def author(self, author_name: str, limit: int = 10) -> Dict[str, Any]:
+        """Articles, statistiques et auteurs similaires (si aucun article) d'un auteur."""
+        return self._request('GET', f"/author/{quote(author_name, safe='')}", params={'limit': limit})
+
+    def get_articles_by_author(self, author_name: str, limit: int = 10) -> List[Dict]:
+        return self.author(author_name, limit)['articles']
+
+    def get_author_stats(self, author_name: str) -> Optional[Dict[str, Any]]:
+        return self.author(author_name)['stats']
+
+    def stats(self) -> Dict[str, Any]:
+        return self._request('GET', '/stats')
+
+    def metrics(self) -> Dict[str, Any]:
+        """Durées par étape (p50/p95/p99), compteurs et statistiques des lots, en JSON."""
+        return self._request('GET', '/metrics', params={'format': 'json'})
@@ -0,0 +1,140 @@
+import cProfile
+import os
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+class SearchMetrics:
+    """
+    Chronomètres par étape, compteurs et profils cProfile échantillonnés du moteur.
+
+    Chaque étape (analyse, vectorisation, FAISS, filtres, auteurs...) garde ses
+    `window` dernières durées pour les percentiles p50/p95/p99, plus un nombre
+    et une somme cumulés. Une fraction `profile_sample_rate` des recherches est
+    profilée par cProfile (une à la fois) et écrite dans `profile_dir`.
+    Désactivé (enabled=False), stage() et profiled() ne coûtent qu'un appel.
+    Les métriques sont exportées en JSON (snapshot) ou au format texte Prometheus.
+    """
+
+    def __init__(self, enabled: bool = True, window: int = 10000, profile_sample_rate: float = 0.0,
+                 profile_dir: str = 'logs/profiles', prefix: str = 'scopus_search'):
+        self.enabled = enabled
+        self.window = window
+        self.profile_sample_rate = profile_sample_rate
+        self.profile_dir = profile_dir
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._profile_lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._durations = {}
+            self._totals = {}
+            self.counters = {}
+            self.profiles_written = 0
+
+    def observe(self, stage: str, seconds: float):
+        with self._lock:
+            durations = self._durations.get(stage)
+            if durations is None:
+                durations = self._durations[stage] = deque(maxlen=self.window)
+                self._totals[stage] = [0, 0.0]
+            durations.append(seconds)
+            totals = self._totals[stage]
+            totals[0] += 1
+            totals[1] += seconds
+
+    def stage(self, stage: str):
+        """Chronomètre un bloc : `with metrics.stage('faiss'): ...`."""
+        if not self.enabled:
+            return nullcontext()
+        return self._stage(stage)
+
+    @contextmanager
+    def _stage(self, stage: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start)
+
+    def count(self, event: str, n: int = 1):
+        if self.enabled and n:
+            with self._lock:
+                self.counters[event] = self.counters.get(event, 0) + n
+
+    def profiled(self, label: str):
+        """Profile le bloc avec cProfile pour une fraction profile_sample_rate des appels."""
+        if (not self.enabled or self.profile_sample_rate <= 0
+                or random.random() >= self.profile_sample_rate):
+            return nullcontext()
+        return self._profiled(label)
+
+    @contextmanager
+    def _profiled(self, label: str):
+        # Un seul profileur actif à la fois dans le processus
+        if not self._profile_lock.acquire(blocking=False):
+            yield
+            return
+        try:
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                yield
+            finally:
+                profiler.disable()
+                os.makedirs(self.profile_dir, exist_ok=True)
+                path = os.path.join(self.profile_dir, f"{label}-{time.strftime('%Y%m%d-%H%M%S')}-"
+                                                      f"{os.getpid()}-{self.profiles_written}.prof")
+                profiler.dump_stats(path)
+                self.profiles_written += 1
+        finally:
+            self._profile_lock.release()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Métriques en JSON : par étape nombre, durée totale et moyenne, p50/p95/p99 (ms)."""
+        with self._lock:
+            windows = {stage: np.array(durations) * 1000 for stage, durations in self._durations.items()}
+            totals = {stage: tuple(total) for stage, total in self._totals.items()}
+            counters = dict(self.counters)
+            profiles = self.profiles_written
+
+        stages = {}
+        for stage, durations in windows.items():
+            count, total = totals[stage]
+            stages[stage] = {'count': count, 'total_ms': total * 1000, 'mean_ms': total * 1000 / count}
+            for q in QUANTILES:
+                stages[stage][f"p{round(q * 100)}_ms"] = float(np.percentile(durations, q * 100))
+        return {'enabled': self.enabled, 'stages': stages, 'counters': counters,
+                'profile_sample_rate': self.profile_sample_rate, 'profiles_written': profiles}
+
+    def prometheus(self, extra: Optional[Dict[str, float]] = None) -> str:
+        """Métriques au format texte Prometheus (résumés par étape, compteurs, jauges `extra`)."""
+        snapshot = self.snapshot()
+        name = f"{self.prefix}_stage_seconds"
+        lines = [f"# HELP {name} Durée des étapes de recherche (fenêtre des {self.window} dernières mesures)",
+                 f"# TYPE {name} summary"]
+        for stage, stats in sorted(snapshot['stages'].items()):
+            for q in QUANTILES:
+                value = stats[f"p{round(q * 100)}_ms"] / 1000
+                lines.append(f'{name}{{stage="{stage}",quantile="{q}"}} {value:.9f}')
+            lines.append(f'{name}_sum{{stage="{stage}"}} {stats["total_ms"] / 1000:.9f}')
+            lines.append(f'{name}_count{{stage="{stage}"}} {stats["count"]}')
+
+        name = f"{self.prefix}_events_total"
+        lines += [f"# HELP {name} Compteurs d'événements du moteur", f"# TYPE {name} counter"]
+        for event, value in sorted(snapshot['counters'].items()):
+            lines.append(f'{name}{{event="{event}"}} {value}')
+
+        for key, value in sorted((extra or {}).items()):
+            lines += [f"# TYPE {self.prefix}_{key} gauge", f"{self.prefix}_{key} {value}"]
+        return '\n'.join(lines) + '\n'
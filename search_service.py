@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Service HTTP local (JSON) autour d'EnhancedArticleSearcher.
+
+Un seul processus charge l'index et le modèle, et sert plusieurs clients
+(workers Streamlit, scripts) :
+
+    POST /search          {"query": "...", "top_k": 5, ...}
+                          {"query": "...", "offset": 10, "limit": 5}  (page de résultats)
+    POST /search_many     {"queries": ["...", "..."], "top_k": 5, ...}
+    POST /articles        {"ids": ["2101.00001", ...]}  articles par identifiant
+    GET  /author/{nom}    articles, statistiques et auteurs similaires
+    GET  /autocomplete?q=yann%20le&limit=8&types=author,category
+    GET  /stats           statistiques de la base, des caches et des lots
+    GET  /metrics         durées par étape (p50/p95/p99) et compteurs, format
+                          Prometheus (ou JSON avec ?format=json)
+    GET  /health
+
+Les requêtes /search concurrentes sont regroupées en micro-lots par
+MicroBatchScheduler (même options, au plus max_batch_size requêtes ou batch_wait
+secondes d'attente) : une vectorisation et une recherche FAISS par lot.
+Une nouvelle construction de l'index est détectée (--reload-interval) et
+chargée à chaud, sans redémarrer le service.
+
+Exemple :
+    python search_service.py --port 8765 --max-batch-size 32 --batch-wait-ms 5
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Dict
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from batch_scheduler import MicroBatchScheduler
+from chatbot import PAGE_POOL_SIZE, EnhancedArticleSearcher, paginate
+from config import METRICS_CONFIG
+from search_metrics import SearchMetrics
+
+SEARCH_OPTIONS = ('top_k', 'search_pool_multiplier', 'field_weights', 'categories', 'hybrid', 'rerank')
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+           500: 'Internal Server Error'}
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _json_default(value):
+    # Scalaires NumPy éventuels dans les réponses
+    if hasattr(value, 'item'):
+        return value.item()
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    return str(value)
+
+
+def search_options(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Options de recherche d'une requête JSON, validées."""
+    options = {key: payload[key] for key in SEARCH_OPTIONS if payload.get(key) is not None}
+    for key in ('top_k', 'search_pool_multiplier'):
+        if key in options and (not isinstance(options[key], int) or options[key] <= 0):
+            raise HTTPError(400, f"'{key}' doit être un entier positif")
+    if 'categories' in options and not isinstance(options['categories'], list):
+        raise HTTPError(400, "'categories' doit être une liste")
+    if 'field_weights' in options and not isinstance(options['field_weights'], dict):
+        raise HTTPError(400, "'field_weights' doit être un objet {champ: poids}")
+    return options
+
+
+class SearchService:
+    """Serveur HTTP/1.1 minimal (asyncio, keep-alive) exposant le moteur en JSON."""
+
+    def __init__(self, searcher: EnhancedArticleSearcher, max_batch_size: int = 32,
+                 batch_wait: float = 0.005):
+        self.searcher = searcher
+        self.scheduler = MicroBatchScheduler(searcher, max_batch_size, batch_wait)
+        # Requêtes auteur et statistiques, hors du thread des micro-lots
+        # (le moteur accepte les lectures concurrentes)
+        self.executor = ThreadPoolExecutor(max_workers=4)
+        self.started_at = time.time()
+
+    async def _call(self, func, *args, **kwargs):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, partial(func, *args, **kwargs))
+
+    async def dispatch(self, method: str, target: str, body: bytes) -> Dict[str, Any]:
+        url = urlsplit(target)
+        path = url.path.rstrip('/') or '/'
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+
+        if path == '/health':
+            return {'status': 'ok', 'uptime': time.time() - self.started_at}
+
+        if path == '/stats':
+            self._check_method(method, 'GET')
+            return await self._call(self._stats)
+
+        if path == '/metrics':
+            self._check_method(method, 'GET')
+            if params.get('format') == 'json':
+                return dict(self.searcher.metrics.snapshot(), batching=self.scheduler.stats())
+            return self._prometheus()
+
+        if path == '/autocomplete':
+            self._check_method(method, 'GET')
+            kinds = params['types'].split(',') if params.get('types') else None
+            completions = await self._call(self.searcher.autocomplete, params.get('q', ''),
+                                           int(params.get('limit', 8)), kinds)
+            return {'completions': completions}
+
+        if path.startswith('/author/'):
+            self._check_method(method, 'GET')
+            name = unquote(path[len('/author/'):]).strip()
+            if not name:
+                raise HTTPError(400, "Nom d'auteur manquant")
+            limit = int(params.get('limit', 10))
+            return await self._call(self._author, name, limit)
+
+        if path == '/articles':
+            self._check_method(method, 'POST')
+            try:
+                ids = json.loads(body or b'{}').get('ids')
+            except (ValueError, AttributeError):
+                raise HTTPError(400, "Corps JSON invalide")
+            if not isinstance(ids, list) or not all(isinstance(i, str) for i in ids):
+                raise HTTPError(400, "'ids' doit être une liste de chaînes")
+            return {'articles': await self._call(self.searcher.get_articles, ids)}
+
+        if path in ('/search', '/search_many'):
+            self._check_method(method, 'POST')
+            try:
+                payload = json.loads(body or b'{}')
+            except ValueError:
+                raise HTTPError(400, "Corps JSON invalide")
+            if not isinstance(payload, dict):
+                raise HTTPError(400, "Corps JSON invalide")
+            options = search_options(payload)
+            if path == '/search':
+                query = payload.get('query')
+                if not isinstance(query, str):
+                    raise HTTPError(400, "'query' manquant")
+                if 'offset' not in payload and 'limit' not in payload:
+                    return await self._search(query, options)
+                # Page d'une liste de top_k candidats, servie depuis le cache de résultats
+                offset, limit = payload.get('offset', 0), payload.get('limit', 10)
+                if not isinstance(offset, int) or not isinstance(limit, int):
+                    raise HTTPError(400, "'offset' et 'limit' doivent être des entiers")
+                options.setdefault('top_k', PAGE_POOL_SIZE)
+                return paginate(await self._search(query, options), offset, limit)
+            queries = payload.get('queries')
+            if not isinstance(queries, list) or not all(isinstance(q, str) for q in queries):
+                raise HTTPError(400, "'queries' doit être une liste de chaînes")
+            results = await asyncio.gather(*(self._search(query, options) for query in queries))
+            return {'results': list(results)}
+
+        raise HTTPError(404, f"Route inconnue: {path}")
+
+    async def _search(self, query: str, options: Dict[str, Any]) -> Dict[str, Any]:
+        return await asyncio.wrap_future(self.scheduler.submit(query, **options))
+
+    @staticmethod
+    def _check_method(method: str, expected: str):
+        if method != expected:
+            raise HTTPError(405, f"Méthode {method} non supportée (attendu: {expected})")
+
+    def _author(self, name: str, limit: int) -> Dict[str, Any]:
+        articles = self.searcher.get_articles_by_author(name, limit)
+        return {
+            'author': name,
+            'articles': articles,
+            'stats': self.searcher.get_author_stats(name),
+            'similar_authors': [] if articles else self.searcher.similar_authors(name),
+        }
+
+    def _stats(self) -> Dict[str, Any]:
+        searcher = self.searcher
+        return {
+            'articles': len(searcher.article_years),
+            'authors': len(searcher.all_authors_cache),
+            'categories': len(searcher.category_names),
+            'prolific_authors': searcher.prolific_authors,
+            'popular_categories': searcher.popular_categories,
+            'caches': searcher.cache_stats(),
+            'startup': searcher.startup_times,
+            'build_id': searcher.manifest['build_id'] if searcher.manifest else None,
+            'generation': searcher.generation,
+            'batching': self.scheduler.stats(),
+            'metrics': searcher.metrics.snapshot(),
+        }
+
+    def _prometheus(self) -> str:
+        batching = self.scheduler.stats()
+        extra = {f"request_latency_{q}_seconds": batching[f"{q}_ms"] / 1000 for q in ('p50', 'p95', 'p99')}
+        extra.update(batches_total=batching['batches'], build_generation=self.searcher.generation,
+                     uptime_seconds=time.time() - self.started_at)
+        return self.searcher.metrics.prometheus(extra)
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    await self._respond(writer, 400, {'error': 'Requête HTTP invalide'}, keep_alive=False)
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get('content-length') or 0))
+
+                try:
+                    status, payload = 200, await self.dispatch(method.upper(), target, body)
+                except HTTPError as e:
+                    status, payload = e.status, {'error': str(e)}
+                except ValueError as e:
+                    status, payload = 400, {'error': str(e)}
+                except Exception as e:
+                    status, payload = 500, {'error': f"{type(e).__name__}: {e}"}
+
+                keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _respond(writer: asyncio.StreamWriter, status: int, payload, keep_alive: bool):
+        # Texte brut (métriques Prometheus) ou JSON
+        if isinstance(payload, str):
+            data, content_type = payload.encode('utf-8'), 'text/plain; version=0.0.4; charset=utf-8'
+        else:
+            data = json.dumps(payload, ensure_ascii=False, default=_json_default).encode('utf-8')
+            content_type = 'application/json; charset=utf-8'
+        head = (f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(data)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode('latin-1') + data)
+        await writer.drain()
+
+    async def serve(self, host: str = '127.0.0.1', port: int = 8765):
+        server = await asyncio.start_server(self.handle_connection, host, port)
+        print(f"🌐 Service de recherche sur http://{host}:{port}")
+        async with server:
+            await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Service HTTP de recherche d'articles")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--index', default='arxiv_index.faiss')
+    parser.add_argument('--metadata', default='arxiv_metadata.json')
+    parser.add_argument('--model', default='all-MiniLM-L6-v2')
+    parser.add_argument('--reranker-model', default=None)
+    parser.add_argument('--max-batch-size', type=int, default=32, help="Requêtes max par micro-lot")
+    parser.add_argument('--batch-wait-ms', type=float, default=5.0, help="Attente max avant d'exécuter un lot")
+    parser.add_argument('--lazy', action='store_true', help="Charge l'index et le modèle à la première requête")
+    parser.add_argument('--max-concurrent-requests', type=int, default=None,
+                        help="Requêtes simultanées max dans le moteur (défaut: nombre de CPU)")
+    parser.add_argument('--faiss-threads', type=int, default=None, help="Threads OpenMP de FAISS")
+    parser.add_argument('--torch-threads', type=int, default=None, help="Threads torch pour la vectorisation")
+    parser.add_argument('--reload-interval', type=float, default=30.0,
+                        help="Intervalle (s) de détection d'une nouvelle construction de l'index (0: désactivé)")
+    parser.add_argument('--no-metrics', action='store_true', default=not METRICS_CONFIG['enabled'],
+                        help="Désactive les mesures par étape (SEARCH_METRICS=0)")
+    parser.add_argument('--profile-rate', type=float, default=METRICS_CONFIG['profile_sample_rate'],
+                        help="Fraction des recherches profilées par cProfile (SEARCH_PROFILE_RATE)")
+    parser.add_argument('--profile-dir', default=METRICS_CONFIG['profile_dir'],
+                        help="Dossier des profils .prof (SEARCH_PROFILE_DIR)")
+    parser.add_argument('--no-mmap', action='store_true',
+                        help="Charge l'index et les métadonnées en mémoire privée au lieu de les projeter (mmap)")
+    args = parser.parse_args()
+
+    metrics = SearchMetrics(not args.no_metrics, METRICS_CONFIG['window'], args.profile_rate, args.profile_dir)
+    searcher = EnhancedArticleSearcher(args.index, args.metadata, args.model,
+                                       reranker_model=args.reranker_model, lazy=args.lazy,
+                                       max_concurrent_requests=args.max_concurrent_requests,
+                                       faiss_threads=args.faiss_threads, torch_threads=args.torch_threads,
+                                       reload_interval=args.reload_interval, mmap=not args.no_mmap,
+                                       metrics=metrics)
+    service = SearchService(searcher, args.max_batch_size, args.batch_wait_ms / 1000)
+    try:
+        asyncio.run(service.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print("\n👋 Service arrêté")
+
+
+if __name__ == "__main__":
+    main()
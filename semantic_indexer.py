@@ -1,12 +1,317 @@
-from sentence_transformers import SentenceTransformer
 import faiss
 import numpy as np
 import json
+import os
+import re
+import heapq
+import hashlib
+import time
+import uuid
+import zlib
+from collections import defaultdict
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from bm25_index import BM25Builder
+from rw_lock import ReadWriteLock
+
+
+def iter_articles(json_path):
+    """Lit les articles d'un fichier d'extraction sans tout garder en mémoire.
+
+    Les fichiers .jsonl (un article par ligne) sont lus paresseusement ligne par
+    ligne. Les fichiers .json produits par main_extractor.py ({"articles": [...]})
+    doivent être chargés d'un bloc, mais les articles sont ensuite produits un à un.
+    """
+    if json_path.endswith('.jsonl'):
+        with open(json_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+    else:
+        with open(json_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        articles = data['articles'] if isinstance(data, dict) else data
+        for article in articles:
+            yield article
+
+
+def iter_chunks(iterable, chunk_size):
+    """Regroupe un itérable en listes de taille fixe (la dernière peut être plus courte)."""
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+# Champs vectorisés : 'abstract' est l'index principal (arxiv_index.<build_id>.faiss),
+# 'title' et 'fused' sont stockés à côté (arxiv_index.<build_id>_title.faiss, ..._fused.faiss).
+FIELDS = ('title', 'abstract')
+
+
+def field_index_path(index_path, field):
+    """Chemin de l'index d'un champ, dérivé du chemin de l'index principal."""
+    if field == 'abstract':
+        return index_path
+    root, ext = os.path.splitext(index_path)
+    return f"{root}_{field}{ext}"
+
+
+def lexical_index_path(index_path):
+    """Chemin de l'index lexical BM25 associé (arxiv_index.faiss -> arxiv_index.bm25.npz)."""
+    return f"{os.path.splitext(index_path)[0]}.bm25.npz"
+
+
+def fuse_embeddings(field_embeddings, weights):
+    """Combine des vecteurs de champs par somme pondérée, puis renormalise (norme L2)."""
+    fused = sum(weights[field] * field_embeddings[field] for field in weights)
+    norms = np.linalg.norm(fused, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (fused / norms).astype('float32')
+
+
+# Types d'index supportés : 'flat' stocke les vecteurs float32 bruts (4 octets/dim),
+# 'fp16' et 'sq8' utilisent le scalar quantizer de FAISS (2 et 1 octet/dim).
+INDEX_TYPES = ('flat', 'fp16', 'sq8')
+
+
+def new_index(dim, index_type='flat'):
+    """Crée un index FAISS L2 vide du type demandé."""
+    if index_type == 'flat':
+        return faiss.IndexFlatL2(dim)
+    if index_type == 'fp16':
+        return faiss.IndexScalarQuantizer(dim, faiss.ScalarQuantizer.QT_fp16, faiss.METRIC_L2)
+    if index_type == 'sq8':
+        return faiss.IndexScalarQuantizer(dim, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_L2)
+    raise ValueError(f"Type d'index non supporté: {index_type}")
+
+
+def add_to_index(index, embeddings):
+    """Ajoute des vecteurs à un index, en l'entraînant d'abord si nécessaire.
+
+    Pour 'sq8', l'entraînement fixe les bornes de quantification par dimension :
+    en mode streaming, il est fait sur le premier bloc.
+    """
+    embeddings = np.ascontiguousarray(embeddings, dtype='float32')
+    if not index.is_trained:
+        index.train(embeddings)
+    index.add(embeddings)
+
+
+# --- Manifeste de construction ---
+
+class IndexIntegrityError(ValueError):
+    """L'index, les métadonnées et le manifeste ne correspondent pas."""
+
+
+class BuildUnavailableError(IndexIntegrityError):
+    """Les fichiers d'une construction validée ont disparu (supprimés par des publications ultérieures)."""
+
+    def __init__(self, build_id, message):
+        super().__init__(message)
+        self.build_id = build_id
+
+
+BUILD_FILE_PATTERN = re.compile(r"([0-9a-f]{32})(?:[._]|$)")
+
+
+def manifest_path(index_path):
+    """Chemin du manifeste associé à un index (arxiv_index.faiss -> arxiv_index.manifest.json)."""
+    return f"{os.path.splitext(index_path)[0]}.manifest.json"
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _fsync(path):
+    with open(path, 'rb') as f:
+        os.fsync(f.fileno())
+
+
+def build_paths(index_path, metadata_path, build_id):
+    """Noms des fichiers d'une construction (arxiv_index.<build_id>.faiss, arxiv_metadata.<build_id>.json).
+
+    Propres à une construction, ces fichiers ne sont jamais réécrits : une
+    publication n'en remplace que le manifeste, qui les désigne.
+    """
+    index_root, index_ext = os.path.splitext(index_path)
+    metadata_root, metadata_ext = os.path.splitext(metadata_path)
+    return f"{index_root}.{build_id}{index_ext}", f"{metadata_root}.{build_id}{metadata_ext}"
+
+
+def manifest_files(index_path, metadata_path, manifest):
+    """Chemins des fichiers désignés par le manifeste, relatifs à son dossier.
+
+    Sans manifeste (index antérieur aux manifestes), retourne les noms historiques :
+    index_path et ses index de champs existants, l'index BM25 s'il existe, metadata_path.
+    """
+    if manifest is None:
+        index_files = {'abstract': index_path}
+        for field in ('title', 'fused'):
+            if os.path.exists(field_index_path(index_path, field)):
+                index_files[field] = field_index_path(index_path, field)
+        lexical = lexical_index_path(index_path)
+        return {'index_files': index_files,
+                'lexical_index': lexical if os.path.exists(lexical) else None,
+                'metadata': metadata_path}
+
+    directory = os.path.dirname(manifest_path(index_path))
+    lexical = manifest.get('lexical_index')
+    return {'index_files': {field: os.path.join(directory, info['path'])
+                            for field, info in manifest['index_files'].items()},
+            'lexical_index': os.path.join(directory, lexical['path']) if lexical else None,
+            'metadata': os.path.join(directory, manifest['metadata']['path'])}
+
+
+def remove_old_builds(index_path, metadata_path, keep):
+    """Supprime les fichiers des constructions dont le build_id n'est pas dans keep."""
+    removed = 0
+    for root in {os.path.splitext(index_path)[0], os.path.splitext(metadata_path)[0]}:
+        directory = os.path.dirname(root) or '.'
+        prefix = os.path.basename(root) + '.'
+        for name in os.listdir(directory):
+            match = BUILD_FILE_PATTERN.match(name[len(prefix):]) if name.startswith(prefix) else None
+            if match and match.group(1) not in keep:
+                try:
+                    os.remove(os.path.join(directory, name))
+                    removed += 1
+                except OSError:
+                    pass
+    return removed
+
+
+def load_manifest(index_path):
+    """Lit le manifeste d'un index, ou None s'il n'existe pas (index antérieur aux manifestes)."""
+    path = manifest_path(index_path)
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def validate_manifest(index_path, metadata_path, model_name=None, verify_checksum=False):
+    """Vérifie en O(1) (quelques stat) que les fichiers correspondent au manifeste.
+
+    Contrôle le modèle et la taille de chaque fichier désigné par le manifeste
+    (voir manifest_files) avant le chargement coûteux. Le checksum complet des métadonnées n'est recalculé que si verify_checksum=True.
+    Retourne le manifeste, ou None pour un index sans manifeste.
+    """
+    manifest = load_manifest(index_path)
+    if manifest is None:
+        return None
+
+    if model_name and manifest['model_name'] != model_name:
+        raise IndexIntegrityError(
+            f"Index construit avec {manifest['model_name']}, incompatible avec {model_name}")
+
+    files = manifest_files(index_path, metadata_path, manifest)
+    expected = [(files['index_files'][field], info['size'])
+                for field, info in manifest['index_files'].items()]
+    expected.append((files['metadata'], manifest['metadata']['size']))
+    if files['lexical_index']:
+        expected.append((files['lexical_index'], manifest['lexical_index']['size']))
+    for path, size in expected:
+        if not os.path.exists(path):
+            raise IndexIntegrityError(f"Fichier manquant: {path}")
+        if os.path.getsize(path) != size:
+            raise IndexIntegrityError(
+                f"{path} ne correspond pas au manifeste ({os.path.getsize(path)} octets au lieu de {size})")
+
+    if verify_checksum and file_sha256(files['metadata']) != manifest['metadata']['sha256']:
+        raise IndexIntegrityError(f"Checksum invalide pour {files['metadata']}")
+    return manifest
+
+
+def read_faiss_index(path, mmap=False):
+    """Lit un index FAISS. Avec mmap=True, le fichier est projeté en mémoire en lecture
+    seule : les vecteurs ne sont pas copiés et leurs pages sont partagées entre processus.
+    """
+    if not mmap:
+        return faiss.read_index(path)
+    # IO_FLAG_MMAP_IFC (versions récentes de FAISS) projette aussi les vecteurs des
+    # index plats ; IO_FLAG_MMAP seul ne concerne que les listes inversées (IVF)
+    flag = getattr(faiss, 'IO_FLAG_MMAP_IFC', faiss.IO_FLAG_MMAP)
+    return faiss.read_index(path, flag | faiss.IO_FLAG_READ_ONLY)
+
+
+def open_build_file(manifest, load, path, *args):
+    """Ouvre un fichier d'une construction avec load(path, *args).
+
+    S'il a disparu, lève BuildUnavailableError au lieu de l'erreur brute de FAISS
+    (RuntimeError) ou du système (OSError) ; un fichier présent mais illisible
+    garde son erreur d'origine.
+    """
+    try:
+        return load(path, *args)
+    except (RuntimeError, OSError) as e:
+        if manifest is None or os.path.exists(path):
+            raise
+        raise BuildUnavailableError(
+            manifest['build_id'], f"Construction {manifest['build_id']} absente du disque: {path}") from e
+
+
+def _load_json(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def read_build(index_path, metadata_path, manifest, mmap=False, articles=None):
+    """Charge l'index principal et les métadonnées de la construction décrite par manifest.
+
+    Sans manifeste (None), lit les noms historiques. mmap projette l'index en mémoire
+    (voir read_faiss_index) ; articles fournit des métadonnées déjà ouvertes
+    (ex: MappedArticles), vérifiées au lieu de relire le JSON.
+    """
+    files = manifest_files(index_path, metadata_path, manifest)
+    index = open_build_file(manifest, read_faiss_index, files['index_files']['abstract'], mmap)
+    if articles is None:
+        articles = open_build_file(manifest, _load_json, files['metadata'])
+    if manifest is not None and not index.ntotal == len(articles) == manifest['vector_count']:
+        raise IndexIntegrityError(
+            f"{index.ntotal} vecteurs et {len(articles)} articles pour "
+            f"{manifest['vector_count']} attendus")
+    return index, articles
+
+
+def read_index_pair(index_path, metadata_path, model_name=None, retries=3, retry_delay=0.2, mmap=False):
+    """Charge un couple index/métadonnées cohérent de la construction publiée.
+
+    Les fichiers ouverts sont ceux que nomme le manifeste : propres à une
+    construction, ils ne changent pas pendant la lecture. Si une publication
+    concurrente les a déjà supprimés, le chargement est recommencé sur le
+    nouveau manifeste.
+    """
+    for attempt in range(retries):
+        try:
+            manifest = validate_manifest(index_path, metadata_path, model_name)
+            index, articles = read_build(index_path, metadata_path, manifest, mmap)
+            return index, articles, manifest
+        except IndexIntegrityError:
+            if attempt == retries - 1:
+                raise
+            time.sleep(retry_delay)
+
 
 class SemanticIndexer:
-    def __init__(self, model_name='all-MiniLM-L6-v2'):
+    def __init__(self, model_name='all-MiniLM-L6-v2', index_type='flat'):
+        # Import différé : sentence_transformers charge torch, inutile pour lire un index
+        from sentence_transformers import SentenceTransformer
         self.model = SentenceTransformer(model_name)
+        self.model_name = model_name
+        self.index_type = index_type
         self.index = None
+        self.field_indexes = {}
+        self.lexical_index = None
         self.embeddings = None
         self.article_ids = []
         self.articles = []
@@ -24,32 +329,227 @@ class SemanticIndexer:
         self.embeddings = self.model.encode(abstracts, show_progress_bar=True)
 
         dim = self.embeddings[0].shape[0]
-        self.index = faiss.IndexFlatL2(dim)
-        self.index.add(np.array(self.embeddings))
+        self.index = new_index(dim, self.index_type)
+        add_to_index(self.index, self.embeddings)
+        self.field_indexes = {'abstract': self.index}
+        # Les vecteurs bruts ne servent plus une fois dans l'index
+        self.embeddings = None
+
+        print(f"✅ Index FAISS créé avec {self.index.ntotal} vecteurs.")
+
+    def encode_fields(self, articles, encode=None, fused_weights=None):
+        """Vectorise titres et résumés en une seule passe batchée.
+
+        Les deux champs sont concaténés dans un même appel à l'encodeur pour
+        ne pas payer deux fois le coût de lancement des batchs.
+        """
+        encode = encode or self.model.encode
+        titles = [a.get('title') or '' for a in articles]
+        abstracts = [a.get('abstract') or '' for a in articles]
+        embeddings = np.asarray(encode(titles + abstracts), dtype='float32')
+        n = len(articles)
+        fields = {'title': embeddings[:n], 'abstract': embeddings[n:]}
+        if fused_weights:
+            fields['fused'] = fuse_embeddings(fields, fused_weights)
+        return fields
+
+    def create_field_indexes(self, fused_weights=None):
+        """Construit un index par champ (titre, résumé et, si demandé, vecteur fusionné)."""
+        print("Vectorisation des titres et des résumés...")
+        fields = self.encode_fields(self.articles, fused_weights=fused_weights)
+        dim = fields['abstract'].shape[1]
+        self.field_indexes = {}
+        for field, embeddings in fields.items():
+            self.field_indexes[field] = new_index(dim, self.index_type)
+            add_to_index(self.field_indexes[field], embeddings)
+        self.index = self.field_indexes['abstract']
+        print(f"✅ Index FAISS créés ({', '.join(self.field_indexes)}) avec {self.index.ntotal} vecteurs.")
+
+    def build_lexical_index(self):
+        """Construit l'index BM25 (titres + résumés) des articles chargés."""
+        print("Construction de l'index lexical BM25...")
+        builder = BM25Builder()
+        builder.add_documents(self.articles)
+        self.lexical_index = builder.build()
+        print(f"✅ Index BM25 créé: {len(self.lexical_index.terms)} termes, {len(self.lexical_index)} documents.")
+
+    def create_index_streaming(self, json_path, metadata_path='arxiv_metadata.json',
+                               chunk_size=2048, num_workers=None, multi_field=False,
+                               fused_weights=None, lexical=False):
+        """Vectorise le corpus par blocs de taille fixe et les ajoute à l'index au fil de l'eau.
+
+        Les articles sont lus paresseusement (voir iter_articles), chaque bloc est
+        encodé par un pool multi-processus CPU de sentence-transformers puis ajouté
+        à l'index. Les métadonnées sont écrites dans metadata_path au même rythme,
+        si bien que la mémoire utilisée reste bornée par la taille d'un bloc.
+
+        Avec multi_field=True, titres et résumés de chaque bloc sont encodés
+        ensemble et alimentent un index par champ (voir encode_fields).
+        Avec lexical=True, l'index BM25 est alimenté au même rythme.
+        """
+        num_workers = num_workers or os.cpu_count() or 1
+        dim = self.model.get_sentence_embedding_dimension()
+        fields = ['abstract']
+        if multi_field:
+            fields = list(FIELDS) + (['fused'] if fused_weights else [])
+        self.field_indexes = {field: new_index(dim, self.index_type) for field in fields}
+        self.index = self.field_indexes['abstract']
+        self.embeddings = None
+        self.articles = []
+        self.article_ids = []
+        lexical_builder = BM25Builder() if lexical else None
+
+        pool = None
+        if num_workers > 1:
+            print(f"🚀 Démarrage du pool de vectorisation ({num_workers} processus CPU)...")
+            pool = self.model.start_multi_process_pool(target_devices=['cpu'] * num_workers)
+
+        try:
+            with open(metadata_path, 'w', encoding='utf-8') as meta_file:
+                meta_file.write('[\n')
+                first = True
+                if pool is not None:
+                    def encode(texts):
+                        return self.model.encode_multi_process(
+                            texts, pool, chunk_size=max(1, len(texts) // num_workers)
+                        )
+                else:
+                    encode = self.model.encode
+
+                for chunk in iter_chunks(iter_articles(json_path), chunk_size):
+                    if multi_field:
+                        vectors = self.encode_fields(chunk, encode, fused_weights)
+                    else:
+                        vectors = {'abstract': encode([a['abstract'] for a in chunk])}
+                    for field, embeddings in vectors.items():
+                        add_to_index(self.field_indexes[field], embeddings)
+                    if lexical_builder is not None:
+                        lexical_builder.add_documents(chunk)
+
+                    for article in chunk:
+                        if not first:
+                            meta_file.write(',\n')
+                        json.dump(article, meta_file, indent=2, ensure_ascii=False)
+                        first = False
+                        self.article_ids.append(article['arxiv_id'])
+
+                    print(f"   … {self.index.ntotal} vecteurs indexés")
+                meta_file.write('\n]\n')
+        finally:
+            if pool is not None:
+                self.model.stop_multi_process_pool(pool)
+
+        if lexical_builder is not None:
+            self.lexical_index = lexical_builder.build()
 
         print(f"✅ Index FAISS créé avec {self.index.ntotal} vecteurs.")
 
     def save_index(self, path='arxiv_index.faiss'):
         faiss.write_index(self.index, path)
         print(f"Index sauvegardé dans {path}")
+        for field, index in self.field_indexes.items():
+            if field != 'abstract':
+                faiss.write_index(index, field_index_path(path, field))
+                print(f"Index '{field}' sauvegardé dans {field_index_path(path, field)}")
 
     def save_metadata(self, path='arxiv_metadata.json'):
         with open(path, 'w', encoding='utf-8') as f:
             json.dump(self.articles, f, indent=2, ensure_ascii=False)
         print(f"Métadonnées sauvegardées dans {path}")
 
-    def index_from_json(self, json_path):
+    def publish(self, index_path='arxiv_index.faiss', metadata_path='arxiv_metadata.json',
+                written_metadata=None):
+        """Publie index, métadonnées et manifeste sans jamais exposer un couple incomplet.
+
+        Les fichiers sont écrits sous des noms propres à la construction (voir
+        build_paths) et synchronisés sur disque, puis le manifeste qui les désigne
+        remplace atomiquement l'ancien (os.replace) : c'est le seul point de bascule,
+        un lecteur voit l'ancienne construction ou la nouvelle, jamais un mélange.
+        Les fichiers des constructions plus anciennes que la précédente sont
+        ensuite supprimés (la précédente peut encore être en cours de lecture) ; un
+        lecteur qui ouvre une construction supprimée reçoit BuildUnavailableError et
+        repart du manifeste publié (voir read_index_pair, EnhancedArticleSearcher).
+        written_metadata désigne un fichier de métadonnées déjà écrit (mode streaming).
+        """
+        build_id = uuid.uuid4().hex
+        build_index, build_metadata = build_paths(index_path, metadata_path, build_id)
+        previous = load_manifest(index_path)
+
+        index_files = {}
+        for field, index in self.field_indexes.items():
+            path = field_index_path(build_index, field)
+            faiss.write_index(index, path)
+            _fsync(path)
+            index_files[field] = {'path': os.path.basename(path), 'size': os.path.getsize(path)}
+
+        lexical_info = None
+        if self.lexical_index is not None:
+            path = lexical_index_path(build_index)
+            self.lexical_index.save(path)
+            _fsync(path)
+            lexical_info = {'path': os.path.basename(path), 'size': os.path.getsize(path)}
+
+        if written_metadata is None:
+            with open(build_metadata, 'w', encoding='utf-8') as f:
+                json.dump(self.articles, f, indent=2, ensure_ascii=False)
+        else:
+            os.replace(written_metadata, build_metadata)
+        _fsync(build_metadata)
+
+        manifest = {
+            'model_name': self.model_name,
+            'dimension': self.index.d,
+            'vector_count': self.index.ntotal,
+            'index_type': self.index_type,
+            'index_files': index_files,
+            'lexical_index': lexical_info,
+            'metadata': {
+                'path': os.path.basename(build_metadata),
+                'size': os.path.getsize(build_metadata),
+                'sha256': file_sha256(build_metadata),
+            },
+            'build_time': datetime.now().isoformat(),
+            'build_id': build_id,
+        }
+        final_manifest = manifest_path(index_path)
+        tmp_manifest = f"{final_manifest}.tmp-{os.getpid()}"
+        with open(tmp_manifest, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_manifest, final_manifest)
+
+        keep = {build_id} | ({previous['build_id']} if previous else set())
+        remove_old_builds(index_path, metadata_path, keep)
+        print(f"📦 Construction {build_id} publiée : {build_index}, {build_metadata} "
+              f"(manifeste {final_manifest})")
+        return manifest
+
+    def index_from_json(self, json_path, multi_field=False, fused_weights=None,
+                        index_path='arxiv_index.faiss', metadata_path='arxiv_metadata.json',
+                        lexical=False):
         abstracts = self.load_articles(json_path)
-        self.create_index(abstracts)
-        self.save_index()
-        self.save_metadata()
+        if multi_field:
+            self.create_field_indexes(fused_weights)
+        else:
+            self.create_index(abstracts)
+        if lexical:
+            self.build_lexical_index()
+        self.publish(index_path, metadata_path)
+
+    def index_from_json_streaming(self, json_path, chunk_size=2048, num_workers=None,
+                                  index_path='arxiv_index.faiss', metadata_path='arxiv_metadata.json',
+                                  multi_field=False, fused_weights=None, lexical=False):
+        metadata_tmp = f"{metadata_path}.tmp-{os.getpid()}"
+        self.create_index_streaming(json_path, metadata_path=metadata_tmp,
+                                    chunk_size=chunk_size, num_workers=num_workers,
+                                    multi_field=multi_field, fused_weights=fused_weights,
+                                    lexical=lexical)
+        self.publish(index_path, metadata_path, written_metadata=metadata_tmp)
 
     def load_index(self, index_path='arxiv_index.faiss', metadata_path='arxiv_metadata.json'):
         print("Chargement de l'index FAISS et des métadonnées...")
-        self.index = faiss.read_index(index_path)
-
-        with open(metadata_path, 'r', encoding='utf-8') as f:
-            self.articles = json.load(f)
+        self.index, self.articles, _ = read_index_pair(index_path, metadata_path, self.model_name)
         self.article_ids = [a['arxiv_id'] for a in self.articles]
 
         print(f"Index chargé avec {self.index.ntotal} vecteurs.")
@@ -57,16 +557,11 @@ class SemanticIndexer:
 # La fonction de recherche sémantique reste en dehors de la classe
 def semantic_search(query, index_path='arxiv_index.faiss', metadata_path='arxiv_metadata.json', model_name='all-MiniLM-L6-v2', top_k=5):
     from sentence_transformers import SentenceTransformer
-    import faiss
     import numpy as np
-    import json
 
     print("Chargement du modèle et de l’index...")
     model = SentenceTransformer(model_name)
-    index = faiss.read_index(index_path)
-
-    with open(metadata_path, 'r', encoding='utf-8') as f:
-        articles = json.load(f)
+    index, articles, _ = read_index_pair(index_path, metadata_path, model_name)
 
     query_embedding = model.encode([query])
     D, I = index.search(np.array(query_embedding), top_k)
@@ -76,3 +571,263 @@ def semantic_search(query, index_path='arxiv_index.faiss', metadata_path='arxiv_
         article = articles[idx]
         print(f"{rank + 1}. {article['title']}")
         print(f"Résumé : {article['abstract'][:300]}...\n")
+
+
+# --- Index partitionné (shards) ---
+
+SHARDS_MANIFEST = 'shards.json'
+
+
+def shard_key(article, by='primary_category', num_shards=None):
+    """Retourne le nom du shard d'un article.
+
+    by='primary_category' : un shard par catégorie principale (ex. cs.LG)
+    by='year'             : un shard par année de publication
+    by='hash'             : num_shards shards répartis par hachage de l'arxiv_id
+    """
+    if by == 'primary_category':
+        categories = article.get('categories') or [None]
+        return article.get('primary_category') or categories[0] or 'unknown'
+    if by == 'year':
+        year = (article.get('published_date') or '')[:4]
+        return year if year.isdigit() else 'unknown'
+    if by == 'hash':
+        if not num_shards:
+            raise ValueError("num_shards est requis pour un partitionnement par hachage")
+        return f"shard_{zlib.crc32(article['arxiv_id'].encode('utf-8')) % num_shards:03d}"
+    raise ValueError(f"Partitionnement non supporté: {by}")
+
+
+def partition_articles(json_path, by='primary_category', num_shards=None):
+    """Répartit les articles du fichier d'extraction par shard."""
+    shards = defaultdict(list)
+    for article in iter_articles(json_path):
+        shards[shard_key(article, by, num_shards)].append(article)
+    return shards
+
+
+_shard_worker_indexer = None
+
+
+def _init_shard_worker(model_name, index_type):
+    """Charge le modèle une seule fois par processus de construction."""
+    global _shard_worker_indexer
+    _shard_worker_indexer = SemanticIndexer(model_name, index_type=index_type)
+
+
+def _build_shard(shard_name, articles, shard_dir):
+    """Construit et sauvegarde l'index et les métadonnées d'un shard (exécuté dans un worker)."""
+    indexer = _shard_worker_indexer
+    indexer.articles = articles
+    indexer.article_ids = [a['arxiv_id'] for a in articles]
+    indexer.create_index([a['abstract'] for a in articles])
+    indexer.publish(os.path.join(shard_dir, f"{shard_name}.faiss"),
+                    os.path.join(shard_dir, f"{shard_name}.json"))
+    return shard_name, indexer.index.ntotal
+
+
+def build_shards(json_path, shard_dir='shards', by='primary_category', num_shards=None,
+                 model_name='all-MiniLM-L6-v2', max_workers=None, only=None, index_type='flat'):
+    """Partitionne le corpus et construit un index FAISS par shard, en parallèle.
+
+    only permet de ne reconstruire qu'une partie des shards ; les autres entrées
+    du manifeste existant sont conservées telles quelles.
+    """
+    os.makedirs(shard_dir, exist_ok=True)
+    shards = partition_articles(json_path, by, num_shards)
+    if only is not None:
+        missing = set(only) - set(shards)
+        if missing:
+            raise ValueError(f"Shards inconnus: {', '.join(sorted(missing))}")
+        shards = {name: shards[name] for name in only}
+
+    manifest_path = os.path.join(shard_dir, SHARDS_MANIFEST)
+    manifest = {'model_name': model_name, 'by': by, 'num_shards': num_shards,
+                'index_type': index_type, 'shards': {}}
+    if only is not None and os.path.exists(manifest_path):
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('by') != by:
+            raise ValueError(f"Le manifeste existant est partitionné par {manifest.get('by')}, pas {by}")
+
+    print(f"🧩 Construction de {len(shards)} shard(s) par {by}...")
+    max_workers = max_workers or min(len(shards), os.cpu_count() or 1) or 1
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_shard_worker,
+                             initargs=(model_name, index_type)) as executor:
+        futures = [executor.submit(_build_shard, name, articles, shard_dir)
+                   for name, articles in shards.items()]
+        for future in futures:
+            name, count = future.result()
+            manifest['shards'][name] = {
+                'index': f"{name}.faiss",
+                'metadata': f"{name}.json",
+                'count': count,
+            }
+
+    with open(manifest_path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    os.replace(manifest_path + '.tmp', manifest_path)
+    print(f"✅ {len(manifest['shards'])} shard(s) référencés dans {manifest_path}")
+    return manifest
+
+
+def rebuild_shard(json_path, shard_name, shard_dir='shards', **kwargs):
+    """Reconstruit un seul shard sans toucher aux autres."""
+    with open(os.path.join(shard_dir, SHARDS_MANIFEST), 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    kwargs.setdefault('by', manifest['by'])
+    kwargs.setdefault('num_shards', manifest.get('num_shards'))
+    kwargs.setdefault('model_name', manifest['model_name'])
+    kwargs.setdefault('index_type', manifest.get('index_type', 'flat'))
+    return build_shards(json_path, shard_dir=shard_dir, only=[shard_name], **kwargs)
+
+
+class ShardedSearcher:
+    """Façade de recherche sur un index partitionné.
+
+    La requête est vectorisée une seule fois, puis chaque shard concerné est
+    interrogé en parallèle (FAISS libère le GIL) et les top-k partiels sont
+    fusionnés avec un tas. Un filtre catégorie ou année qui ne correspond pas
+    au critère de partitionnement est appliqué dans chaque shard (IDSelector).
+
+    Le filtre catégorie porte sur toutes les catégories d'un article, quel que
+    soit le partitionnement : avec by='primary_category', les articles listés
+    dans une catégorie qui n'est pas leur catégorie principale sont trouvés dans
+    les autres shards. check_for_update relit shards.json et recharge les shards
+    reconstruits (rebuild_shard) sans redémarrer.
+    """
+
+    def __init__(self, shard_dir='shards', model_name=None, max_workers=None):
+        self.shard_dir = shard_dir
+        self.manifest = self._read_manifest()
+        from sentence_transformers import SentenceTransformer
+        self.model = SentenceTransformer(model_name or self.manifest['model_name'])
+        # Recherches en lecture, remplacement des shards en écriture
+        self._lock = ReadWriteLock()
+        self.shards = {}
+        self.shard_fields = {}
+        self.shard_categories = {}
+        self.shard_builds = {}
+        for name in self.manifest['shards']:
+            self.load_shard(name)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers or os.cpu_count())
+        print(f"✅ {len(self.shards)} shard(s) chargés depuis {shard_dir}")
+
+    def _read_manifest(self):
+        with open(os.path.join(self.shard_dir, SHARDS_MANIFEST), 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _read_shard(self, name, shards_manifest):
+        """Lit l'index et les métadonnées d'un shard, sans les installer."""
+        info = shards_manifest['shards'][name]
+        index, articles, manifest = read_index_pair(os.path.join(self.shard_dir, info['index']),
+                                                    os.path.join(self.shard_dir, info['metadata']),
+                                                    self.manifest['model_name'])
+        # Années et catégories des articles, pour les filtres que les shards n'isolent pas
+        categories = [set(a.get('categories') or ()) | {a.get('primary_category')} for a in articles]
+        fields = (np.array([(a.get('published_date') or '')[:4] for a in articles]), categories)
+        return (index, articles), fields, set().union(*categories), (manifest or {}).get('build_id'), info
+
+    def _install_shard(self, name, loaded):
+        self.shards[name], self.shard_fields[name], self.shard_categories[name], build_id, info = loaded
+        self.shard_builds[name] = (build_id, info)
+
+    def load_shard(self, name):
+        """(Re)charge un shard, par exemple après rebuild_shard."""
+        loaded = self._read_shard(name, self.manifest)
+        with self._lock.write():
+            self._install_shard(name, loaded)
+
+    def check_for_update(self):
+        """Relit shards.json et recharge les shards ajoutés ou reconstruits depuis leur chargement.
+
+        Les nouveaux shards sont lus sans bloquer les recherches, puis installés
+        d'un bloc avec le manifeste ; les shards retirés du manifeste sont oubliés.
+        Retourne True si quelque chose a changé.
+        """
+        manifest = self._read_manifest()
+        loaded = {}
+        for name, info in manifest['shards'].items():
+            shard_manifest = load_manifest(os.path.join(self.shard_dir, info['index']))
+            build_id = shard_manifest['build_id'] if shard_manifest else None
+            if self.shard_builds.get(name) != (build_id, info):
+                loaded[name] = self._read_shard(name, manifest)
+        removed = set(self.shards) - set(manifest['shards'])
+        if not loaded and not removed and manifest == self.manifest:
+            return False
+
+        with self._lock.write():
+            self.manifest = manifest
+            for name, shard in loaded.items():
+                self._install_shard(name, shard)
+            for name in removed:
+                for shard_map in (self.shards, self.shard_fields, self.shard_categories, self.shard_builds):
+                    del shard_map[name]
+        print(f"🔄 Shards rechargés: {', '.join(sorted(loaded)) or '-'}"
+              f"{' ; retirés: ' + ', '.join(sorted(removed)) if removed else ''}")
+        return True
+
+    def select_shards(self, categories=None, years=None):
+        """Retourne les shards à interroger pour un filtre catégorie/année donné.
+
+        Avec by='year', seuls les shards des années demandées sont gardés. Un filtre
+        catégorie garde les shards contenant au moins un article de ces catégories
+        (principale ou non) ; les articles eux-mêmes sont filtrés par shard_mask.
+        """
+        names = list(self.shards)
+        if self.manifest['by'] == 'year' and years:
+            names = [name for name in names if name in {str(y) for y in years}]
+        if categories:
+            wanted = set(categories)
+            names = [name for name in names if not wanted.isdisjoint(self.shard_categories[name])]
+        return names
+
+    def shard_mask(self, name, categories=None, years=None):
+        """Masque des articles d'un shard respectant les filtres que select_shards
+        n'applique pas (None si la sélection des shards suffit)."""
+        by = self.manifest['by']
+        if by == 'primary_category' and categories and name in categories:
+            # Catégorie principale de tous les articles du shard
+            categories = None
+        years = None if by == 'year' else years
+        if not categories and not years:
+            return None
+        article_years, article_categories = self.shard_fields[name]
+        mask = np.ones(len(article_years), dtype=bool)
+        if years:
+            mask &= np.isin(article_years, [str(y) for y in years])
+        if categories:
+            wanted = set(categories)
+            mask &= np.fromiter((not wanted.isdisjoint(c) for c in article_categories),
+                                dtype=bool, count=len(article_categories))
+        return mask
+
+    def _search_shard(self, name, query_embedding, top_k, mask=None):
+        index, articles = self.shards[name]
+        k = min(top_k, index.ntotal)
+        if mask is None:
+            distances, indices = index.search(query_embedding, k)
+        elif not mask.any():
+            return []
+        else:
+            bitmap = np.packbits(mask, bitorder='little')
+            try:
+                params = faiss.SearchParameters(sel=faiss.IDSelectorBitmap(len(mask), faiss.swig_ptr(bitmap)))
+                distances, indices = index.search(query_embedding, k, params=params)
+            except (AttributeError, RuntimeError, TypeError):
+                # Index sans sélecteur : tout le shard est classé puis filtré
+                distances, indices = index.search(query_embedding, index.ntotal)
+                keep = (indices[0] >= 0) & mask[np.clip(indices[0], 0, None)]
+                distances, indices = distances[:, keep][:, :k], indices[:, keep][:, :k]
+        return [(float(d), name, int(i)) for d, i in zip(distances[0], indices[0]) if i >= 0]
+
+    def search(self, query, top_k=5, categories=None, years=None):
+        query_embedding = np.asarray(self.model.encode([query]), dtype='float32')
+        with self._lock.read():
+            names = self.select_shards(categories, years)
+            futures = [self.executor.submit(self._search_shard, name, query_embedding, top_k,
+                                            self.shard_mask(name, categories, years))
+                       for name in names]
+            best = heapq.nsmallest(top_k, (hit for future in futures for hit in future.result()))
+            return [{'article': self.shards[name][1][idx], 'distance': dist, 'shard': name}
+                    for dist, name, idx in best]
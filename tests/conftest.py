@@ -0,0 +1,94 @@
+import hashlib
+import json
+import os
+import sys
+import types
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+DIMENSION = 32
+WORDS = ['graph', 'bert', 'transformer', 'bayesian', 'optimization', 'convolution', 'reinforcement',
+         'attention', 'model', 'language', 'learning', 'resnet', 'vision', 'neural', 'network', 'quantum']
+CATEGORIES = ['cs.LG', 'cs.CL', 'cs.CV', 'cs.AI']
+
+
+class FakeSentenceTransformer:
+    """Encodeur déterministe : sac de mots haché sur DIMENSION composantes, normalisé."""
+
+    def __init__(self, name='fake', **kwargs):
+        self.name = name
+
+    def get_sentence_embedding_dimension(self):
+        return DIMENSION
+
+    def encode(self, texts, **kwargs):
+        single = isinstance(texts, str)
+        vectors = []
+        for text in [texts] if single else texts:
+            vector = np.zeros(DIMENSION, dtype='float32')
+            for word in str(text).lower().split():
+                vector[int(hashlib.md5(word.encode()).hexdigest(), 16) % DIMENSION] += 1
+            norm = np.linalg.norm(vector)
+            vectors.append(vector / norm if norm else vector)
+        vectors = np.array(vectors, dtype='float32')
+        return vectors[0] if single else vectors
+
+
+class FakeCrossEncoder:
+    """Score = nombre de mots communs à la requête et au document ; garde les requêtes reçues."""
+
+    def __init__(self, name='fake', **kwargs):
+        self.queries = []
+
+    def predict(self, pairs, **kwargs):
+        self.queries.extend(query for query, _ in pairs)
+        return np.array([len(set(q.lower().split()) & set(d.lower().split())) for q, d in pairs],
+                        dtype='float32')
+
+
+@pytest.fixture(autouse=True)
+def fake_models(monkeypatch):
+    """Remplace sentence_transformers : aucun modèle n'est téléchargé pendant les tests."""
+    module = types.ModuleType('sentence_transformers')
+    module.SentenceTransformer = FakeSentenceTransformer
+    module.CrossEncoder = FakeCrossEncoder
+    monkeypatch.setitem(sys.modules, 'sentence_transformers', module)
+    return module
+
+
+def make_articles(count, start=0, seed=0):
+    rng = np.random.default_rng(seed)
+    articles = []
+    for i in range(start, start + count):
+        categories = list(rng.choice(CATEGORIES, size=rng.integers(1, 3), replace=False))
+        articles.append({
+            'arxiv_id': f"{i:04d}",
+            'title': ' '.join(rng.choice(WORDS, 4)).title(),
+            'abstract': ' '.join(rng.choice(WORDS, 30)),
+            'authors': [{'name': f"Author{j} Name{j}"} for j in rng.choice(40, 2, replace=False)],
+            'categories': categories,
+            'primary_category': categories[0],
+            'published_date': f"{2015 + i % 8}-01-01",
+        })
+    return articles
+
+
+@pytest.fixture
+def publish(tmp_path):
+    """publish(articles) construit et publie un index dans tmp_path ; retourne (index_path, metadata_path, manifeste)."""
+    from semantic_indexer import SemanticIndexer, load_manifest
+
+    index_path = str(tmp_path / 'arxiv_index.faiss')
+    metadata_path = str(tmp_path / 'arxiv_metadata.json')
+
+    def _publish(articles, lexical=True):
+        corpus = tmp_path / 'corpus.json'
+        corpus.write_text(json.dumps({'articles': articles}), encoding='utf-8')
+        SemanticIndexer().index_from_json(str(corpus), lexical=lexical,
+                                          index_path=index_path, metadata_path=metadata_path)
+        return index_path, metadata_path, load_manifest(index_path)
+
+    return _publish
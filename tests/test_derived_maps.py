@@ -0,0 +1,43 @@
+import numpy as np
+
+from author_index import FuzzyAuthorIndex, pack_fuzzy_index
+from derived_maps import (MappedStrings, SortedStringMap, load_derived_maps, pack_strings, save_derived_maps,
+                          unpack_strings)
+
+NAMES = ['yann lecun', 'geoffrey hinton', 'yoshua bengio', 'zoe lecun', 'eric moulines', 'lecun', 'jürgen schmidhuber']
+
+
+def mapped(tmp_path, arrays):
+    """Écrit puis relit les tableaux en memory-map, comme au chargement d'une construction."""
+    path = str(tmp_path / 'derived')
+    save_derived_maps(path, 'build', arrays, {})
+    loaded, _ = load_derived_maps(path, 'build')
+    assert all(isinstance(array, np.memmap) for array in loaded.values())
+    return loaded
+
+
+def test_mapped_strings_lookup_and_substring_search(tmp_path):
+    names = unpack_strings(mapped(tmp_path, pack_strings('names', NAMES)), 'names')
+    assert isinstance(names, MappedStrings)
+    assert list(names) == NAMES and names[-1] == 'jürgen schmidhuber'
+
+    order = np.array(sorted(range(len(NAMES)), key=NAMES.__getitem__))
+    ids = SortedStringMap(names, order)
+    assert all(ids[name] == i for i, name in enumerate(NAMES))
+    assert 'lecu' not in ids and ids.get('zz') is None and ids.get(None) is None
+    assert sorted(ids) == sorted(NAMES)
+
+    assert names.find_containing('lecun') == [0, 3, 5]
+    assert names.find_containing('ürgen') == [6]
+    assert names.find_containing('n\ny') == []
+
+
+def test_fuzzy_index_from_arrays_matches_in_memory_index(tmp_path):
+    in_memory = FuzzyAuthorIndex(NAMES)
+    arrays = mapped(tmp_path, pack_fuzzy_index(NAMES))
+    packed = FuzzyAuthorIndex.from_arrays(arrays)
+
+    for query in ('yan lecun', 'hinton', 'schmidhuber', 'bengio y'):
+        assert packed.similar(query, min_score=0.3) == in_memory.similar(query, min_score=0.3)
+    assert packed.same_last_name('yann lecun') == in_memory.same_last_name('yann lecun')
+    assert packed.name_ids['zoe lecun'] == 3
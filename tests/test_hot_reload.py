@@ -0,0 +1,61 @@
+import threading
+
+import pytest
+
+from chatbot import EnhancedArticleSearcher
+from conftest import make_articles
+from semantic_indexer import BuildUnavailableError, read_build
+
+
+def test_lazy_searcher_recovers_when_its_build_was_pruned(publish):
+    index_path, metadata_path, first = publish(make_articles(60))
+    # Le premier démarrage calcule et sauvegarde les tables dérivées ; le second reste paresseux
+    EnhancedArticleSearcher(index_path, metadata_path)
+    searcher = EnhancedArticleSearcher(index_path, metadata_path)
+    assert searcher._index is None
+
+    # Deux publications : la construction validée au démarrage est supprimée du disque
+    publish(make_articles(80))
+    _, _, latest = publish(make_articles(90))
+    with pytest.raises(BuildUnavailableError):
+        read_build(index_path, metadata_path, first)
+
+    response = searcher.search('graph neural network', top_k=3)
+    assert len(response['results']) == 3
+    assert searcher.manifest['build_id'] == latest['build_id']
+    assert len(searcher.metadata) == 90
+    assert searcher.generation == 1
+
+
+def test_check_for_update_under_concurrent_readers(publish):
+    index_path, metadata_path, _ = publish(make_articles(60))
+    searcher = EnhancedArticleSearcher(index_path, metadata_path, cache_size=0, max_concurrent_requests=4)
+    searcher.search('graph', top_k=5)
+    errors = []
+    stop = threading.Event()
+
+    def reader():
+        while not stop.is_set():
+            try:
+                ids = [r['article']['arxiv_id'] for r in searcher.search('bert transformer attention', top_k=5)['results']]
+                # Une réponse ne mélange jamais deux constructions (identifiants 00xx puis 01xx)
+                assert len(ids) == 5 and len({i[:2] for i in ids}) == 1
+            except Exception as e:
+                errors.append(e)
+
+    threads = [threading.Thread(target=reader) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    try:
+        _, _, manifest = publish(make_articles(75, start=100))
+        assert searcher.check_for_update()
+        assert not searcher.check_for_update()
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+    assert errors == []
+    assert searcher.manifest['build_id'] == manifest['build_id']
+    assert len(searcher.metadata) == 75
+    assert searcher._state_lock.readers == 0
@@ -0,0 +1,67 @@
+import os
+
+import pytest
+
+import semantic_indexer
+from conftest import make_articles
+from semantic_indexer import (IndexIntegrityError, load_manifest, manifest_files, read_build, read_index_pair,
+                              validate_manifest)
+
+
+def build_files(manifest, index_path, metadata_path):
+    files = manifest_files(index_path, metadata_path, manifest)
+    return list(files['index_files'].values()) + [files['lexical_index'], files['metadata']]
+
+
+def test_publish_writes_build_specific_files_named_by_manifest(publish):
+    index_path, metadata_path, manifest = publish(make_articles(30))
+    assert load_manifest(index_path) == manifest
+    for path in build_files(manifest, index_path, metadata_path):
+        assert manifest['build_id'] in os.path.basename(path)
+        assert os.path.exists(path)
+    # Les noms historiques ne sont plus écrits
+    assert not os.path.exists(index_path) and not os.path.exists(metadata_path)
+
+    index, articles, loaded = read_index_pair(index_path, metadata_path)
+    assert index.ntotal == len(articles) == 30
+    assert loaded['build_id'] == manifest['build_id']
+
+
+def test_publish_keeps_current_and_previous_builds_only(publish):
+    index_path, metadata_path, first = publish(make_articles(30))
+    _, _, second = publish(make_articles(40))
+    assert all(os.path.exists(p) for p in build_files(first, index_path, metadata_path))
+
+    _, _, third = publish(make_articles(50))
+    assert not any(os.path.exists(p) for p in build_files(first, index_path, metadata_path))
+    for manifest in (second, third):
+        assert all(os.path.exists(p) for p in build_files(manifest, index_path, metadata_path))
+    with pytest.raises(IndexIntegrityError):
+        read_build(index_path, metadata_path, first)
+
+
+def test_read_index_pair_retries_when_build_pruned_during_read(publish, monkeypatch):
+    index_path, metadata_path, first = publish(make_articles(30))
+    publish(make_articles(40))
+    _, _, latest = publish(make_articles(50))
+
+    # Premier essai : le manifeste lu désigne une construction supprimée depuis
+    calls = []
+
+    def validate(*args, **kwargs):
+        calls.append(1)
+        return first if len(calls) == 1 else validate_manifest(*args, **kwargs)
+
+    monkeypatch.setattr(semantic_indexer, 'validate_manifest', validate)
+    index, articles, manifest = read_index_pair(index_path, metadata_path, retry_delay=0)
+    assert len(calls) == 2
+    assert manifest['build_id'] == latest['build_id']
+    assert index.ntotal == len(articles) == 50
+
+
+def test_validate_manifest_detects_size_mismatch(publish):
+    index_path, metadata_path, manifest = publish(make_articles(30))
+    with open(manifest_files(index_path, metadata_path, manifest)['metadata'], 'a', encoding='utf-8') as f:
+        f.write(' ')
+    with pytest.raises(IndexIntegrityError):
+        validate_manifest(index_path, metadata_path)
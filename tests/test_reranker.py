@@ -0,0 +1,55 @@
+import threading
+
+from chatbot import EnhancedArticleSearcher
+from conftest import make_articles
+from reranker import CrossEncoderReranker
+
+ARTICLES = [{'arxiv_id': f"{i:04d}", 'title': f"Graph model {i}", 'abstract': 'graph neural network'}
+            for i in range(10)]
+
+
+def test_batches_over_budget_are_skipped_then_reprobed():
+    reranker = CrossEncoderReranker('fake', top_n=5, latency_budget=0.01, reprobe_every=3)
+    reranker.seconds_per_pair = 1.0
+
+    for _ in range(3):
+        assert reranker.score_many(['graph'], [ARTICLES]) == [None]
+    assert reranker.stats()['skipped'] == 3 and reranker.stats()['batches'] == 0
+
+    # Après reprobe_every lots sautés, le suivant est calculé et l'estimation remplacée
+    scores = reranker.score_many(['graph'], [ARTICLES])
+    assert len(scores[0]) == 5
+    assert reranker.stats()['batches'] == 1
+    assert reranker.seconds_per_pair < 1.0
+
+    # Paires en cache : rien à calculer, donc jamais sautées
+    reranker.seconds_per_pair = 1.0
+    assert len(reranker.score_many(['graph'], [ARTICLES])[0]) == 5
+    assert reranker.stats()['skipped'] == 3
+
+
+def test_counters_under_concurrent_requests():
+    reranker = CrossEncoderReranker('fake', top_n=5, latency_budget=10.0, cache_size=0)
+    calls_per_thread = 50
+
+    def worker(n):
+        for i in range(calls_per_thread):
+            reranker.score_many([f"graph {n} {i}"], [ARTICLES])
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stats = reranker.stats()
+    assert stats['batches'] + stats['skipped'] == 8 * calls_per_thread
+
+
+def test_cross_encoder_receives_the_original_query(publish):
+    index_path, metadata_path, _ = publish(make_articles(40))
+    searcher = EnhancedArticleSearcher(index_path, metadata_path, reranker_model='fake', rerank_budget=10.0)
+    searcher.reranker.model.queries.clear()
+
+    response = searcher.search('Graph  Attention Réseau', top_k=3)
+    assert response['reranked'] is True
+    assert set(searcher.reranker.model.queries) == {'Graph Attention Réseau'}
@@ -0,0 +1,54 @@
+import json
+
+import pytest
+
+from conftest import make_articles
+from semantic_indexer import ShardedSearcher, build_shards, rebuild_shard
+
+ARTICLES = make_articles(80)
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    path = tmp_path / 'corpus.json'
+    path.write_text(json.dumps({'articles': ARTICLES}), encoding='utf-8')
+    return str(path)
+
+
+def shard_searcher(corpus, tmp_path, by, num_shards=None):
+    shard_dir = str(tmp_path / f'shards_{by}')
+    build_shards(corpus, shard_dir=shard_dir, by=by, num_shards=num_shards, model_name='fake', max_workers=1)
+    return ShardedSearcher(shard_dir, max_workers=2)
+
+
+def ids(results):
+    return {r['article']['arxiv_id'] for r in results}
+
+
+@pytest.mark.parametrize('by,num_shards', [('primary_category', None), ('year', None), ('hash', 3)])
+def test_category_filter_matches_any_listed_category(corpus, tmp_path, by, num_shards):
+    searcher = shard_searcher(corpus, tmp_path, by, num_shards)
+    cross_listed = {a['arxiv_id'] for a in ARTICLES if 'cs.CL' in a['categories'] and a['primary_category'] != 'cs.CL'}
+    assert cross_listed
+
+    results = searcher.search('language model', top_k=len(ARTICLES), categories=['cs.CL'])
+    assert ids(results) == {a['arxiv_id'] for a in ARTICLES if 'cs.CL' in a['categories']}
+
+    results = searcher.search('language model', top_k=len(ARTICLES), categories=['cs.CL'], years=[2016, 2019])
+    assert ids(results) == {a['arxiv_id'] for a in ARTICLES
+                            if 'cs.CL' in a['categories'] and a['published_date'][:4] in ('2016', '2019')}
+
+
+def test_check_for_update_picks_up_rebuilt_shard(corpus, tmp_path):
+    searcher = shard_searcher(corpus, tmp_path, 'primary_category')
+    assert searcher.check_for_update() is False
+
+    added = dict(make_articles(1, start=500)[0], categories=['cs.LG'], primary_category='cs.LG')
+    with open(corpus, 'w', encoding='utf-8') as f:
+        json.dump({'articles': ARTICLES + [added]}, f)
+    rebuild_shard(corpus, 'cs.LG', shard_dir=searcher.shard_dir, max_workers=1)
+
+    assert '0500' not in ids(searcher.search('graph', top_k=len(ARTICLES) + 1))
+    assert searcher.check_for_update() is True
+    assert '0500' in ids(searcher.search('graph', top_k=len(ARTICLES) + 1, categories=['cs.LG']))
+    assert searcher.check_for_update() is False